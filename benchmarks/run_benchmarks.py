@@ -0,0 +1,355 @@
+# run_benchmarks.py
+"""
+Benchmark suite for planning, creation and previews.
+
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --shots 10,100 --areas plan_hardcoded,render_nk
+    python benchmarks/run_benchmarks.py --compare old.json --output new.json
+
+Every area runs at each shot count in a fresh temp directory (on tmpfs
+when /dev/shm is available). Results are written as JSON so two runs, for
+example two versions of the app, can be compared with --compare.
+
+The GUI areas need PyQt5; they run on the "offscreen" Qt platform and are
+reported as skipped when PyQt5 is not installed.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from common.nuke_template import compile_nuke_template
+from core.config import FolderConfig, NukeSettings
+from core.executor import execute_plan, DEFAULT_MAX_WORKERS
+from core.planner import plan_hardcoded_structure, plan_template_structure
+from core.scan_cache import ENV_VAR as SCAN_CACHE_ENV_VAR
+from core.scanner import read_template_structure
+from core.writer import DEFAULT_WRITER_WORKERS
+
+DEFAULT_SHOT_COUNTS = [10, 100, 1000, 10000]
+SHOTS_PER_SEQUENCE = 50
+SETTINGS = NukeSettings(24.0, 3840, 2160, "UHD_4K", False, True)
+
+# Folders of the synthetic template used by the replication benchmark
+TEMPLATE_FOLDERS = [
+    "01_plates/[sequence]/[shot]",
+    "02_support/luts",
+    "04_vfx/[sequence]/[shot]/work",
+    "05_comp",
+    "08_output/full_res",
+]
+
+
+def synthetic_shots(count):
+    """
+    `count` shots in sequences of SHOTS_PER_SEQUENCE.
+    """
+    data = []
+    for i in range(0, count, SHOTS_PER_SEQUENCE):
+        n = min(SHOTS_PER_SEQUENCE, count - i)
+        seq = f"SQ{i // SHOTS_PER_SEQUENCE * 10 + 10:04d}"
+        data.append({'sequence': seq, 'shots': [f"sh{(j + 1) * 10:04d}" for j in range(n)]})
+    return data
+
+
+def temp_root(base):
+    return tempfile.mkdtemp(prefix="fs_bench_", dir=base)
+
+
+#
+# Core areas
+#
+def bench_plan_hardcoded(ctx, shots):
+    seq_shots = synthetic_shots(shots)
+    config = FolderConfig()
+
+    def run():
+        plan_hardcoded_structure("show", ctx.tmp, seq_shots, config, SETTINGS)
+    return run, None
+
+
+def bench_create_hardcoded(ctx, shots):
+    seq_shots = synthetic_shots(shots)
+    config = FolderConfig()
+    counter = [0]
+
+    def run():
+        counter[0] += 1
+        dest = temp_root(ctx.tmp)
+        plan = plan_hardcoded_structure(f"show{counter[0]}", dest, seq_shots, config, SETTINGS)
+        report = execute_plan(plan, max_workers=DEFAULT_MAX_WORKERS,
+                              writer_workers=DEFAULT_WRITER_WORKERS)
+        ctx.extra["syscalls"] = report.syscalls.total
+    return run, None
+
+
+def bench_replicate_template(ctx, shots):
+    seq_shots = synthetic_shots(shots)
+    template = os.path.join(ctx.tmp, "template")
+    for rel in TEMPLATE_FOLDERS:
+        os.makedirs(os.path.join(template, rel), exist_ok=True)
+    counter = [0]
+
+    def run():
+        counter[0] += 1
+        dest = temp_root(ctx.tmp)
+        template_paths = read_template_structure(template)
+        plan = plan_template_structure(f"show{counter[0]}", dest, template_paths, seq_shots, SETTINGS)
+        execute_plan(plan, max_workers=DEFAULT_MAX_WORKERS, writer_workers=DEFAULT_WRITER_WORKERS)
+    return run, None
+
+
+def bench_render_nk(ctx, shots):
+    pairs = [(sd['sequence'], sh) for sd in synthetic_shots(shots) for sh in sd['shots']]
+
+    def run():
+        compile_nuke_template.cache_clear()
+        compile_nuke_template(*SETTINGS).render_batch(pairs)
+    return run, None
+
+
+#
+# GUI areas
+#
+def _qt_app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+def _main_window():
+    from main_window import MainWindow
+    return MainWindow()
+
+
+def _fill_sequences(container, seq_shots):
+    # Same as importing a shot list in the panel
+    container.load_sequences(seq_shots, replace=True)
+
+
+def bench_preview_hardcoded(ctx, shots):
+    ctx.app = _qt_app()
+    window = _main_window()
+    tab = window.structure_tab
+    tab.edit_show_name.setText("show")
+    tab.edit_destination.setText(ctx.tmp)
+    seq_shots = synthetic_shots(shots)
+
+    def run():
+        # Plan + lazy model, as in StructureTab.update_preview
+        tab.preview_model.set_plan(tab.build_preview_hardcoded(seq_shots))
+        tab.preview_view.expand(tab.preview_model.index(0, 0))
+        ctx.app.processEvents()
+        ctx.extra["materialized_rows"] = tab.preview_model.materialized_rows()
+    return run, window
+
+
+def _private_scan_cache(ctx):
+    # Scan cache in the temp tree, emptied before every run => cold scans,
+    # and nothing written to the user's own cache
+    cache_path = os.path.join(ctx.tmp, "scan_cache.sqlite3")
+    previous = os.environ.get(SCAN_CACHE_ENV_VAR)
+    os.environ[SCAN_CACHE_ENV_VAR] = cache_path
+
+    def clear():
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(cache_path + suffix)
+            except FileNotFoundError:
+                pass
+
+    def restore():
+        if previous is None:
+            os.environ.pop(SCAN_CACHE_ENV_VAR, None)
+        else:
+            os.environ[SCAN_CACHE_ENV_VAR] = previous
+
+    ctx.before_each.append(clear)
+    ctx.cleanups.append(restore)
+
+
+def bench_populate_existing_tree(ctx, shots):
+    _private_scan_cache(ctx)
+    ctx.app = _qt_app()
+    window = _main_window()
+    tab = window.ensure_tab(2)
+    plan = plan_hardcoded_structure("show", ctx.tmp, synthetic_shots(shots), FolderConfig(), SETTINGS)
+    execute_plan(plan, max_workers=DEFAULT_MAX_WORKERS, writer_workers=DEFAULT_WRITER_WORKERS)
+    project = os.path.join(ctx.tmp, "show")
+
+    def run():
+        # The scan streams in from a worker thread; time it until it is done
+        tab.populate_existing_tree(project)
+        while tab.is_scanning():
+            ctx.app.processEvents()
+            time.sleep(0.001)
+        ctx.app.processEvents()
+    return run, window
+
+
+def bench_preview_keystroke(ctx, shots):
+    ctx.app = _qt_app()
+    window = _main_window()
+    window.ensure_tab(2)
+    window.tab_widget.setCurrentIndex(0)
+    window.structure_tab.edit_show_name.setText("show")
+    window.structure_tab.edit_destination.setText(ctx.tmp)
+    _fill_sequences(window.structure_tab.sequence_container, synthetic_shots(shots))
+    model = window.structure_tab.sequence_container.model
+    first_shot = model.index(0, 0, model.index(0, 0))
+    toggle = [False]
+
+    def run():
+        # One keystroke in one shot name (as committed by the editor), plus
+        # the rebuild it leads to once the preview scheduler's idle timer fires
+        toggle[0] = not toggle[0]
+        model.setData(first_shot, "sh0010x" if toggle[0] else "sh0010")
+        ctx.app.processEvents()
+        window.preview_scheduler.refresh_visible()
+    return run, window
+
+
+AREAS = {
+    "plan_hardcoded": (bench_plan_hardcoded, False),
+    "create_hardcoded": (bench_create_hardcoded, False),
+    "replicate_template": (bench_replicate_template, False),
+    "render_nk": (bench_render_nk, False),
+    "preview_hardcoded": (bench_preview_hardcoded, True),
+    "populate_existing_tree": (bench_populate_existing_tree, True),
+    "preview_keystroke": (bench_preview_keystroke, True),
+}
+
+
+class Context(object):
+    def __init__(self, tmp):
+        self.tmp = tmp
+        self.app = None
+        self.extra = {}
+        # Called (untimed) before every run, and once the area is done
+        self.before_each = []
+        self.cleanups = []
+
+    def reset(self):
+        for func in self.before_each:
+            func()
+
+
+def run_area(name, shots, repeats, base_tmp):
+    setup, needs_qt = AREAS[name]
+    tmp = temp_root(base_tmp)
+    ctx = Context(tmp)
+    try:
+        try:
+            # keep_alive holds the main window of GUI areas until we are done
+            run, keep_alive = setup(ctx, shots)
+        except ImportError as e:
+            if not needs_qt:
+                raise
+            return {"area": name, "shots": shots, "skipped": f"PyQt5 unavailable: {e}"}
+        ctx.reset()
+        run()  # warm-up
+        timings = []
+        for _ in range(repeats):
+            ctx.reset()
+            t0 = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - t0)
+        result = {
+            "area": name,
+            "shots": shots,
+            "repeats": repeats,
+            "min_s": min(timings),
+            "median_s": statistics.median(timings),
+        }
+        result.update(ctx.extra)
+        return result
+    finally:
+        for func in ctx.cleanups:
+            func()
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def git_version():
+    try:
+        out = subprocess.run(["git", "describe", "--always", "--dirty"], cwd=ROOT,
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or "unknown"
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+
+
+def compare(old, new):
+    """
+    Print median time ratios new/old for every (area, shots) in both runs.
+    """
+    old_by_key = {(r["area"], r["shots"]): r for r in old["results"] if "median_s" in r}
+    print(f"Comparing {old.get('version')} => {new.get('version')}")
+    for r in new["results"]:
+        prev = old_by_key.get((r["area"], r["shots"]))
+        if not prev or "median_s" not in r:
+            continue
+        ratio = r["median_s"] / prev["median_s"] if prev["median_s"] else float("inf")
+        flag = "  REGRESSION" if ratio > 1.2 else ""
+        print(f"  {r['area']:<24} {r['shots']:>6} shots  "
+              f"{prev['median_s'] * 1000:10.2f} ms -> {r['median_s'] * 1000:10.2f} ms  "
+              f"x{ratio:.2f}{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--shots", default=",".join(str(n) for n in DEFAULT_SHOT_COUNTS),
+                        help="comma separated shot counts")
+    parser.add_argument("--areas", default=",".join(AREAS),
+                        help="comma separated areas: " + ", ".join(AREAS))
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--tmpdir", default="/dev/shm" if os.path.isdir("/dev/shm") else None,
+                        help="where to create the temp trees (default: tmpfs if available)")
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare with")
+    args = parser.parse_args(argv)
+
+    shot_counts = [int(n) for n in args.shots.split(",") if n.strip()]
+    areas = [a.strip() for a in args.areas.split(",") if a.strip()]
+    unknown = [a for a in areas if a not in AREAS]
+    if unknown:
+        parser.error(f"unknown areas: {', '.join(unknown)}")
+
+    results = []
+    for area in areas:
+        for shots in shot_counts:
+            result = run_area(area, shots, args.repeats, args.tmpdir)
+            results.append(result)
+            if "skipped" in result:
+                print(f"{area:<24} {shots:>6} shots  skipped ({result['skipped']})")
+            else:
+                print(f"{area:<24} {shots:>6} shots  median {result['median_s'] * 1000:10.2f} ms")
+
+    output = {
+        "version": git_version(),
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as ff:
+            json.dump(output, ff, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as ff:
+            compare(json.load(ff), output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,19 @@
-def build_nuke_script_template(seq_name, shot_name, fps, width, height, resolution_label, use_proxy, use_aces):
-    define_window_layout = """define_window_layout_xml {<?xml version="1.0" encoding="UTF-8"?>
+# nuke_template.py
+"""
+Comp script (.nk) template.
+
+Everything in a comp script except the node name depends only on the
+fps / resolution / proxy / ACES settings, so compile_nuke_template()
+builds those parts once, pre-encoded as bytes, and NukeScriptTemplate
+splices in the per-shot name when rendering.
+"""
+from functools import lru_cache
+
+SCRIPT_HEADER = """#! C:/Program Files/Nuke15.1v5/nuke-15.1.5.dll -nx
+version 15.1 v5
+"""
+
+DEFINE_WINDOW_LAYOUT = """define_window_layout_xml {<?xml version="1.0" encoding="UTF-8"?>
 <layout version="1.0">
     <window x="-1" y="-8" w="2560" h="1369" maximized="1" screen="0">
         <splitter orientation="1">
@@ -40,22 +54,14 @@ def build_nuke_script_template(seq_name, shot_name, fps, width, height, resoluti
     </window>
 </layout>
 }"""
-        
-    root_start= f"""Root {{
- inputs 0
- name {seq_name}_{shot_name}_comp_v001.nk
- fps {fps:.2f}
- format "{width} {height} 0 0 {width} {height} 1 {resolution_label}"
-"""
-    if use_proxy:
-        proxy_lines= """ proxy_format "4000 4000 0 0 4000 4000 1 4K Proxy LL180 Sphere"
+
+PROXY_LINES = """ proxy_format "4000 4000 0 0 4000 4000 1 4K Proxy LL180 Sphere"
  proxySetting always"""
-    else:
-        proxy_lines= """ proxy_type scale
+
+NO_PROXY_LINES = """ proxy_type scale
  proxy_format "1024 778 0 0 1024 778 1 1K_Super_35(full-ap)" """
-        
-    if use_aces:
-        color_lines= """ colorManagement OCIO
+
+ACES_COLOR_LINES = """ colorManagement OCIO
  OCIO_config aces_1.2
  defaultViewerLUT "OCIO LUTs"
  workingSpaceLUT scene_linear
@@ -65,8 +71,8 @@ def build_nuke_script_template(seq_name, shot_name, fps, width, height, resoluti
  int16Lut texture_paint
  logLut compositing_log
  floatLut scene_linear"""
-    else:
-        color_lines= """ colorManagement Nuke
+
+NUKE_COLOR_LINES = """ colorManagement Nuke
  workingSpaceLUT linear
  monitorLut sRGB
  monitorOutLUT rec709
@@ -74,10 +80,31 @@ def build_nuke_script_template(seq_name, shot_name, fps, width, height, resoluti
  int16Lut sRGB
  logLut Cineon
  floatLut linear"""
-        
-    root_block= f"{root_start}{proxy_lines}\n{color_lines}\n}}\n"
-        
-    viewer_block= f"""Viewer {{
+
+
+class NukeScriptTemplate(object):
+    """
+    A comp script compiled for one set of settings. Only the
+    "[sequence]_[shot]" part of the Root name is filled in per shot.
+    """
+    __slots__ = ("_prefix", "_suffix")
+
+    def __init__(self, fps, width, height, resolution_label, use_proxy, use_aces):
+        proxy_lines = PROXY_LINES if use_proxy else NO_PROXY_LINES
+        color_lines = ACES_COLOR_LINES if use_aces else NUKE_COLOR_LINES
+
+        prefix = f"""{SCRIPT_HEADER}{DEFINE_WINDOW_LAYOUT}
+Root {{
+ inputs 0
+ name """
+        suffix = f"""_comp_v001.nk
+ fps {fps:.2f}
+ format "{width} {height} 0 0 {width} {height} 1 {resolution_label}"
+{proxy_lines}
+{color_lines}
+}}
+
+Viewer {{
  inputs 0
  frame 1
  frame_range 1-100
@@ -85,12 +112,34 @@ def build_nuke_script_template(seq_name, shot_name, fps, width, height, resoluti
  name Viewer1
  xpos -40
  ypos -9
-}}"""
-        
-    script_text= f"""#! C:/Program Files/Nuke15.1v5/nuke-15.1.5.dll -nx
-version 15.1 v5
-{define_window_layout}
-{root_block}
-{viewer_block}
+}}
 """
-    return script_text
+        self._prefix = prefix.encode("utf-8")
+        self._suffix = suffix.encode("utf-8")
+
+    def render(self, seq_name, shot_name):
+        """
+        Script bytes for one shot.
+        """
+        return b"".join((self._prefix, f"{seq_name}_{shot_name}".encode("utf-8"), self._suffix))
+
+    def render_batch(self, shots):
+        """
+        Script bytes for every (seq_name, shot_name) pair in `shots`.
+        """
+        prefix = self._prefix
+        suffix = self._suffix
+        return [
+            b"".join((prefix, f"{seq}_{shot}".encode("utf-8"), suffix))
+            for seq, shot in shots
+        ]
+
+
+@lru_cache(maxsize=32)
+def compile_nuke_template(fps, width, height, resolution_label, use_proxy, use_aces):
+    return NukeScriptTemplate(fps, width, height, resolution_label, use_proxy, use_aces)
+
+
+def build_nuke_script_template(seq_name, shot_name, fps, width, height, resolution_label, use_proxy, use_aces):
+    template = compile_nuke_template(fps, width, height, resolution_label, use_proxy, use_aces)
+    return template.render(seq_name, shot_name).decode("utf-8")
@@ -0,0 +1,67 @@
+# preview_scheduler.py
+"""
+Debounced preview refreshes.
+
+Edits only mark previews dirty. Once the edits pause for `idle_ms`, the
+scheduler rebuilds the dirty previews that are visible, in one go.
+Hidden previews stay dirty until their tab is shown (refresh_visible()),
+so typing in a long shot list costs one rebuild of one tab per pause
+instead of a rebuild of every tab per keystroke.
+"""
+from PyQt5.QtCore import QObject, QTimer
+
+from core import trace
+
+# Idle time after the last edit before the visible preview is rebuilt
+DEFAULT_IDLE_MS = 150
+
+
+class PreviewScheduler(QObject):
+    """
+    `is_visible(key)` tells whether the preview registered under `key`
+    is on screen; add(key, refresh) registers its rebuild function.
+    """
+    def __init__(self, is_visible, idle_ms=DEFAULT_IDLE_MS, parent=None):
+        super().__init__(parent)
+        self._is_visible = is_visible
+        self._refreshers = {}
+        self._dirty = set()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(idle_ms)
+        self._timer.timeout.connect(self.refresh_visible)
+
+    def add(self, key, refresh):
+        self._refreshers[key] = refresh
+
+    def mark_dirty(self, *keys):
+        """
+        Mark the previews of `keys` (all when none given) dirty and
+        (re)start the idle timer, so a burst of edits ends in one rebuild.
+        """
+        self._dirty.update(keys or self._refreshers)
+        self._timer.start()
+
+    def is_dirty(self, key):
+        return key in self._dirty
+
+    def refresh_visible(self):
+        """
+        Rebuild the dirty previews that are visible now.
+        """
+        self._timer.stop()
+        for key in [k for k in self._dirty if self._is_visible(k)]:
+            self._refresh(key)
+
+    def flush(self):
+        """
+        Rebuild every dirty preview now, visible or not.
+        """
+        self._timer.stop()
+        for key in list(self._dirty):
+            self._refresh(key)
+
+    def _refresh(self, key):
+        self._dirty.discard(key)
+        with trace.span("preview.refresh", "preview", key=key):
+            self._refreshers[key]()
@@ -0,0 +1,108 @@
+# project_scanner.py
+"""
+Background directory scan for the "Add to Existing Project" tree.
+
+A ProjectScanThread walks a few levels of a project with
+core.scanner.scan_levels() off the GUI thread and streams what it finds
+through the `batch_ready` signal, so the tree fills in while the scan is
+still running and the window never freezes on a large show. Listings are
+kept in a core.scan_cache.ScanCache, so reopening a show shows its cached
+tree at once and then only lists the directories that changed.
+"""
+import sqlite3
+import time
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from core import trace
+from core.scan_cache import ScanCache
+from core.scanner import scan_levels, cached_levels, PROJECT_PRUNE_RULES
+
+# Directories per batch_ready emission, and the longest a batch waits
+BATCH_DIRS = 200
+BATCH_SECONDS = 0.1
+
+
+class ProjectScanThread(QThread):
+    """
+    Scans `depth` levels below each of `start_rels` in `root`.
+
+    batch_ready(generation, [(rel, [subdir names]), ...]) is emitted in
+    scan order, parents before children. `generation` is passed through
+    so the receiver can drop batches of a scan it no longer wants.
+
+    With use_cache=True, listings saved by an earlier scan are emitted
+    first, straight from the ScanCache. The directories are then checked
+    against their mtimes, and only listings that changed are emitted a
+    second time. `rules` (core.scanner.PruneRules) decide which folders
+    are skipped.
+    """
+    batch_ready = pyqtSignal(int, list)
+
+    def __init__(self, generation, root, start_rels, depth, rules=PROJECT_PRUNE_RULES,
+                 use_cache=True, parent=None):
+        super().__init__(parent)
+        self.generation = generation
+        self.root = root
+        self.start_rels = list(start_rels)
+        self.depth = depth
+        self.rules = rules
+        self.use_cache = use_cache
+        self._batch = []
+        self._flushed = 0.0
+
+    def _add(self, rel, names):
+        self._batch.append((rel, names))
+        if len(self._batch) >= BATCH_DIRS or time.perf_counter() - self._flushed >= BATCH_SECONDS:
+            self._flush()
+
+    def _flush(self):
+        if self._batch and not self.isInterruptionRequested():
+            self.batch_ready.emit(self.generation, self._batch)
+        self._batch = []
+        self._flushed = time.perf_counter()
+
+    def _open_cache(self):
+        if not self.use_cache:
+            return None, None
+        cache = ScanCache()
+        try:
+            cache.open()
+            return cache, cache.load(self.root, self.rules.signature())
+        except (OSError, sqlite3.Error):
+            # No usable cache => plain scan
+            cache.close()
+            return None, None
+
+    def run(self):
+        with trace.span("scan.existing_project", "scan", depth=self.depth,
+                        start=len(self.start_rels)) as sp:
+            self._flushed = time.perf_counter()
+            cache, known = self._open_cache()
+            try:
+                emitted = {}
+                if known:
+                    for rel, names in cached_levels(known, self.start_rels, self.depth):
+                        self._add(rel, names)
+                        emitted[rel] = names
+                    self._flush()
+
+                changed = {}
+                dirs = 0
+                for rel, names in scan_levels(self.root, self.start_rels, self.depth,
+                                              self.isInterruptionRequested, known, changed,
+                                              self.rules):
+                    dirs += 1
+                    if emitted.get(rel) != names:
+                        self._add(rel, names)
+                self._flush()
+                sp.set(dirs=dirs, cached=len(emitted), listed=len(changed))
+
+                if cache:
+                    try:
+                        cache.store(self.root, changed, self.rules.signature())
+                    except sqlite3.Error:
+                        pass
+            finally:
+                if cache:
+                    cache.close()
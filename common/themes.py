@@ -30,7 +30,7 @@ def apply_dark_theme(app):
     QLabel {
         color: #ffffff;
     }
-    QScrollArea, QTreeWidget {
+    QScrollArea, QTreeWidget, QTreeView {
         background-color: #2e2e2e;
     }
     QTabWidget::pane {
@@ -108,8 +108,8 @@ def apply_custom_stylesheet(app):
         padding: 0 3px;
     }
 
-    /* ScrollArea, TreeWidget */
-    QScrollArea, QTreeWidget {
+    /* ScrollArea, TreeWidget, TreeView */
+    QScrollArea, QTreeWidget, QTreeView {
         background-color: #2e2e2e;
         border: 1px solid #555;
         border-radius: 4px;
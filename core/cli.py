@@ -0,0 +1,247 @@
+# cli.py
+"""
+Headless batch mode: `python main.py create ...` / `python main.py add ...`.
+
+Runs the same planner and executor as the Structure and "Add to Existing
+Project" tabs without ever importing PyQt5, so it starts quickly on farm
+nodes and in event handlers. Progress is written to stdout as JSON lines,
+one object per event, e.g.
+
+    {"event": "mkdir", "path": "...", "status": "created"}
+    {"event": "done", "ok": true, "summary": {...}, ...}
+"""
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import time
+
+from core.config import (
+    FolderConfig, NukeSettings, folder_name_error, parse_resolution, show_folder_name
+)
+from core.executor import execute_plan, DEFAULT_MAX_WORKERS
+from core.planner import (
+    plan_hardcoded_structure, plan_template_structure, plan_add_to_existing,
+    CONFLICT_MODES, SKIP_CONFLICTS, CREATE_MISSING
+)
+from core.scanner import (
+    read_template_structure, PruneRules, CompRule, DEFAULT_MAX_FILES, DEFAULT_COMP_RULE
+)
+from core.shotlist import read_shot_list, group_shots, iter_pattern_shots
+from core.syscalls import legacy_syscall_estimate
+from core.validation import validate_sequences, format_issue
+from core.writer import DEFAULT_WRITER_WORKERS
+
+COMMANDS = ("create", "add")
+
+
+class CliError(Exception):
+    pass
+
+
+def emit(event, **fields):
+    fields = dict(event=event, **fields)
+    sys.stdout.write(json.dumps(fields) + "\n")
+    sys.stdout.flush()
+
+
+def _add_common_arguments(parser):
+    parser.add_argument("--shots",
+                        help="shot list: CSV with sequence,shot rows, CMX3600 .edl or FCP .xml/.fcpxml")
+    parser.add_argument("--pattern", action="append", default=[], metavar="PATTERN",
+                        help='shot range pattern, e.g. "SQ[010-200:10]/sh[0010-0500:10]" '
+                             "(repeatable, combines with --shots)")
+    parser.add_argument("--fps", type=float, default=24.0)
+    parser.add_argument("--res", default="HD_1080",
+                        help='preset ("UHD_4K") or custom size ("2048x1152")')
+    parser.add_argument("--proxy", action="store_true", help="enable the proxy workflow")
+    parser.add_argument("--aces", action="store_true", help="enable the ACES workflow")
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS,
+                        help="parallel mkdir workers (1 = serial)")
+    parser.add_argument("--writer-workers", type=int, default=DEFAULT_WRITER_WORKERS,
+                        help="script writer threads (0 = write inline)")
+    parser.add_argument("--dir-fd", action="store_true",
+                        help="create relative to directory descriptors where supported")
+    parser.add_argument("--fsync", action="store_true", help="fsync scripts before renaming")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="print the plan without touching the disk")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Create VFX show folder structures without the GUI."
+    )
+    sub = parser.add_subparsers(dest="command")
+
+    create = sub.add_parser("create", help="create a new show (Structure tab)")
+    create.add_argument("--show", required=True, help="show name")
+    create.add_argument("--dest", required=True, help="existing destination folder")
+    create.add_argument("--template", help="template folder (Template mode)")
+    create.add_argument("--max-depth", type=int,
+                        help="only replicate template folders up to this depth")
+    create.add_argument("--exclude", action="append", default=[], metavar="GLOB",
+                        help="skip template folders whose name matches (repeatable)")
+    create.add_argument("--exclude-regex", action="append", default=[], metavar="REGEX",
+                        help="skip template folders whose relative path matches (repeatable)")
+    create.add_argument("--max-files", type=int, default=DEFAULT_MAX_FILES,
+                        help="do not descend into template folders with more files than this")
+    create.add_argument("--folder-names",
+                        help="JSON file overriding folder names (keys as in the Folder Names tab)")
+    _add_common_arguments(create)
+
+    add = sub.add_parser("add", help="add sequences/shots to an existing project")
+    add.add_argument("--project", required=True, help="existing project folder")
+    add.add_argument("--folder", action="append", default=[], required=True,
+                     help="folder relative to the project to add into (repeatable)")
+    add.add_argument("--nuke", action="store_true",
+                     help="create project/render and a comp script under comp folders")
+    add.add_argument("--comp-glob", action="append", metavar="GLOB",
+                     help="folder names that make a comp folder, inherited by subfolders "
+                          f"(repeatable, case-insensitive; default {DEFAULT_COMP_RULE.globs[0]!r})")
+    add.add_argument("--on-conflict", choices=CONFLICT_MODES + ("cancel",), default=SKIP_CONFLICTS,
+                     help="existing sequences/shots: skip them (default), add only the "
+                          "missing shots, or cancel without writing anything")
+    _add_common_arguments(add)
+    return parser
+
+
+def _settings(args):
+    try:
+        width, height, label = parse_resolution(args.res)
+    except ValueError as e:
+        raise CliError(str(e))
+    return NukeSettings(args.fps, width, height, label, args.proxy, args.aces)
+
+
+def _seq_shots(args):
+    if not args.shots and not args.pattern:
+        raise CliError("Give a shot list (--shots) and/or --pattern.")
+    pairs = []
+    if args.shots:
+        try:
+            for sd in read_shot_list(args.shots):
+                pairs.extend((sd['sequence'], sh) for sh in sd['shots'] or [""])
+        except (OSError, ValueError, csv.Error) as e:
+            raise CliError(f"Cannot read shot list: {e}")
+    for pattern in args.pattern:
+        try:
+            pairs.extend(iter_pattern_shots(pattern))
+        except ValueError as e:
+            raise CliError(f"Bad --pattern: {e}")
+    return group_shots(pairs)
+
+
+def _folder_names(path):
+    """
+    The {key: name} overrides of a --folder-names JSON file. Every key must
+    be one of the Folder Names tab and every name a single folder name,
+    not a path.
+    """
+    try:
+        with open(path, encoding="utf-8") as ff:
+            names = json.load(ff)
+    except (OSError, ValueError) as e:
+        raise CliError(f"Cannot read --folder-names: {e}")
+    if not isinstance(names, dict):
+        raise CliError("--folder-names must hold a JSON object of folder key => name.")
+    for key, name in names.items():
+        error = folder_name_error(key, name)
+        if error:
+            raise CliError(f"Bad --folder-names: {error}")
+    return names
+
+
+def _plan_create(args, seq_shots, settings):
+    if not os.path.isdir(args.dest):
+        raise CliError(f"Destination folder {args.dest!r} does not exist.")
+    final_name = show_folder_name(args.show)
+    final_path = os.path.join(args.dest, final_name)
+    if os.path.exists(final_path):
+        raise CliError(f"Folder {final_path!r} already exists.")
+
+    if args.template:
+        if not os.path.isdir(args.template):
+            raise CliError(f"Template folder {args.template!r} does not exist.")
+        try:
+            rules = PruneRules(args.max_depth, args.exclude, args.exclude_regex, args.max_files)
+        except re.error as e:
+            raise CliError(f"Invalid --exclude-regex: {e}")
+        template_paths = read_template_structure(args.template, rules)
+        return plan_template_structure(final_name, args.dest, template_paths, seq_shots, settings)
+
+    names = _folder_names(args.folder_names) if args.folder_names else None
+    return plan_hardcoded_structure(final_name, args.dest, seq_shots, FolderConfig(names), settings)
+
+
+def _plan_add(args, seq_shots, settings):
+    if not os.path.isdir(args.project):
+        raise CliError(f"Project folder {args.project!r} does not exist.")
+    for relp in args.folder:
+        norm = os.path.normpath(relp)
+        if os.path.isabs(norm) or norm == os.pardir or norm.startswith(os.pardir + os.sep):
+            raise CliError(f"Folder {relp!r} must be a path inside the project.")
+        if not os.path.isdir(os.path.join(args.project, relp)):
+            raise CliError(f"Folder {relp!r} does not exist in the project.")
+    mode = CREATE_MISSING if args.on_conflict == CREATE_MISSING else SKIP_CONFLICTS
+    comp_rule = CompRule(args.comp_glob) if args.comp_glob else DEFAULT_COMP_RULE
+    return plan_add_to_existing(args.project, args.folder, seq_shots, args.nuke, settings,
+                                conflict_mode=mode, comp_rule=comp_rule)
+
+
+def run(argv):
+    args = build_parser().parse_args(argv)
+    started = time.perf_counter()
+    try:
+        settings = _settings(args)
+        seq_shots = _seq_shots(args)
+        issues = validate_sequences(seq_shots)
+        if issues:
+            for issue in issues:
+                emit("invalid_name", sequence=issue.sequence, shot=issue.shot,
+                     message=format_issue(issue))
+            raise CliError(f"{len(issues)} invalid sequence/shot names, nothing written.")
+
+        if args.command == "create":
+            plan = _plan_create(args, seq_shots, settings)
+        else:
+            plan = _plan_add(args, seq_shots, settings)
+    except CliError as e:
+        emit("error", message=str(e))
+        return 2
+
+    directories = plan.directories
+    emit("plan", root=plan.root, directories=len(directories), files=len(plan.files),
+         collisions=len(plan.collisions))
+    for collision in plan.collisions:
+        emit("collision", path=collision.path, message=collision.message)
+    if plan.collisions and getattr(args, "on_conflict", None) == "cancel":
+        emit("error", message=f"{len(plan.collisions)} conflicts, nothing written (--on-conflict cancel)")
+        return 2
+
+    if args.dry_run:
+        for path in directories:
+            emit("dir", path=path)
+        for planned_file in plan.files:
+            emit("file", path=planned_file.path)
+        return 0
+
+    def progress(result):
+        emit(result.action, path=result.path, status=result.status,
+             error=str(result.error) if result.error else None)
+
+    report = execute_plan(
+        plan, progress=progress, max_workers=args.workers, use_dir_fd=args.dir_fd,
+        writer_workers=args.writer_workers, fsync=args.fsync
+    )
+    emit("done", ok=report.ok, summary=report.summary(),
+         syscalls=report.syscalls.counts,
+         legacy_syscalls=legacy_syscall_estimate(plan).total,
+         elapsed=round(time.perf_counter() - started, 3))
+    return 0 if report.ok else 1
+
+
+def main(argv=None):
+    return run(sys.argv[1:] if argv is None else argv)
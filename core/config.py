@@ -0,0 +1,158 @@
+# config.py
+"""
+Qt-free configuration snapshots and presets used by the core planning
+engine, the tabs and the command line.
+
+The GUI keeps its folder names in MainWindow.folder_config, a plain dict
+edited by the Folder Names tab; before planning, the tabs take a
+FolderConfig snapshot of it so the planner can run on any thread.
+"""
+import datetime
+import os
+from collections import namedtuple
+from collections.abc import Mapping
+from types import MappingProxyType
+
+# Default names for the hardcoded structure, keyed like MainWindow.folder_config
+DEFAULT_FOLDER_NAMES = {
+    "folder_01_plates": "01_plates",
+    "folder_01_plates_aspera": "Aspera",
+    "folder_01_plates_manifest": "plate_manifest.txt",
+
+    "folder_02_support": "02_support",
+    "folder_02_support_luts": "luts",
+    "folder_02_support_luts_camera": "camera",
+    "folder_02_support_luts_show": "show",
+    "folder_02_support_edl_xml": "edl_xml",
+    "folder_02_support_guides": "guides",
+    "folder_02_support_camera_data": "camera_data",
+
+    "folder_03_references": "03_references",
+    "folder_03_references_client_brief": "client_brief",
+    "folder_03_references_artwork": "artwork",
+    "folder_03_references_style_guides": "style_guides",
+
+    "folder_04_vfx": "04_vfx",
+    "folder_05_comp": "05_comp",
+
+    "folder_06_mograph": "06_mograph",
+    "folder_06_mograph_projects": "projects",
+    "folder_06_mograph_render": "render",
+
+    "folder_07_shared": "07_shared",
+    "folder_07_shared_stock_footage": "stock_footage",
+    "folder_07_shared_graphics": "graphics",
+    "folder_07_shared_fonts": "fonts",
+    "folder_07_shared_templates": "templates",
+
+    "folder_08_output": "08_output",
+    "folder_08_output_date": "[date]",
+    "folder_08_output_full_res": "full_res",
+    "folder_08_output_proxy": "proxy",
+}
+
+# Resolution presets shown in the tabs: label => (width, height, format name)
+RES_PRESETS = {
+    "HD 1920x1080": (1920,1080,"HD_1080"),
+    "UHD_4K 3840x2160": (3840,2160,"UHD_4K"),
+    "4K_Super_35 4096x3112": (4096,3112,"4K_Super_35"),
+    "4K_DCP 4096x2160": (4096,2160,"4K_DCP"),
+    "4K_square 4096x4096": (4096,4096,"4K_square"),
+    "4K_Sphere 4000x4000": (4000,4000,"4K_Sphere"),
+    "8K_Sphere 8000x8000": (8000,8000,"8K_Sphere"),
+    "10K_Sphere 10000x10000": (10000,10000,"10K_Sphere"),
+    "12K_Sphere 12000x12000": (12000,12000,"12K_Sphere")
+}
+
+KNOWN_FPS = ["23.976", "24", "25", "29.97", "30", "50", "59.94", "60", "120"]
+
+# Settings baked into every generated comp script
+NukeSettings = namedtuple(
+    "NukeSettings",
+    ["fps", "width", "height", "resolution_label", "use_proxy", "use_aces"]
+)
+
+
+def folder_name_error(key, name):
+    """
+    Why `name` cannot be the folder name for `key`, or None. A name must be
+    one non-empty folder name, not a path: no separators, "." or "..".
+    """
+    if key not in DEFAULT_FOLDER_NAMES:
+        return f"Unknown folder key {key!r}."
+    if not isinstance(name, str) or not name.strip():
+        return f"Folder name for {key!r} must be a non-empty string."
+    name = name.strip()
+    if (os.path.isabs(name) or "/" in name or "\\" in name or os.sep in name
+            or name in (os.curdir, os.pardir)):
+        return f"Folder name {name!r} for {key!r} must be a plain name, not a path."
+    return None
+
+
+class FolderConfig(Mapping):
+    """
+    Immutable snapshot of the folder names (key => stripped name).
+    Missing keys fall back to DEFAULT_FOLDER_NAMES. Raises ValueError for
+    a name that is not a plain folder name (see folder_name_error()).
+    """
+    __slots__ = ("_names",)
+
+    def __init__(self, names=None):
+        merged = dict(DEFAULT_FOLDER_NAMES)
+        if names:
+            for k, v in names.items():
+                error = folder_name_error(k, v)
+                if error:
+                    raise ValueError(error)
+                merged[k] = v.strip()
+        object.__setattr__(self, "_names", MappingProxyType(merged))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FolderConfig is immutable")
+
+    def __getitem__(self, key):
+        return self._names[key]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __repr__(self):
+        return f"FolderConfig({dict(self._names)!r})"
+
+
+def resolution_label_for(width, height):
+    """
+    Format name of the first preset with this size, else "Custom_WxH".
+    """
+    for pw, ph, lbl in RES_PRESETS.values():
+        if width == pw and height == ph:
+            return lbl
+    return f"Custom_{width}x{height}"
+
+
+def parse_resolution(text):
+    """
+    (width, height, format name) for a preset label ("UHD_4K 3840x2160"),
+    a format name ("UHD_4K") or a custom "WIDTHxHEIGHT".
+    """
+    text = text.strip()
+    if text in RES_PRESETS:
+        return RES_PRESETS[text]
+    for pw, ph, lbl in RES_PRESETS.values():
+        if text.lower() == lbl.lower():
+            return pw, ph, lbl
+    try:
+        w, h = (int(v) for v in text.lower().split("x"))
+    except ValueError:
+        raise ValueError(f"Unknown resolution {text!r}") from None
+    return w, h, resolution_label_for(w, h)
+
+
+def show_folder_name(show_name, date=None):
+    """
+    Name of the show root folder: "<show>_<YYYY-MM-DD>".
+    """
+    return f"{show_name}_{date or datetime.date.today():%Y-%m-%d}"
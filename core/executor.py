@@ -0,0 +1,253 @@
+# executor.py
+"""
+Applies a FolderPlan to disk.
+
+execute_plan() creates directories level by level (parents before
+children). With max_workers > 1 the directories of one level are created
+concurrently by a bounded thread pool, which hides the round-trip latency
+of NFS/SMB filers. Files are written once all directories exist or, with
+writer_workers > 1, handed to a core.writer.ScriptWriter as soon as
+their directory's level is done, so writes overlap directory creation.
+
+With use_dir_fd=True the plan tree is walked depth-first holding an open
+file descriptor for the current directory: children are created with
+mkdir(name, dir_fd=...) and scripts with open(name, dir_fd=...), so deep
+trees skip resolving the full path on every call. Platforms without
+dir_fd support (Windows) fall back to the path-based walk.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from core import trace
+from core.report import (
+    CREATED, EXISTS, WRITTEN, SKIPPED, FAILED, PathResult, ExecutionReport
+)
+from core.writer import ScriptWriter, WRITE_FLAGS, CREATE_FLAGS, file_bytes, write_all
+
+# Worker count used by the GUI for network storage
+DEFAULT_MAX_WORKERS = 8
+
+# Whether mkdir/open relative to a directory fd are available here
+DIR_FD_SUPPORTED = (
+    os.mkdir in os.supports_dir_fd and os.open in os.supports_dir_fd
+    and hasattr(os, "O_DIRECTORY")
+)
+
+_DIR_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+
+
+def _make_dir(path, counter):
+    # Parents are created first, so a single mkdir with no probing is enough.
+    counter.add("mkdir")
+    try:
+        os.mkdir(path)
+        return PathResult(path, "mkdir", CREATED, None)
+    except FileExistsError as e:
+        counter.add("stat")
+        if os.path.isdir(path):
+            return PathResult(path, "mkdir", EXISTS, None)
+        return PathResult(path, "mkdir", FAILED, e)
+    except OSError as e:
+        return PathResult(path, "mkdir", FAILED, e)
+
+
+def _write_file(planned_file, counter, dir_fd=None):
+    # With dir_fd the file is opened by name relative to its directory
+    path = planned_file.path
+    flags = WRITE_FLAGS if planned_file.overwrite else CREATE_FLAGS
+    counter.add("open")
+    try:
+        if dir_fd is None:
+            fd = os.open(path, flags, 0o666)
+        else:
+            fd = os.open(os.path.basename(path), flags, 0o666, dir_fd=dir_fd)
+    except FileExistsError:
+        return PathResult(path, "write", EXISTS, None)
+    except OSError as e:
+        return PathResult(path, "write", FAILED, e)
+    try:
+        write_all(fd, file_bytes(planned_file), counter)
+        return PathResult(path, "write", WRITTEN, None)
+    except OSError as e:
+        return PathResult(path, "write", FAILED, e)
+    finally:
+        counter.add("close")
+        os.close(fd)
+
+
+def _skip_subtree(node, record):
+    stack = list(node.children.values())
+    for planned_file in node.files:
+        record(PathResult(planned_file.path, "write", SKIPPED, None))
+    while stack:
+        child = stack.pop()
+        record(PathResult(child.path, "mkdir", SKIPPED, None))
+        for planned_file in child.files:
+            record(PathResult(planned_file.path, "write", SKIPPED, None))
+        stack.extend(child.children.values())
+
+
+def _walk_dir_fd(node, fd, record, write, counter):
+    """
+    Write node's files and create its children relative to `fd`, an open
+    descriptor of node's directory, then recurse into each child.
+    """
+    for planned_file in node.files:
+        write(planned_file, fd)
+
+    for child in node.children.values():
+        if child.exists:
+            record(PathResult(child.path, "mkdir", EXISTS, None))
+        else:
+            counter.add("mkdir")
+            try:
+                os.mkdir(child.name, dir_fd=fd)
+                record(PathResult(child.path, "mkdir", CREATED, None))
+            except FileExistsError:
+                # Opening it below fails if it is not a directory
+                record(PathResult(child.path, "mkdir", EXISTS, None))
+            except OSError as e:
+                record(PathResult(child.path, "mkdir", FAILED, e))
+                _skip_subtree(child, record)
+                continue
+
+        if not child.children and not child.files:
+            continue
+        counter.add("open")
+        try:
+            child_fd = os.open(child.name, _DIR_FLAGS, dir_fd=fd)
+        except OSError as e:
+            record(PathResult(child.path, "open", FAILED, e))
+            _skip_subtree(child, record)
+            continue
+        try:
+            _walk_dir_fd(child, child_fd, record, write, counter)
+        finally:
+            counter.add("close")
+            os.close(child_fd)
+
+
+def execute_plan(plan, progress=None, max_workers=1, use_dir_fd=False,
+                 writer_workers=0, fsync=False):
+    """
+    Create every planned directory and write every planned file, and
+    return an ExecutionReport. Each directory costs exactly one mkdir;
+    report.syscalls counts the calls issued. Errors are recorded per path
+    instead of raised; anything below a directory that could not be
+    created is reported as skipped.
+
+    `progress`, if given, is called as progress(result) with each
+    PathResult, always from the calling thread. `use_dir_fd` selects the
+    descriptor-relative walk where supported; it runs on one thread and
+    writes each directory's files as soon as the directory exists.
+    `writer_workers` > 0 writes files atomically through a ScriptWriter
+    pool, fsync-ing them in batches if `fsync` is set.
+    """
+    report = ExecutionReport()
+    counter = report.syscalls
+    broken = set()
+    writer = ScriptWriter(counter, writer_workers, fsync) if writer_workers > 0 else None
+
+    def record(result):
+        if result.status in (FAILED, SKIPPED) and result.action == "mkdir":
+            broken.add(result.path)
+        report.add(result)
+        if progress:
+            progress(result)
+
+    def write(planned_file, dir_fd=None):
+        if writer:
+            writer.submit(planned_file)
+            for result in writer.drain():
+                record(result)
+        else:
+            record(_write_file(planned_file, counter, dir_fd))
+
+    def parent_broken(path):
+        return os.path.dirname(path) in broken
+
+    mode = "dir_fd" if use_dir_fd and DIR_FD_SUPPORTED else "levels"
+    with trace.span("execute", "io", mode=mode, workers=max_workers,
+                    writer_workers=writer_workers):
+        try:
+            if mode == "dir_fd":
+                counter.add("open")
+                root_fd = os.open(plan.root, _DIR_FLAGS)
+                try:
+                    with trace.span("mkdir.walk", "io"):
+                        _walk_dir_fd(plan.tree, root_fd, record, write, counter)
+                finally:
+                    counter.add("close")
+                    os.close(root_fd)
+            else:
+                _create_levels(plan, record, write, parent_broken, counter, max_workers, writer)
+        finally:
+            if writer:
+                with trace.span("write.drain", "io"):
+                    for result in writer.close():
+                        record(result)
+    if trace.enabled():
+        _trace_totals(plan, report)
+    return report
+
+
+def _trace_totals(plan, report):
+    # Items created and bytes written, next to the syscall counts
+    written = {r.path for r in report.results if r.action == "write" and r.status == WRITTEN}
+    summary = report.summary()
+    trace.counter(
+        "execute",
+        dirs_created=summary.get(CREATED, 0),
+        files_written=len(written),
+        bytes_written=sum(len(file_bytes(f)) for f in plan.files if f.path in written),
+        failed=summary.get(FAILED, 0),
+    )
+    trace.counter("syscalls", **report.syscalls.counts)
+
+
+def _create_levels(plan, record, write, parent_broken, counter, max_workers, writer):
+    """
+    Path-based walk: one level of directories at a time, optionally
+    through a thread pool. Without a writer, files follow all directories.
+    """
+    if writer:
+        for planned_file in plan.tree.files:
+            write(planned_file)
+
+    pool = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+    try:
+        for depth, level in enumerate(plan.levels()):
+            todo = []
+            for node in level:
+                if node.exists:
+                    record(PathResult(node.path, "mkdir", EXISTS, None))
+                elif parent_broken(node.path):
+                    record(PathResult(node.path, "mkdir", SKIPPED, None))
+                else:
+                    todo.append(node.path)
+            with trace.span("mkdir.level", "io", depth=depth, dirs=len(todo)):
+                if pool:
+                    for result in pool.map(_make_dir, todo, [counter] * len(todo)):
+                        record(result)
+                else:
+                    for path in todo:
+                        record(_make_dir(path, counter))
+
+            if writer:
+                for node in level:
+                    for planned_file in node.files:
+                        if parent_broken(planned_file.path):
+                            record(PathResult(planned_file.path, "write", SKIPPED, None))
+                        else:
+                            write(planned_file)
+    finally:
+        if pool:
+            pool.shutdown()
+
+    if not writer:
+        with trace.span("write.files", "io", files=len(plan.files)):
+            for planned_file in plan.files:
+                if parent_broken(planned_file.path):
+                    record(PathResult(planned_file.path, "write", SKIPPED, None))
+                else:
+                    write(planned_file)
@@ -0,0 +1,186 @@
+# plan.py
+"""
+FolderPlan: the directories and files one run will create.
+
+Planners (see core.planner) build a FolderPlan without touching the disk
+for anything but existence checks; executors (see core.executor) apply it.
+
+The plan is a tree of PlanNodes below an existing `root` directory.
+Adding the same directory twice (or a directory whose parents were never
+added) still yields exactly one node per directory, so every directory is
+created once, parents before children.
+"""
+import os
+from collections import namedtuple
+
+# One file to write; content is bytes or str (written as UTF-8), or None
+# in a preview plan (see core.planner), which is never executed.
+# If overwrite is False an existing file is left alone.
+PlannedFile = namedtuple("PlannedFile", ["path", "content", "overwrite"])
+
+# A planned item that was skipped because it already exists on disk
+Collision = namedtuple("Collision", ["path", "message"])
+
+
+class PlanNode(object):
+    """
+    One planned directory. `children` maps name => PlanNode in the order
+    they were planned, `files` holds the PlannedFiles written into it and
+    `requests` counts how often a planner asked for this directory.
+    `exists` marks directories known to be on disk already; executors
+    descend into them without creating them.
+    """
+    __slots__ = ("name", "path", "parent", "children", "files", "requests", "exists")
+
+    def __init__(self, name, path, parent=None):
+        self.name = name
+        self.path = path
+        self.parent = parent
+        self.children = {}
+        self.files = []
+        self.requests = 0
+        self.exists = False
+
+    def child(self, name, path=None):
+        node = self.children.get(name)
+        if node is None:
+            node = PlanNode(name, path or os.path.join(self.path, name), self)
+            self.children[name] = node
+        return node
+
+    def __repr__(self):
+        return f"PlanNode({self.path!r}, children={len(self.children)}, files={len(self.files)})"
+
+
+class FolderPlan(object):
+    """
+    Tree of directories and files to create below `root`, which must
+    already exist. Directories are created level by level, files afterwards.
+    """
+    def __init__(self, root):
+        self.root = os.path.normpath(root)
+        self.tree = PlanNode("", self.root)
+        self.tree.exists = True
+        # normalized path => PlanNode, so repeated and nested paths resolve in O(1)
+        self._nodes = {self.root: self.tree}
+        self.files = []
+        self.collisions = []
+        self.dir_requests = 0
+
+    def _node(self, path):
+        path = os.path.normpath(path)
+        node = self._nodes.get(path)
+        if node is not None:
+            return node
+        # Walk up to the nearest known folder, then add the missing ones below it.
+        # Above the root the walk runs out of path segments.
+        missing = []
+        current = path
+        while node is None:
+            head, tail = os.path.split(current)
+            if not tail or tail in (os.curdir, os.pardir) or head == current:
+                raise ValueError(f"{path!r} is not below the plan root {self.root!r}")
+            missing.append((tail, current))
+            current = head or os.curdir
+            node = self._nodes.get(current)
+        for name, sub_path in reversed(missing):
+            node = node.child(name, sub_path)
+            self._nodes[sub_path] = node
+        return node
+
+    def find(self, path):
+        """
+        The PlanNode of `path`, or None if it is not part of the plan.
+        """
+        return self._nodes.get(os.path.normpath(path))
+
+    def add_dir(self, path):
+        node = self._node(path)
+        node.requests += 1
+        self.dir_requests += 1
+        return node
+
+    def _link(self, parent, name):
+        # Child `name` of the PlanNode `parent`, indexed, without parsing a path
+        node = parent.children.get(name)
+        if node is None:
+            prefix = parent.path if parent.path.endswith(os.sep) else parent.path + os.sep
+            node = parent.child(name, prefix + name)
+            self._nodes[node.path] = node
+        return node
+
+    def add_subdir(self, parent, name):
+        """
+        add_dir() for folder `name` directly inside the PlanNode `parent`
+        (e.g. returned by add_dir()), for planners that add many folders
+        below the same node. An empty name stands for `parent` itself.
+        """
+        node = self._link(parent, name) if name else parent
+        node.requests += 1
+        self.dir_requests += 1
+        return node
+
+    def add_fragment(self, base, fragment):
+        """
+        Add a prebuilt subtree below `base`: `fragment` holds (parent
+        position, name) pairs, parents first, where position -1 is `base`
+        itself. `base` is resolved once; every other folder is linked to
+        its parent node directly, without parsing its path. An empty name
+        stands for its parent.
+        """
+        base_node = self.add_dir(base)
+        made = []
+        for parent_pos, name in fragment:
+            parent = made[parent_pos] if parent_pos >= 0 else base_node
+            if not name:
+                made.append(parent)
+                continue
+            node = self._link(parent, name)
+            node.requests += 1
+            made.append(node)
+        self.dir_requests += len(fragment)
+        return base_node
+
+    def mark_existing(self, path):
+        """
+        Record that `path` (and therefore its parents) already exists.
+        """
+        node = self._node(path)
+        parent = node
+        while parent is not None and not parent.exists:
+            parent.exists = True
+            parent = parent.parent
+        return node
+
+    def add_file(self, path, content, overwrite=True):
+        planned_file = PlannedFile(os.path.normpath(path), content, overwrite)
+        self._node(os.path.dirname(planned_file.path)).files.append(planned_file)
+        self.files.append(planned_file)
+        return planned_file
+
+    def add_collision(self, path, message):
+        self.collisions.append(Collision(path, message))
+
+    def levels(self):
+        """
+        Planned directories (PlanNodes) grouped by depth, shallowest first.
+        The root itself is not included.
+        """
+        levels = []
+        current = list(self.tree.children.values())
+        while current:
+            levels.append(current)
+            current = [c for node in current for c in node.children.values()]
+        return levels
+
+    @property
+    def directories(self):
+        """
+        Every directory path to create, parents before children. Folders
+        marked as existing are left out.
+        """
+        return [node.path for level in self.levels() for node in level if not node.exists]
+
+    def __repr__(self):
+        return (f"FolderPlan(root={self.root!r}, directories={len(self.directories)}, "
+                f"files={len(self.files)}, collisions={len(self.collisions)})")
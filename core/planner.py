@@ -0,0 +1,305 @@
+# planner.py
+"""
+Turns a FolderConfig snapshot plus a sequence/shot list into a FolderPlan.
+
+Each plan.add_dir() call mirrors one os.makedirs() of the old tab code;
+FolderPlan folds repeated and nested requests into one node per directory
+(see core.syscalls.legacy_syscall_estimate for the comparison).
+
+Nothing in here imports Qt, so plans can be built off the GUI thread, from
+the command line, or inside a benchmark. `seq_shots` is always the list of
+{'sequence': str, 'shots': [str, ...]} dicts returned by
+SequenceListContainer.get_all_sequences_and_shots().
+"""
+import os
+
+from common.nuke_template import compile_nuke_template
+from core import trace
+from core.plan import FolderPlan
+from core.scanner import DEFAULT_COMP_RULE
+from core.template import compile_template, template_values, TEMPLATE_COMP_RULE
+
+# What plan_add_to_existing does with sequences that already exist
+SKIP_CONFLICTS = "skip"       # leave them (and everything below) alone
+CREATE_MISSING = "missing"    # add the shots that are missing in them
+CONFLICT_MODES = (SKIP_CONFLICTS, CREATE_MISSING)
+
+
+def nuke_script_name(seq, shot):
+    return f"{seq}_{shot}_comp_v001.nk"
+
+
+def _add_nuke_scripts(plan, jobs, settings, preview=False):
+    """
+    Render every queued (path, seq, shot) comp script in one batch. For a
+    preview the files are planned with content None and nothing is rendered;
+    such a plan is for showing only, never for execute_plan().
+    """
+    if preview:
+        for path, _, _ in jobs:
+            plan.add_file(path, None)
+        return
+    with trace.span("plan.render_nk", "plan", scripts=len(jobs)):
+        template = compile_nuke_template(*settings)
+        scripts = template.render_batch((seq, shot) for _, seq, shot in jobs)
+        for (path, _, _), data in zip(jobs, scripts):
+            plan.add_file(path, data)
+
+
+@trace.traced("plan.hardcoded", "plan")
+def plan_hardcoded_structure(show_name, dest, seq_shots, config, settings, preview=False):
+    """
+    Plan for the "Hardcoded" creation mode: the default structure named by
+    `config` plus a comp script per shot in 05_comp/[sequence]/[shot]/project.
+    With preview=True the comp scripts are not rendered (see _add_nuke_scripts).
+    """
+    plan = FolderPlan(dest)
+    show_root = os.path.join(dest, show_name)
+    plan.add_dir(show_root)
+
+    f_plates = os.path.join(show_root, config["folder_01_plates"])
+    f_support = os.path.join(show_root, config["folder_02_support"])
+    f_refs = os.path.join(show_root, config["folder_03_references"])
+    f_vfx = os.path.join(show_root, config["folder_04_vfx"])
+    f_comp = os.path.join(show_root, config["folder_05_comp"])
+    f_mg = os.path.join(show_root, config["folder_06_mograph"])
+    f_sh = os.path.join(show_root, config["folder_07_shared"])
+    f_out = os.path.join(show_root, config["folder_08_output"])
+
+    for top in (f_plates, f_support, f_refs, f_vfx, f_comp, f_mg, f_sh, f_out):
+        plan.add_dir(top)
+
+    # 01_plates subfolders
+    plan.add_dir(os.path.join(f_plates, config["folder_01_plates_aspera"]))
+    plan.add_file(
+        os.path.join(f_plates, config["folder_01_plates_manifest"]),
+        "Plate manifest placeholder\n",
+        overwrite=False
+    )
+    # Per-shot folders are linked to their parent nodes, no path parsing per shot
+    plates_node = plan.find(f_plates)
+    for seq_info in seq_shots:
+        seq_node = plan.add_subdir(plates_node, seq_info['sequence'])
+        for sh in seq_info['shots']:
+            plan.add_subdir(seq_node, sh)
+
+    # 02_support
+    f_luts = os.path.join(f_support, config["folder_02_support_luts"])
+    plan.add_dir(f_luts)
+    plan.add_dir(os.path.join(f_luts, config["folder_02_support_luts_camera"]))
+    plan.add_dir(os.path.join(f_luts, config["folder_02_support_luts_show"]))
+    plan.add_dir(os.path.join(f_support, config["folder_02_support_edl_xml"]))
+    plan.add_dir(os.path.join(f_support, config["folder_02_support_guides"]))
+    plan.add_dir(os.path.join(f_support, config["folder_02_support_camera_data"]))
+
+    # 03_references
+    plan.add_dir(os.path.join(f_refs, config["folder_03_references_client_brief"]))
+    plan.add_dir(os.path.join(f_refs, config["folder_03_references_artwork"]))
+    plan.add_dir(os.path.join(f_refs, config["folder_03_references_style_guides"]))
+
+    # 04_vfx and 05_comp => [sequence]/[shot]/(project,render)
+    comp_shot_nodes = {}
+    for base in (f_vfx, f_comp):
+        base_node = plan.find(base)
+        for seq_info in seq_shots:
+            seq = seq_info['sequence']
+            seq_node = plan.add_subdir(base_node, seq)
+            for shot in seq_info['shots']:
+                shot_node = plan.add_subdir(seq_node, shot)
+                plan.add_subdir(shot_node, "project")
+                plan.add_subdir(shot_node, "render")
+                if base is f_comp:
+                    comp_shot_nodes[seq, shot] = shot_node
+
+    # 06_mograph
+    plan.add_dir(os.path.join(f_mg, config["folder_06_mograph_projects"]))
+    plan.add_dir(os.path.join(f_mg, config["folder_06_mograph_render"]))
+
+    # 07_shared
+    plan.add_dir(os.path.join(f_sh, config["folder_07_shared_stock_footage"]))
+    plan.add_dir(os.path.join(f_sh, config["folder_07_shared_graphics"]))
+    plan.add_dir(os.path.join(f_sh, config["folder_07_shared_fonts"]))
+    plan.add_dir(os.path.join(f_sh, config["folder_07_shared_templates"]))
+
+    # 08_output
+    f_out_date = os.path.join(f_out, config["folder_08_output_date"])
+    plan.add_dir(f_out_date)
+    plan.add_dir(os.path.join(f_out_date, config["folder_08_output_full_res"]))
+    plan.add_dir(os.path.join(f_out_date, config["folder_08_output_proxy"]))
+
+    # Nuke scripts in 05_comp/[sequence]/[shot]/project
+    plan.add_dir(f_comp)
+    nk_jobs = []
+    for seq_info in seq_shots:
+        seq = seq_info['sequence']
+        for shot in seq_info['shots']:
+            prj = plan.add_subdir(comp_shot_nodes[seq, shot], "project").path
+            nk_jobs.append((os.path.join(prj, nuke_script_name(seq, shot)), seq, shot))
+    _add_nuke_scripts(plan, nk_jobs, settings, preview)
+    return plan
+
+
+@trace.traced("plan.template", "plan")
+def plan_template_structure(show_name, dest, template_paths, seq_shots, settings,
+                            comp_rule=TEMPLATE_COMP_RULE, date=None, preview=False):
+    """
+    Plan for the "Template" creation mode. `template_paths` are the
+    "/"-separated relative folders read from the template; they are
+    compiled once (core.template) and expanded for `seq_shots`.
+    [sequence]/[shot]/[show]/[date]/[version] are replaced at any depth.
+    A folder whose name matches `comp_rule` (starts with "comp") gets
+    [sequence]/[shot]/(project,render) plus a comp script (not rendered
+    with preview=True).
+    """
+    plan = FolderPlan(dest)
+    show_root = os.path.join(dest, show_name)
+    plan.add_dir(show_root)
+    template = compile_template(template_paths, comp_rule)
+    comp_shots = template.expand(plan, show_root, seq_shots, template_values(show_name, date))
+
+    nk_jobs = []
+    for shot_sub, seq, shot in comp_shots:
+        prj = os.path.join(shot_sub, "project")
+        plan.add_dir(shot_sub)
+        plan.add_dir(prj)
+        plan.add_dir(os.path.join(shot_sub, "render"))
+        nk_jobs.append((os.path.join(prj, nuke_script_name(seq, shot)), seq, shot))
+    _add_nuke_scripts(plan, nk_jobs, settings, preview)
+    return plan
+
+
+def _entry_names(path):
+    # Every entry name in `path` with one scandir; empty if it cannot be read
+    try:
+        with os.scandir(path) as it:
+            return {os.path.normcase(entry.name) for entry in it}
+    except OSError:
+        return set()
+
+
+def _merge_sequences(seq_data):
+    """
+    (sequence, [shots]) per distinct stripped sequence name, in first-seen
+    order, with empty and repeated shots dropped: a sequence listed twice
+    is planned once with the shots of both entries.
+    """
+    merged = {}
+    for sd in seq_data:
+        shots = merged.setdefault(sd['sequence'].strip(), {})
+        for sh in sd['shots']:
+            sh = sh.strip()
+            if sh:
+                shots[sh] = None
+    return [(seqnm, list(shots)) for seqnm, shots in merged.items()]
+
+
+@trace.traced("plan.add_to_existing", "plan")
+def plan_add_to_existing(project_folder, checked_folders, seq_data, create_nk_under_comp, settings,
+                         conflict_mode=SKIP_CONFLICTS, comp_flags=None, comp_rule=DEFAULT_COMP_RULE,
+                         preview=False, listing=None):
+    """
+    Plan for the "Add to Existing Project" tab. `checked_folders` are paths
+    relative to `project_folder`. Sequences or shots that already exist are
+    recorded in plan.collisions. With SKIP_CONFLICTS nothing is planned
+    below them; with CREATE_MISSING the missing shots of an existing
+    sequence are still added. Either way the existing shots of an
+    existing sequence are collisions too, so both modes report the same
+    conflicts (worded for the mode). Repeats within `seq_data` are merged
+    first (see _merge_sequences()), so only folders on disk collide.
+
+    `comp_flags` maps checked folders to their comp flag as classified by
+    the scan; folders missing from it are classified with `comp_rule`.
+
+    Each existing target parent is listed once with scandir; the planned
+    names are checked against that listing instead of a stat per name.
+    `listing(parent path)` may supply names already known (e.g. from the
+    scanned project tree) and returns None for a parent it does not know.
+
+    preview=True plans the comp scripts without rendering them; with
+    `listing` it makes the tab's preview skip the disk for scanned folders.
+    """
+    plan = FolderPlan(project_folder)
+    merged = _merge_sequences(seq_data)
+    planned = set()
+    listings = {}
+    nk_jobs = []
+
+    def exists(parent, name):
+        path = os.path.join(parent, name)
+        if path in planned:
+            return True
+        if parent in planned:
+            # Created by this plan => empty
+            return False
+        names = listings.get(parent)
+        if names is None:
+            known = listing(parent) if listing is not None else None
+            if known is None:
+                names = _entry_names(parent)
+            else:
+                names = {os.path.normcase(name) for name in known}
+            listings[parent] = names
+        return os.path.normcase(name) in names
+
+    if conflict_mode == CREATE_MISSING:
+        keep_shot, keep_seq = "leaving it as is", "adding missing shots"
+    else:
+        keep_shot, keep_seq = "skipping", "skipping it and its shots"
+
+    def shot_collision(parent, sh):
+        if not exists(parent, sh):
+            return False
+        plan.add_collision(os.path.join(parent, sh),
+            f"Shot '{sh}' already exists under {parent}, {keep_shot}.")
+        return True
+
+    def add_shot(parent, seqnm, sh, is_comp_folder):
+        shot_folder = os.path.join(parent, sh)
+        if shot_collision(parent, sh):
+            return
+        plan.add_dir(shot_folder)
+        planned.add(shot_folder)
+
+        if is_comp_folder:
+            prj = os.path.join(shot_folder, "project")
+            plan.add_dir(prj)
+            plan.add_dir(os.path.join(shot_folder, "render"))
+            if seqnm:
+                nk_name = nuke_script_name(seqnm, sh)
+            else:
+                nk_name = f"{sh}_comp_v001.nk"
+            nk_jobs.append((os.path.join(prj, nk_name), seqnm, sh))
+
+    for relp in checked_folders:
+        abspath = os.path.join(project_folder, relp)
+        plan.mark_existing(abspath)
+        is_comp_folder = False
+        if create_nk_under_comp:
+            is_comp_folder = comp_flags.get(relp) if comp_flags else None
+            if is_comp_folder is None:
+                is_comp_folder = comp_rule.classify(project_folder, relp)
+
+        for seqnm, shots in merged:
+            if seqnm:
+                seq_folder = os.path.join(abspath, seqnm)
+                if not exists(abspath, seqnm):
+                    plan.add_dir(seq_folder)
+                    planned.add(seq_folder)
+                else:
+                    plan.add_collision(seq_folder,
+                        f"Folder '{seqnm}' already exists under {abspath}, {keep_seq}.")
+                    if conflict_mode != CREATE_MISSING:
+                        # Nothing is added, but its existing shots are reported as well
+                        for sh in shots:
+                            shot_collision(seq_folder, sh)
+                        continue
+                    if seq_folder not in planned:
+                        plan.mark_existing(seq_folder)
+                for sh in shots:
+                    add_shot(seq_folder, seqnm, sh, is_comp_folder)
+            else:
+                # No sequence => only shots
+                for sh in shots:
+                    add_shot(abspath, "", sh, is_comp_folder)
+    _add_nuke_scripts(plan, nk_jobs, settings, preview)
+    return plan
@@ -0,0 +1,60 @@
+# report.py
+"""
+Per-path results of applying a FolderPlan (see core.executor).
+"""
+from collections import namedtuple
+
+from core.syscalls import SyscallCounter
+
+# Result statuses
+CREATED = "created"
+EXISTS = "exists"
+WRITTEN = "written"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+# Outcome of one planned directory or file. `action` is "mkdir", "write",
+# or "open" when a directory could not be entered in dir_fd mode.
+PathResult = namedtuple("PathResult", ["path", "action", "status", "error"])
+
+
+class ExecutionReport(object):
+    """
+    Per-path results of one execute_plan() run, in completion order.
+    """
+    def __init__(self):
+        self.results = []
+        self.syscalls = SyscallCounter()
+
+    def add(self, result):
+        self.results.append(result)
+
+    @property
+    def failed(self):
+        return [r for r in self.results if r.status == FAILED]
+
+    @property
+    def ok(self):
+        return not self.failed
+
+    def count(self, status):
+        return sum(1 for r in self.results if r.status == status)
+
+    def summary(self):
+        counts = {}
+        for r in self.results:
+            counts[r.status] = counts.get(r.status, 0) + 1
+        return counts
+
+    def error_text(self, limit=10):
+        """
+        Human readable list of the first `limit` failures.
+        """
+        failed = self.failed
+        lines = [f"{r.path}: {r.error}" for r in failed[:limit]]
+        if len(failed) > limit:
+            lines.append(f"... and {len(failed) - limit} more")
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return f"ExecutionReport({self.summary()!r})"
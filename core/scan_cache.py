@@ -0,0 +1,110 @@
+# scan_cache.py
+"""
+Persistent cache of directory listings for existing projects.
+
+For every scanned directory the cache keeps its mtime and the names of
+its subdirectories, keyed by project root, in a local SQLite file. A
+directory's mtime changes whenever an entry is added, removed or renamed
+in it, so an unchanged mtime means the cached listing is still valid and
+the directory does not have to be listed again (see core.scanner).
+
+The file lives in the user cache folder; FOLDERSTRUCTURER_SCAN_CACHE
+overrides its path.
+"""
+import json
+import os
+import sqlite3
+
+ENV_VAR = "FOLDERSTRUCTURER_SCAN_CACHE"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (
+    root TEXT NOT NULL,
+    rel TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    names TEXT NOT NULL,
+    PRIMARY KEY (root, rel)
+)
+"""
+
+
+def default_cache_path():
+    if os.environ.get(ENV_VAR):
+        return os.environ[ENV_VAR]
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "folderstructurer", "scan_cache.sqlite3")
+
+
+def _root_key(root, variant):
+    key = os.path.normcase(os.path.abspath(root))
+    return f"{key}|{variant}" if variant else key
+
+
+class ScanCache(object):
+    """
+    SQLite-backed map of (project root, rel dir) => (mtime_ns, [subdir names]).
+    A connection belongs to the thread that opened it, so each scan thread
+    opens its own ScanCache.
+    """
+    def __init__(self, path=None):
+        self.path = path or default_cache_path()
+        self._conn = None
+
+    def open(self):
+        if self._conn is None:
+            folder = os.path.dirname(self.path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(_SCHEMA)
+                conn.commit()
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._conn = conn
+        return self
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def load(self, root, variant=""):
+        """
+        Every cached directory of `root` as {rel: (mtime_ns, names)}.
+        `variant` separates listings made under different prune rules.
+        """
+        rows = self._conn.execute(
+            "SELECT rel, mtime_ns, names FROM dirs WHERE root = ?", (_root_key(root, variant),)
+        )
+        return {rel: (mtime_ns, json.loads(names)) for rel, mtime_ns, names in rows}
+
+    def store(self, root, entries, variant=""):
+        """
+        Save {rel: (mtime_ns, names)} listings of `root` in one transaction.
+        """
+        if not entries:
+            return
+        key = _root_key(root, variant)
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO dirs (root, rel, mtime_ns, names) VALUES (?, ?, ?, ?)",
+                [(key, rel, mtime_ns, json.dumps(names))
+                 for rel, (mtime_ns, names) in entries.items()]
+            )
+
+    def forget(self, root, variant=""):
+        with self._conn:
+            self._conn.execute("DELETE FROM dirs WHERE root = ?", (_root_key(root, variant),))
@@ -0,0 +1,254 @@
+# scanner.py
+"""
+Directory walks over existing folders (templates, existing projects).
+
+scan_levels() is the breadth-first, directories-only walk behind the
+"Add to Existing Project" tree: it never stats files, which matters in
+render folders holding hundreds of thousands of frames, and stops after
+a few levels so deeper folders can be loaded when they are expanded.
+Given the listings of an earlier scan (core.scan_cache) it only lists
+directories whose mtime changed since.
+
+Every walk takes PruneRules, so folders that can never be a destination
+(renders, caches, frame folders) are not descended into. CompRule decides
+which scanned folders count as comp folders (comp scripts are created
+below them).
+"""
+import fnmatch
+import os
+import re
+
+from core import trace
+
+# A folder holding more files than this is a frame/plate folder: not descended
+DEFAULT_MAX_FILES = 500
+
+
+class PruneRules(object):
+    """
+    What a directory walk skips:
+
+      max_depth        folders deeper than this below the root are not listed
+      exclude_globs    folder names matching one of these (fnmatch, case-insensitive)
+      exclude_regexes  "/"-separated relative paths matching one of these (re.search)
+      max_files        stop descending once a folder has more files than this
+
+    Patterns are compiled once, when the rules are created.
+    """
+    __slots__ = ("max_depth", "exclude_globs", "exclude_regexes", "max_files", "_excluded")
+
+    def __init__(self, max_depth=None, exclude_globs=(), exclude_regexes=(), max_files=None):
+        self.max_depth = max_depth
+        self.exclude_globs = tuple(exclude_globs)
+        self.exclude_regexes = tuple(exclude_regexes)
+        self.max_files = max_files
+        parts = [fnmatch.translate(g.lower()) for g in self.exclude_globs]
+        name_re = re.compile("|".join(parts)) if parts else None
+        path_res = [re.compile(r) for r in self.exclude_regexes]
+
+        def excluded(rel, name):
+            if name_re is not None and name_re.match(name.lower()):
+                return True
+            if path_res:
+                rel_posix = rel.replace(os.sep, "/")
+                return any(r.search(rel_posix) for r in path_res)
+            return False
+        self._excluded = excluded
+
+    def excluded(self, rel, name):
+        """
+        True if the folder `name` at relative path `rel` is skipped.
+        """
+        return self._excluded(rel, name)
+
+    def descend(self, rel):
+        """
+        True if the subfolders of `rel` ("" = root) are listed at all.
+        """
+        if self.max_depth is None:
+            return True
+        depth = len(rel.split(os.sep)) if rel else 0
+        return depth < self.max_depth
+
+    def signature(self):
+        # Distinguishes cached listings made under different rules
+        return repr((self.max_depth, self.exclude_globs, self.exclude_regexes, self.max_files))
+
+    def __repr__(self):
+        return (f"PruneRules(max_depth={self.max_depth!r}, exclude_globs={self.exclude_globs!r}, "
+                f"exclude_regexes={self.exclude_regexes!r}, max_files={self.max_files!r})")
+
+
+# Nothing skipped
+NO_PRUNING = PruneRules()
+
+# Templates are replicated as they are; only frame-sized folders are not descended
+TEMPLATE_PRUNE_RULES = PruneRules(max_files=DEFAULT_MAX_FILES)
+
+# Existing projects: hidden, render and cache folders are never destinations
+PROJECT_PRUNE_RULES = PruneRules(
+    exclude_globs=(".*", "render", "renders", "cache", "*_cache", "__pycache__"),
+    max_files=DEFAULT_MAX_FILES,
+)
+
+
+class CompRule(object):
+    """
+    Which folders are comp folders: a folder is one if its name, or the
+    name of any folder above it, matches one of `globs` (fnmatch,
+    case-insensitive). The flag is inherited, so a scan classifies each
+    folder with one match against its own name (below()).
+    """
+    __slots__ = ("globs", "_match")
+
+    def __init__(self, globs=("*comp*",)):
+        self.globs = tuple(globs)
+        parts = [fnmatch.translate(g.lower()) for g in self.globs]
+        name_re = re.compile("|".join(parts)) if parts else None
+        self._match = (lambda name: name_re.match(name.lower()) is not None) if name_re \
+            else (lambda name: False)
+
+    def matches(self, name):
+        return self._match(name)
+
+    def below(self, parent_is_comp, name):
+        """
+        Flag of folder `name` whose parent's flag is `parent_is_comp`.
+        """
+        return parent_is_comp or self._match(name)
+
+    def classify(self, root, rel):
+        """
+        Flag of `rel` ("" = root) below `root`, from its path alone.
+        """
+        if self._match(os.path.basename(os.path.abspath(root))):
+            return True
+        return any(self._match(part) for part in rel.split(os.sep) if part not in ("", os.curdir))
+
+    def __repr__(self):
+        return f"CompRule(globs={self.globs!r})"
+
+
+# Any folder with "comp" in its name (05_comp, comp, COMP_v2, ...)
+DEFAULT_COMP_RULE = CompRule()
+
+
+@trace.traced("scan.template", "scan")
+def read_template_structure(base_path, rules=TEMPLATE_PRUNE_RULES):
+    """
+    Every folder below `base_path` as a "/"-separated relative path,
+    parents before children, minus what `rules` prune.
+    """
+    collected = []
+    for root, dirs, files in os.walk(base_path):
+        rel = os.path.relpath(root, base_path)
+        if rel == ".":
+            rel = ""
+        else:
+            collected.append(rel.replace("\\", "/"))
+        if not rules.descend(rel) or (rules.max_files is not None and len(files) > rules.max_files):
+            dirs[:] = []
+            continue
+        dirs[:] = [d for d in dirs
+                   if not rules.excluded(os.path.join(rel, d) if rel else d, d)]
+    return collected
+
+
+def list_subdirs(path, rules=NO_PRUNING, rel=""):
+    """
+    Sorted names of the directories directly inside `path` ([] if it
+    cannot be read). Symlinks to directories are not followed. Folders
+    excluded by `rules` are left out; a folder with more than
+    rules.max_files files is treated as a leaf, and its listing stops there.
+    """
+    if not rules.descend(rel):
+        return []
+    names = []
+    max_files = rules.max_files
+    files = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    names.append(entry.name)
+                elif max_files is not None:
+                    files += 1
+                    if files > max_files:
+                        return []
+    except OSError:
+        return []
+    names = [n for n in names if not rules.excluded(os.path.join(rel, n) if rel else n, n)]
+    names.sort()
+    return names
+
+
+def _listing(path, rel, known, changed, rules):
+    # Cached names while the directory's mtime is unchanged, else a fresh listing
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return []
+    cached = known.get(rel)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    names = list_subdirs(path, rules, rel)
+    changed[rel] = (mtime_ns, names)
+    return names
+
+
+def scan_levels(root, start_rels=("",), depth=2, should_stop=None, known=None, changed=None,
+                rules=NO_PRUNING):
+    """
+    Breadth-first directory scan below `root`. Yields (rel, names) for
+    every directory visited, starting with each of `start_rels` ("" is the
+    root itself) and going `depth` levels down. `rel` uses os.sep like
+    os.path.relpath; `names` are the sorted subdirectory names. Stops
+    early once should_stop() returns True.
+
+    With `known` ({rel: (mtime_ns, names)}, e.g. ScanCache.load()) each
+    directory costs one stat and is only listed again if its mtime
+    changed; new listings are added to the `changed` dict in the same form.
+    `rules` prune the listings (see PruneRules and list_subdirs).
+    """
+    frontier = list(start_rels)
+    if changed is None:
+        changed = {}
+    for _ in range(depth):
+        next_frontier = []
+        for rel in frontier:
+            if should_stop and should_stop():
+                return
+            path = os.path.join(root, rel) if rel else root
+            if known is None:
+                names = list_subdirs(path, rules, rel)
+            else:
+                names = _listing(path, rel, known, changed, rules)
+            yield rel, names
+            next_frontier.extend(os.path.join(rel, name) if rel else name for name in names)
+        frontier = next_frontier
+        if not frontier:
+            return
+
+
+def cached_levels(known, start_rels=("",), depth=2):
+    """
+    Same walk as scan_levels() over cached listings only, without touching
+    the disk. Stops descending where a directory is not in `known`.
+    """
+    frontier = list(start_rels)
+    for _ in range(depth):
+        next_frontier = []
+        for rel in frontier:
+            cached = known.get(rel)
+            if cached is None:
+                continue
+            names = cached[1]
+            yield rel, names
+            next_frontier.extend(os.path.join(rel, name) if rel else name for name in names)
+        frontier = next_frontier
+        if not frontier:
+            return
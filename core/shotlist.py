@@ -0,0 +1,309 @@
+# shotlist.py
+"""
+Reading sequence/shot lists from files.
+
+Everything here returns the same list of {'sequence': str, 'shots': [...]}
+dicts that SequenceListContainer.get_all_sequences_and_shots() produces.
+
+Supported files: CSV ("sequence,shot" rows), CMX3600 EDLs and Final Cut
+Pro XML (xmeml from FCP 7/Premiere/Resolve, and FCPX .fcpxml). Files are
+parsed as a stream, line by line or element by element, so a long
+editorial file is never held in memory as a whole.
+
+Shot ranges can also be typed as patterns: "SQ[010-030:10]/sh[0010-0500:10]"
+expands to sequences SQ010, SQ020, SQ030 with shots sh0010, sh0020, ...
+sh0500 each (see iter_pattern_shots()).
+"""
+import csv
+import itertools
+import os
+import re
+import xml.etree.ElementTree as ET
+
+# Editorial names like SQ010_SH0010, sq010-0010 or ABC_010_0020 => (sequence, shot)
+SHOT_NAME_RE = re.compile(r"^(?P<sequence>.*?[A-Za-z]*\d+)[_\-. ](?P<shot>[A-Za-z]*\d+[A-Za-z]?)$")
+
+# CMX3600 event line: event number, reel, track, transition, ...
+_EDL_EVENT_RE = re.compile(r"^(\d{3,})\s+(\S+)\s+(\S+)\s+(\S+)")
+_EDL_LOC_RE = re.compile(r"^\*\s*LOC:\s*\S+\s+\S+\s+(\S+)", re.IGNORECASE)
+_EDL_CLIP_RE = re.compile(r"^\*\s*FROM CLIP NAME:\s*(.+)$", re.IGNORECASE)
+
+# FCPX clip elements carrying a shot name in their "name" attribute
+_FCPX_CLIPS = ("asset-clip", "clip", "ref-clip", "sync-clip", "mc-clip")
+
+# "[start-end]" or "[start-end:step]" inside a name pattern; the padding is start's width
+_RANGE_RE = re.compile(r"\[(\d+)-(\d+)(?::(\d+))?\]")
+
+# Most names a single pattern may expand to (guards against typos like [1-999999])
+MAX_PATTERN_NAMES = 100000
+
+
+def group_shots(pairs):
+    """
+    Group (sequence, shot) pairs into sequence dicts, keeping first-seen
+    order. A pair with an empty shot just declares the sequence.
+    """
+    data = []
+    by_seq = {}
+    for seq, shot in pairs:
+        entry = by_seq.get(seq)
+        if entry is None:
+            entry = {'sequence': seq, 'shots': []}
+            by_seq[seq] = entry
+            data.append(entry)
+        if shot:
+            entry['shots'].append(shot)
+    return data
+
+
+def iter_csv_shots(path):
+    """
+    (sequence, shot) pairs from a CSV file with "sequence,shot" rows.
+    A header row naming those columns is optional; rows with a single
+    column are shots without a sequence.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as ff:
+        reader = csv.reader(ff)
+        seq_col, shot_col = 0, 1
+        for i, row in enumerate(reader):
+            row = [c.strip() for c in row]
+            if not any(row):
+                continue
+            lowered = [c.lower() for c in row]
+            if i == 0 and "shot" in lowered:
+                shot_col = lowered.index("shot")
+                seq_col = lowered.index("sequence") if "sequence" in lowered else None
+                continue
+            if len(row) == 1:
+                yield "", row[0]
+                continue
+            seq = row[seq_col] if seq_col is not None and seq_col < len(row) else ""
+            shot = row[shot_col] if shot_col < len(row) else ""
+            yield seq, shot
+
+
+def read_shot_csv(path):
+    return group_shots(iter_csv_shots(path))
+
+
+def split_shot_name(name, pattern=SHOT_NAME_RE):
+    """
+    (sequence, shot) from an editorial clip/locator name; names that do
+    not match `pattern` become shots without a sequence.
+    """
+    name = name.strip()
+    m = pattern.match(name)
+    if m is None:
+        return "", name
+    return m.group("sequence"), m.group("shot")
+
+
+def _unique_shots(names, pattern):
+    # Editorial files repeat a shot per cut and per track; keep the first
+    seen = set()
+    for name in names:
+        if name and name not in seen:
+            seen.add(name)
+            yield split_shot_name(name, pattern)
+
+
+def _iter_edl_names(path):
+    event = None
+    with open(path, encoding="utf-8-sig", errors="replace") as ff:
+        for line in ff:
+            line = line.strip()
+            m = _EDL_EVENT_RE.match(line)
+            if m:
+                if event and event[0]:
+                    yield event[1] or event[2] or event[3]
+                # [video?, locator name, clip name, reel]
+                track = m.group(3).upper()
+                reel = m.group(2)
+                event = [track.startswith("V") or track == "B", "", "",
+                         "" if reel.upper() in ("BL", "AX") else reel]
+                continue
+            if event is None or not line.startswith("*"):
+                continue
+            m = _EDL_LOC_RE.match(line)
+            if m:
+                event[1] = event[1] or m.group(1)
+                continue
+            m = _EDL_CLIP_RE.match(line)
+            if m:
+                event[2] = event[2] or m.group(1).strip()
+    if event and event[0]:
+        yield event[1] or event[2] or event[3]
+
+
+def iter_edl_shots(path, pattern=SHOT_NAME_RE):
+    """
+    (sequence, shot) pairs from a CMX3600 EDL, one per video event in
+    edit order. The shot name comes from the event's locator ("* LOC:"),
+    else its "* FROM CLIP NAME:", else its reel name.
+    """
+    return _unique_shots(_iter_edl_names(path), pattern)
+
+
+def _local(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+def _iter_fcp_xml_names(path):
+    # xmeml: <video><track><clipitem><name>; fcpxml: <spine><asset-clip name=..>
+    in_video = 0
+    in_resources = 0
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        tag = _local(elem.tag)
+        if event == "start":
+            if tag == "video":
+                in_video += 1
+            elif tag == "resources":
+                in_resources += 1
+            continue
+        if tag == "video":
+            in_video -= 1
+        elif tag == "resources":
+            in_resources -= 1
+            elem.clear()
+        elif tag == "clipitem":
+            if in_video:
+                for child in elem:
+                    if _local(child.tag) == "name":
+                        yield (child.text or "").strip()
+                        break
+            elem.clear()
+        elif tag in _FCPX_CLIPS and not in_resources:
+            yield elem.get("name", "").strip()
+            elem.clear()
+
+
+def iter_fcp_xml_shots(path, pattern=SHOT_NAME_RE):
+    """
+    (sequence, shot) pairs from a Final Cut Pro XML file: video clip
+    items of an xmeml sequence, or the clips of an FCPX spine, in the
+    order they appear.
+    """
+    return _unique_shots(_iter_fcp_xml_names(path), pattern)
+
+
+def is_shot_pattern(text):
+    """
+    True if `text` holds a range or several lines, i.e. stands for more
+    than one name.
+    """
+    return "\n" in text.strip() or _RANGE_RE.search(text) is not None
+
+
+def _parse_pattern(pattern):
+    # (literals, [(range, width), ...]), checked but not expanded
+    parts = _RANGE_RE.split(pattern)
+    literals = parts[0::4]
+    if any("[" in lit or "]" in lit for lit in literals):
+        raise ValueError(f"Malformed range in {pattern!r} (expected [start-end] or [start-end:step])")
+    ranges = []
+    for i in range(1, len(parts), 4):
+        start_s, end_s, step_s = parts[i], parts[i + 1], parts[i + 2]
+        start, end, step = int(start_s), int(end_s), int(step_s or 1)
+        if step <= 0 or end < start:
+            raise ValueError(f"Empty range [{start_s}-{end_s}:{step}] in {pattern!r}")
+        ranges.append((range(start, end + 1, step), len(start_s)))
+    return literals, ranges
+
+
+def pattern_size(pattern):
+    """
+    How many names `pattern` stands for, without expanding it.
+    """
+    pattern = pattern.strip()
+    if not pattern:
+        return 1
+    total = 1
+    for numbers, _ in _parse_pattern(pattern)[1]:
+        total *= len(numbers)
+    return total
+
+
+def expand_name_pattern(pattern):
+    """
+    Every name `pattern` stands for, in order. Each "[start-end:step]"
+    range (step defaults to 1) is replaced by zero-padded numbers; several
+    ranges multiply. Raises ValueError for malformed or oversized ranges,
+    before any name is made.
+    """
+    pattern = pattern.strip()
+    literals, ranges = _parse_pattern(pattern)
+    total = 1
+    for numbers, _ in ranges:
+        total *= len(numbers)
+    if total > MAX_PATTERN_NAMES:
+        raise ValueError(f"{pattern!r} expands to more than {MAX_PATTERN_NAMES} names")
+    return _expand(literals, ranges)
+
+
+def _expand(literals, ranges):
+    widths = [width for _, width in ranges]
+    for numbers in itertools.product(*(numbers for numbers, _ in ranges)):
+        out = [literals[0]]
+        for lit, number, width in zip(literals[1:], numbers, widths):
+            out.append(str(number).zfill(width))
+            out.append(lit)
+        yield "".join(out)
+
+
+def iter_pattern_shots(pattern):
+    """
+    (sequence, shot) pairs from "SEQ_PATTERN/SHOT_PATTERN"; without "/"
+    the pattern only makes shots (no sequence). A trailing "/" makes
+    sequences without shots.
+    """
+    seq_pattern, sep, shot_pattern = pattern.strip().rpartition("/")
+    if not sep:
+        seq_pattern, shot_pattern = "", pattern
+    if pattern_size(seq_pattern) * pattern_size(shot_pattern) > MAX_PATTERN_NAMES:
+        raise ValueError(f"{pattern!r} expands to more than {MAX_PATTERN_NAMES} shots")
+    seqs = list(expand_name_pattern(seq_pattern)) if seq_pattern.strip() else [""]
+    shots = list(expand_name_pattern(shot_pattern)) if shot_pattern.strip() else [""]
+    for seq in seqs:
+        for shot in shots:
+            yield seq, shot
+
+
+def iter_pasted_shots(text):
+    """
+    (sequence, shot) pairs from pasted text, one entry per line: a shot
+    name, "sequence/shot", "sequence,shot" or "sequence<TAB>shot" (as
+    copied from a spreadsheet), each of which may be a pattern.
+    """
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        for sep in ("\t", ","):
+            if sep in line:
+                seq, _, shot = line.partition(sep)
+                line = f"{seq.strip()}/{shot.strip()}"
+                break
+        yield from iter_pattern_shots(line)
+
+
+# File extension => (sequence, shot) reader; anything else is read as CSV
+SHOT_LIST_READERS = {
+    ".csv": iter_csv_shots,
+    ".edl": iter_edl_shots,
+    ".xml": iter_fcp_xml_shots,
+    ".fcpxml": iter_fcp_xml_shots,
+}
+
+
+def read_shot_list(path):
+    """
+    Sequence dicts from an EDL, FCP XML or CSV file, chosen by extension.
+    Raises ValueError for unparsable XML, OSError if the file cannot be
+    read.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    reader = SHOT_LIST_READERS.get(ext, iter_csv_shots)
+    try:
+        return group_shots(reader(path))
+    except ET.ParseError as e:
+        raise ValueError(f"Cannot parse {os.path.basename(path)!r}: {e}")
@@ -0,0 +1,59 @@
+# syscalls.py
+"""
+Syscall accounting for plan execution.
+
+SyscallCounter tallies the filesystem calls an executor issues.
+legacy_syscall_estimate() models what the old per-path os.makedirs(...,
+exist_ok=True) code issued for the same plan, so the two can be compared.
+"""
+import threading
+
+
+class SyscallCounter(object):
+    """
+    Counts filesystem calls by name ("mkdir", "open", "write", "close", "stat").
+    Safe to share between executor worker threads.
+    """
+    def __init__(self):
+        self.counts = {}
+        self._lock = threading.Lock()
+
+    def add(self, name, n=1):
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + n
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+    def __repr__(self):
+        return f"SyscallCounter(total={self.total}, {self.counts!r})"
+
+
+def legacy_syscall_estimate(plan):
+    """
+    Syscalls the old creation code used for `plan`.
+
+    Each FolderPlan.add_dir() call stands for one os.makedirs(path,
+    exist_ok=True). For a path whose parent exists that is a stat of the
+    parent plus a mkdir; when the path already exists the failed mkdir is
+    followed by an isdir stat. Files cost open/write/close, plus an isfile
+    stat for files that must not be overwritten.
+    """
+    counter = SyscallCounter()
+    stack = list(plan.tree.children.values())
+    while stack:
+        node = stack.pop()
+        stack.extend(node.children.values())
+        if node.exists and not node.requests:
+            continue
+        repeats = max(node.requests - 1, 0)
+        counter.add("stat", 1 + 2 * repeats)
+        counter.add("mkdir", 1 + repeats)
+    for planned_file in plan.files:
+        if not planned_file.overwrite:
+            counter.add("stat")
+        counter.add("open")
+        counter.add("write")
+        counter.add("close")
+    return counter
@@ -0,0 +1,209 @@
+# template.py
+"""
+Compiled folder templates for the "Template" creation mode.
+
+The template folders (read by core.scanner.read_template_structure) are
+compiled once into a tree of segments. A segment is either literal or
+holds placeholders:
+
+    [sequence] [shot]   the sequence / shot being created
+    [show]              the show folder name
+    [date]              today, YYYY-MM-DD
+    [version]           the first version, v001
+
+at any depth, e.g. "04_vfx/[sequence]/[sequence]_[shot]/plates". A
+segment that brings in [sequence] or [shot] is repeated per sequence or
+per shot. Every subtree with no such repetition below it is flattened
+into a prebuilt fragment of relative paths: at the top it is emitted
+once, below a repeated segment it is cloned per sequence/shot by joining
+the fragment onto the new base, with no walk and no string replacement
+for literal paths. Comp folders (by a core.scanner.CompRule on the
+segment name, default "comp*") get [sequence]/[shot]/(project,render),
+leaving out the levels a parent segment already stands for.
+"""
+import datetime
+import functools
+import os
+import re
+
+from core.scanner import CompRule
+
+PLACEHOLDERS = ("sequence", "shot", "show", "date", "version")
+
+# Placeholders that repeat a segment; the others have one value per expansion
+_LOOP_KEYS = frozenset(("sequence", "shot"))
+
+_PLACEHOLDER_RE = re.compile(r"\[(" + "|".join(PLACEHOLDERS) + r")\]")
+
+# Template folders whose name starts with "comp" get the per-shot comp layout
+TEMPLATE_COMP_RULE = CompRule(("comp*",))
+
+DEFAULT_VERSION = "v001"
+
+
+def template_values(show_name, date=None, version=DEFAULT_VERSION):
+    """
+    Values of the placeholders that do not change per sequence/shot.
+    """
+    return {
+        "show": show_name,
+        "date": f"{date or datetime.date.today():%Y-%m-%d}",
+        "version": version,
+    }
+
+
+def _compile_name(name):
+    # (format string, placeholder keys); braces of literal text are escaped
+    keys = frozenset(_PLACEHOLDER_RE.findall(name))
+    fmt = name.replace("{", "{{").replace("}", "}}")
+    if keys:
+        fmt = _PLACEHOLDER_RE.sub(lambda m: "{" + m.group(1) + "}", fmt)
+    return fmt, keys
+
+
+class TemplateNode(object):
+    """
+    One template folder. `loops` are the placeholders it repeats over
+    (those not already bound by a parent). `fragment` is set when nothing
+    below it repeats or is a comp folder: (parent position, name, format
+    string, needs formatting) for every folder of its subtree, parents
+    first, position -1 being this node (see FolderPlan.add_fragment()).
+    `literal_fragment` is the same as (parent position, name) pairs when
+    no name in it needs formatting.
+    """
+    __slots__ = ("name", "fmt", "keys", "bound", "loops", "is_comp", "children",
+                 "fragment", "literal_fragment")
+
+    def __init__(self, name, parent_bound=frozenset(), comp_rule=TEMPLATE_COMP_RULE):
+        self.name = name
+        self.fmt, self.keys = _compile_name(name)
+        loop_keys = self.keys & _LOOP_KEYS
+        self.loops = loop_keys - parent_bound
+        self.bound = parent_bound | loop_keys
+        self.is_comp = bool(name) and comp_rule.matches(name)
+        self.children = {}
+        self.fragment = None
+        self.literal_fragment = None
+
+    def render(self, values):
+        return self.fmt.format_map(values) if self.keys else self.name
+
+    def _finish(self):
+        """
+        Build the fragments bottom-up. Returns True if this subtree is
+        flat (no repeated segment or comp folder below this node).
+        """
+        flat = True
+        for child in self.children.values():
+            child_flat = child._finish()
+            flat = flat and child_flat and not child.loops and not child.is_comp
+        if flat:
+            fragment = []
+            for child in self.children.values():
+                pos = len(fragment)
+                fragment.append((-1, child.name, child.fmt, bool(child.keys)))
+                fragment.extend((pos if parent_pos < 0 else pos + 1 + parent_pos, name, fmt, keyed)
+                                for parent_pos, name, fmt, keyed in child.fragment)
+            self.fragment = fragment
+            if not any(keyed for _, _, _, keyed in fragment):
+                self.literal_fragment = [(parent_pos, name) for parent_pos, name, _, _ in fragment]
+        return flat
+
+
+class CompiledTemplate(object):
+    """
+    A template folder list compiled into TemplateNodes; expand() adds the
+    folders of one show to a FolderPlan.
+    """
+    def __init__(self, template_paths, comp_rule=TEMPLATE_COMP_RULE):
+        self.root = TemplateNode("", comp_rule=comp_rule)
+        for rel_path in template_paths:
+            node = self.root
+            for seg in rel_path.split("/"):
+                if not seg:
+                    continue
+                child = node.children.get(seg)
+                if child is None:
+                    child = node.children[seg] = TemplateNode(seg, node.bound, comp_rule)
+                node = child
+        self.root._finish()
+
+    def expand(self, plan, show_root, seq_shots, values):
+        """
+        Add the template's folders below `show_root` for `seq_shots` to
+        `plan`. Returns a (shot folder, sequence, shot) per shot below
+        each comp folder.
+        """
+        comp_shots = []
+        ctx = dict(values)
+        ctx["sequence"] = ctx["shot"] = ""
+        self._walk(plan, self.root, show_root, ctx, None, seq_shots, comp_shots)
+        return comp_shots
+
+    def _walk(self, plan, node, path, ctx, seq_info, seq_shots, comp_shots):
+        for child in node.children.values():
+            if not child.loops:
+                self._emit(plan, child, path, ctx, seq_info, seq_shots, comp_shots)
+                continue
+            for sub_info, shot in _repeats(child.loops, seq_info, seq_shots):
+                sub_ctx = dict(ctx)
+                sub_ctx["sequence"] = sub_info['sequence']
+                if shot is not None:
+                    sub_ctx["shot"] = shot
+                self._emit(plan, child, path, sub_ctx, sub_info, seq_shots, comp_shots)
+
+    def _emit(self, plan, node, parent_path, ctx, seq_info, seq_shots, comp_shots):
+        name = node.render(ctx)
+        # An empty segment ([sequence] of shots without a sequence) is skipped
+        path = os.path.join(parent_path, name) if name else parent_path
+        if node.is_comp:
+            # [sequence]/[shot] below the comp folder, minus what its parents already are
+            seq_level = "sequence" not in node.bound
+            shot_level = "shot" not in node.bound
+            for sub_info, shot in _repeats(_LOOP_KEYS, seq_info, seq_shots, ctx["shot"] or None):
+                seq = sub_info['sequence']
+                shot_sub = path
+                if seq_level:
+                    shot_sub = os.path.join(shot_sub, seq)
+                if shot_level:
+                    shot_sub = os.path.join(shot_sub, shot)
+                comp_shots.append((shot_sub, seq, shot))
+        if node.literal_fragment is not None:
+            # Flat subtree => clone the prebuilt fragment onto this folder
+            plan.add_fragment(path, node.literal_fragment)
+        elif node.fragment is not None:
+            plan.add_fragment(path, [(parent_pos, fmt.format_map(ctx) if keyed else name)
+                                     for parent_pos, name, fmt, keyed in node.fragment])
+        else:
+            plan.add_dir(path)
+            self._walk(plan, node, path, ctx, seq_info, seq_shots, comp_shots)
+
+
+def _repeats(loops, seq_info, seq_shots, only_shot=None):
+    """
+    (sequence dict, shot or None) for each repetition of a segment: per
+    sequence for [sequence], per shot for [shot]. Within an already
+    bound sequence (seq_info), only its shots.
+    """
+    infos = [seq_info] if seq_info is not None else seq_shots
+    if "shot" not in loops:
+        for info in infos:
+            yield info, None
+        return
+    for info in infos:
+        for shot in info['shots']:
+            if only_shot is None or shot == only_shot:
+                yield info, shot
+
+
+@functools.lru_cache(maxsize=8)
+def _compiled(template_paths, comp_rule):
+    return CompiledTemplate(template_paths, comp_rule)
+
+
+def compile_template(template_paths, comp_rule=TEMPLATE_COMP_RULE):
+    """
+    CompiledTemplate for `template_paths`, compiled once and reused while
+    the same template (and rule) is in use.
+    """
+    return _compiled(tuple(template_paths), comp_rule)
@@ -0,0 +1,184 @@
+# trace.py
+"""
+Timed spans and counters for the scan, plan, mkdir, write and preview
+phases, exported as a Chrome trace (open it in chrome://tracing or
+https://ui.perfetto.dev).
+
+Tracing is off unless FOLDERSTRUCTURER_TRACE is set to an output path,
+e.g.
+
+    FOLDERSTRUCTURER_TRACE=/tmp/fs_trace.json python main.py
+
+The trace is written there when the process exits. When off, span()
+returns a shared no-op context manager and traced() functions only
+check whether a tracer is active, so the instrumentation costs next to
+nothing. enable() can also be called at runtime (benchmarks, tests).
+
+    with trace.span("plan.hardcoded", shots=120) as sp:
+        ...
+        sp.set(directories=len(plan.directories))
+    trace.counter("execute", dirs_created=10, bytes_written=2048)
+"""
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+ENV_VAR = "FOLDERSTRUCTURER_TRACE"
+
+_tracer = None
+
+
+class _NullSpan(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer(object):
+    """
+    Collects Chrome trace events from any thread.
+    """
+    def __init__(self, path=None):
+        self.path = path
+        self.pid = os.getpid()
+        self._origin = time.perf_counter()
+        self._events = []
+        self._lock = threading.Lock()
+
+    def now_us(self):
+        return (time.perf_counter() - self._origin) * 1e6
+
+    def add(self, event):
+        event.setdefault("pid", self.pid)
+        event.setdefault("tid", threading.get_ident())
+        with self._lock:
+            self._events.append(event)
+
+    def events(self):
+        with self._lock:
+            return list(self._events)
+
+    def export(self, path=None):
+        path = path or self.path
+        data = {"traceEvents": self.events(), "displayTimeUnit": "ms"}
+        with open(path, "w", encoding="utf-8") as ff:
+            json.dump(data, ff)
+        return path
+
+
+class _Span(object):
+    __slots__ = ("_tracer", "_name", "_cat", "_args", "_start")
+
+    def __init__(self, tracer, name, cat, args):
+        self._tracer = tracer
+        self._name = name
+        self._cat = cat
+        self._args = args
+
+    def __enter__(self):
+        self._start = self._tracer.now_us()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self._args["error"] = exc_type.__name__
+        tracer = self._tracer
+        tracer.add({
+            "name": self._name, "cat": self._cat, "ph": "X",
+            "ts": self._start, "dur": tracer.now_us() - self._start,
+            "args": self._args,
+        })
+        return False
+
+    def set(self, **args):
+        self._args.update(args)
+
+
+def enabled():
+    return _tracer is not None
+
+
+def enable(path=None):
+    """
+    Start collecting events; they are exported to `path` at exit if given.
+    """
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(path)
+        if path:
+            atexit.register(_export_at_exit)
+    return _tracer
+
+
+def disable():
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def _export_at_exit():
+    if _tracer is not None and _tracer.path:
+        try:
+            _tracer.export()
+        except OSError:
+            pass
+
+
+def span(name, cat="app", **args):
+    """
+    Context manager timing the enclosed block as one complete event.
+    """
+    if _tracer is None:
+        return _NULL_SPAN
+    return _Span(_tracer, name, cat, args)
+
+
+def counter(name, **values):
+    """
+    Record counter values (numbers) at the current time.
+    """
+    if _tracer is None:
+        return
+    _tracer.add({"name": name, "ph": "C", "ts": _tracer.now_us(), "args": values})
+
+
+def instant(name, cat="app", **args):
+    if _tracer is None:
+        return
+    _tracer.add({"name": name, "cat": cat, "ph": "i", "s": "t",
+                 "ts": _tracer.now_us(), "args": args})
+
+
+def traced(name, cat="app"):
+    """
+    Decorator wrapping every call in a span while tracing is enabled. The
+    tracer is looked up per call, so enable() after import works too;
+    with tracing off a call costs one global lookup.
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            with _Span(tracer, name, cat, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+if os.environ.get(ENV_VAR):
+    enable(os.environ[ENV_VAR])
@@ -0,0 +1,132 @@
+# validation.py
+"""
+Checks sequence and shot names before anything is planned or created.
+
+A name must be usable as a folder on every share the shows live on
+(Windows/SMB included): no illegal characters, no trailing dot, no
+reserved device name, at most MAX_NAME_LENGTH characters. Within a list
+(the sequences, or the shots of one sequence) names must be unique, also
+case-insensitively, since "sh010" and "SH010" are the same folder on
+SMB and macOS volumes.
+
+The rules are compiled once at import and check_name() is memoized, so
+revalidating a long list after one edit only really checks the edited
+name; duplicates are found with one dict lookup per name.
+"""
+import functools
+import re
+from collections import namedtuple
+
+# Same limit as the name editors
+MAX_NAME_LENGTH = 25
+
+# Characters Windows/SMB refuse in a file name, plus the path separators
+_ILLEGAL_CHARS_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
+# Device names Windows reserves, with or without an extension ("CON", "nul.txt")
+_RESERVED_RE = re.compile(r"^(CON|PRN|AUX|NUL|COM[0-9]|LPT[0-9])(\..*)?$", re.IGNORECASE)
+
+# One problem with one name; `shot` is None for a problem with the sequence name
+NameIssue = namedtuple("NameIssue", ["sequence", "shot", "message"])
+
+
+@functools.lru_cache(maxsize=65536)
+def check_name(name):
+    """
+    What is wrong with `name` as a folder name, or None if nothing.
+    """
+    if name in (".", ".."):
+        return f"'{name}' is not a valid folder name"
+    m = _ILLEGAL_CHARS_RE.search(name)
+    if m:
+        ch = m.group(0)
+        shown = repr(ch) if ch.isprintable() else f"\\x{ord(ch):02x}"
+        return f"'{name}' contains the illegal character {shown}"
+    if name.endswith("."):
+        return f"'{name}' ends with a dot"
+    if name != name.strip():
+        return f"'{name}' starts or ends with a space"
+    if _RESERVED_RE.match(name):
+        return f"'{name}' is a reserved name on Windows"
+    if len(name) > MAX_NAME_LENGTH:
+        return f"'{name}' is longer than {MAX_NAME_LENGTH} characters"
+    return None
+
+
+def check_names(names, allow_repeats=False):
+    """
+    {position: message} for the names of one list (sequence names, or
+    the shots of one sequence) that break a rule or repeat an earlier
+    name, exactly or only in case. Empty names are skipped. With
+    allow_repeats=True exact repeats pass (two rows of one sequence).
+    """
+    problems = {}
+    seen = {}
+    for pos, name in enumerate(names):
+        if not name:
+            continue
+        message = check_name(name)
+        if message is None:
+            key = name.casefold()
+            first = seen.get(key)
+            if first is None:
+                seen[key] = name
+            elif first == name:
+                if not allow_repeats:
+                    message = f"'{name}' is listed more than once"
+            else:
+                message = f"'{name}' differs only in case from '{first}'"
+        if message is not None:
+            problems[pos] = message
+    return problems
+
+
+def validate_sequences(seq_shots):
+    """
+    Every NameIssue in a list of {'sequence': str, 'shots': [...]} dicts,
+    sequences first. Shots are compared within their sequence; two
+    entries with the same sequence name count as one sequence.
+    """
+    issues = []
+    names = [sd['sequence'] for sd in seq_shots]
+    for pos, message in sorted(check_names(names, allow_repeats=True).items()):
+        issues.append(NameIssue(names[pos], None, message))
+    shots_by_seq = {}
+    for sd in seq_shots:
+        shots_by_seq.setdefault(sd['sequence'].casefold(), (sd['sequence'], []))[1].extend(sd['shots'])
+    for seq, shots in shots_by_seq.values():
+        for pos, message in sorted(check_names(shots).items()):
+            issues.append(NameIssue(seq, shots[pos], message))
+    return issues
+
+
+def drop_invalid_names(seq_shots):
+    """
+    `seq_shots` without the sequences (with their shots) and shots whose
+    name fails check_name(), e.g. to preview a list that is still being
+    typed. Repeats are kept; an empty sequence name stays (loose shots).
+    """
+    kept = []
+    for sd in seq_shots:
+        if sd['sequence'] and check_name(sd['sequence']):
+            continue
+        shots = [sh for sh in sd['shots'] if not check_name(sh)]
+        kept.append({'sequence': sd['sequence'], 'shots': shots})
+    return kept
+
+
+def format_issue(issue):
+    if issue.shot is None:
+        return f"Sequence {issue.message}"
+    where = f" in sequence '{issue.sequence}'" if issue.sequence else ""
+    return f"Shot {issue.message}{where}"
+
+
+def format_issues(issues, limit=20):
+    """
+    One line per issue, at most `limit` of them plus a count of the rest.
+    """
+    lines = [format_issue(issue) for issue in issues[:limit]]
+    if len(issues) > limit:
+        lines.append(f"... and {len(issues) - limit} more")
+    return "\n".join(lines)
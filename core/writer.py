@@ -0,0 +1,195 @@
+# writer.py
+"""
+Atomic comp script writer.
+
+ScriptWriter takes PlannedFiles from a bounded queue and writes them with
+a small pool of worker threads, so script writes overlap with directory
+creation. Every file is written to a hidden temp file next to its target
+and renamed into place, so a crash or a full disk never leaves a
+half-written script under the final name. With fsync=True the workers
+flush their temp files in batches before renaming them.
+"""
+import os
+import queue
+import threading
+import uuid
+
+from core import trace
+from core.report import EXISTS, WRITTEN, FAILED, PathResult
+
+# Writer threads used by the GUI
+DEFAULT_WRITER_WORKERS = 4
+
+# Files a worker stages before one fsync pass when fsync=True
+DEFAULT_FSYNC_BATCH = 32
+
+# Flags for planned files: overwrite => truncate, otherwise fail if present
+WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+CREATE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def file_bytes(planned_file):
+    data = planned_file.content
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return data
+
+
+def write_all(fd, data, counter):
+    view = memoryview(data)
+    while view:
+        counter.add("write")
+        view = view[os.write(fd, view):]
+
+
+class ScriptWriter(object):
+    """
+    Bounded pool of writer threads. submit() blocks once the queue is full;
+    drain() returns the PathResults finished so far and close() waits for
+    the rest. Syscalls are tallied on the shared `counter`.
+    """
+    def __init__(self, counter, max_workers=DEFAULT_WRITER_WORKERS, fsync=False,
+                 fsync_batch=DEFAULT_FSYNC_BATCH):
+        self._counter = counter
+        self._fsync = fsync
+        self._batch_size = fsync_batch if fsync else 1
+        self._queue = queue.Queue(maxsize=max_workers * 64)
+        self._results = queue.Queue()
+        self._threads = []
+        for _ in range(max_workers):
+            thread = threading.Thread(target=self._run, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, planned_file):
+        self._queue.put(planned_file)
+
+    def drain(self):
+        results = []
+        while True:
+            try:
+                results.append(self._results.get_nowait())
+            except queue.Empty:
+                return results
+
+    def close(self):
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        return self.drain()
+
+    def _run(self):
+        batch = []
+        while True:
+            planned_file = self._queue.get()
+            if planned_file is None:
+                break
+            staged = self._stage(planned_file)
+            if staged:
+                batch.append(staged)
+                if len(batch) >= self._batch_size:
+                    self._commit(batch)
+                    batch = []
+        self._commit(batch)
+
+    def _stage(self, planned_file):
+        """
+        Write the data to a temp file; returns (planned_file, tmp, fd).
+        """
+        counter = self._counter
+        head, tail = os.path.split(planned_file.path)
+        tmp = os.path.join(head, f".{tail}.{uuid.uuid4().hex[:12]}.tmp")
+        counter.add("open")
+        try:
+            fd = os.open(tmp, CREATE_FLAGS, 0o666)
+        except OSError as e:
+            self._results.put(PathResult(planned_file.path, "write", FAILED, e))
+            return None
+        try:
+            write_all(fd, file_bytes(planned_file), counter)
+        except OSError as e:
+            self._discard(tmp, fd)
+            self._results.put(PathResult(planned_file.path, "write", FAILED, e))
+            return None
+        return planned_file, tmp, fd
+
+    def _discard(self, tmp, fd):
+        self._counter.add("close")
+        os.close(fd)
+        self._remove(tmp)
+
+    def _commit(self, batch):
+        if not batch:
+            return
+        with trace.span("write.batch", "io", files=len(batch), fsync=self._fsync):
+            self._commit_batch(batch)
+
+    def _commit_batch(self, batch):
+        counter = self._counter
+        for planned_file, tmp, fd in batch:
+            try:
+                if self._fsync:
+                    counter.add("fsync")
+                    os.fsync(fd)
+            except OSError as e:
+                self._discard(tmp, fd)
+                self._results.put(PathResult(planned_file.path, "write", FAILED, e))
+                continue
+            counter.add("close")
+            os.close(fd)
+            self._results.put(self._publish(planned_file, tmp))
+        if self._fsync and hasattr(os, "O_DIRECTORY"):
+            # Make the renames durable too, once per directory
+            for head in {os.path.dirname(planned_file.path) for planned_file, _, _ in batch}:
+                counter.add("open")
+                try:
+                    dir_fd = os.open(head, os.O_RDONLY | os.O_DIRECTORY)
+                except OSError:
+                    continue
+                try:
+                    counter.add("fsync")
+                    os.fsync(dir_fd)
+                except OSError:
+                    pass
+                finally:
+                    counter.add("close")
+                    os.close(dir_fd)
+
+    def _remove(self, tmp):
+        self._counter.add("unlink")
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+    def _publish(self, planned_file, tmp):
+        counter = self._counter
+        path = planned_file.path
+        try:
+            if planned_file.overwrite:
+                counter.add("rename")
+                os.replace(tmp, path)
+                return PathResult(path, "write", WRITTEN, None)
+
+            # link() fails instead of replacing an existing file
+            counter.add("link")
+            try:
+                os.link(tmp, path)
+            except FileExistsError:
+                self._remove(tmp)
+                return PathResult(path, "write", EXISTS, None)
+            except OSError:
+                # No hard links on this share => checked rename instead
+                counter.add("stat")
+                if os.path.exists(path):
+                    self._remove(tmp)
+                    return PathResult(path, "write", EXISTS, None)
+                counter.add("rename")
+                os.replace(tmp, path)
+                return PathResult(path, "write", WRITTEN, None)
+            self._remove(tmp)
+            return PathResult(path, "write", WRITTEN, None)
+        except OSError as e:
+            self._remove(tmp)
+            return PathResult(path, "write", FAILED, e)
@@ -0,0 +1,116 @@
+# main_window.py
+from PyQt5.QtWidgets import QMainWindow, QTabWidget, QWidget
+
+from common import nuke_template
+from common.preview_scheduler import PreviewScheduler
+from core.config import DEFAULT_FOLDER_NAMES
+
+# The Structure tab is visible at startup; the other tabs (and their
+# modules) are only loaded when first activated.
+from tabs.structure_tab import StructureTab
+
+
+def _build_folder_names_tab(main_window):
+    from tabs.folder_names_tab import FolderNamesTab
+    return FolderNamesTab(main_window)
+
+
+def _build_add_to_existing_project_tab(main_window):
+    from tabs.add_to_existing_project_tab import AddToExistingProjectTab
+    return AddToExistingProjectTab(main_window)
+
+
+class MainWindow(QMainWindow):
+    # (attribute, tab label, builder) in tab order
+    TABS = [
+        ("structure_tab", "Structure", StructureTab),
+        ("folder_names_tab", "Folder Names", _build_folder_names_tab),
+        ("add_to_existing_project_tab", "Add to Existing Project", _build_add_to_existing_project_tab),
+    ]
+
+    def __init__(self, profile=None):
+        super().__init__()
+        self.profile = profile
+        self.setWindowTitle("My Project Manager")
+        self.resize(900,600)
+        
+        # Hardcoded config used by Tab2 and Tab1 folder creation:
+        self.folder_config = dict(DEFAULT_FOLDER_NAMES)
+        
+        # The TabWidget, with an empty placeholder page per tab
+        self.tab_widget = QTabWidget()
+        self.setCentralWidget(self.tab_widget)
+        for attr, label, _ in self.TABS:
+            setattr(self, attr, None)
+            self.tab_widget.addTab(QWidget(), label)
+        
+        # Previews are rebuilt when edits pause, and only on the visible tab
+        self.preview_scheduler = PreviewScheduler(self.is_tab_visible, parent=self)
+        self.preview_scheduler.add("structure_tab", self._refresh_structure_preview)
+        self.preview_scheduler.add("add_to_existing_project_tab", self._refresh_add_to_existing_preview)
+        
+        self.ensure_tab(0)
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
+
+    def ensure_tab(self, index):
+        """
+        Build the tab at `index` on first activation, replacing its placeholder.
+        """
+        if index < 0:
+            return None
+        attr, label, builder = self.TABS[index]
+        tab = getattr(self, attr)
+        if tab is not None:
+            return tab
+        
+        tab = builder(self)
+        setattr(self, attr, tab)
+        self.preview_scheduler.mark_dirty(attr)
+        
+        placeholder = self.tab_widget.widget(index)
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, tab, label)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+        
+        if self.profile:
+            self.profile.mark(f"build {label} tab")
+        return tab
+
+    def on_tab_changed(self, index):
+        self.ensure_tab(index)
+        # A tab that went dirty while hidden is rebuilt as soon as it is shown
+        self.preview_scheduler.refresh_visible()
+    
+    def is_tab_visible(self, attr):
+        tab = getattr(self, attr)
+        return tab is not None and self.tab_widget.currentWidget() is tab
+    
+    def _refresh_structure_preview(self):
+        if self.structure_tab is not None:
+            self.structure_tab.update_preview()
+    
+    def _refresh_add_to_existing_preview(self):
+        if self.add_to_existing_project_tab is not None:
+            self.add_to_existing_project_tab.update_preview_tab3()
+    
+    def update_preview(self, *args):
+        # Called by textChanged signals in Shots/Sequences: marks the Tab1
+        # and Tab3 previews dirty, the visible one is rebuilt once typing pauses
+        self.preview_scheduler.mark_dirty()
+    
+    def schedule_preview(self, attr):
+        # Same for a single tab
+        self.preview_scheduler.mark_dirty(attr)
+    
+    def build_nuke_script_template(
+        self, seq_name, shot_name, fps, width, height, resolution_label, 
+        use_proxy, use_aces
+    ):
+        # Compiled once per settings combination, see common.nuke_template
+        template = nuke_template.compile_nuke_template(
+            fps, width, height, resolution_label, use_proxy, use_aces
+        )
+        return template.render(seq_name, shot_name).decode("utf-8")
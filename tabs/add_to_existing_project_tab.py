@@ -2,34 +2,56 @@
 import os
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QLineEdit,
-    QPushButton, QCheckBox, QComboBox, QSpinBox, QTreeWidget, QTreeWidgetItem,
-    QScrollArea, QMessageBox, QFileDialog, QGroupBox
+    QPushButton, QCheckBox, QComboBox, QSpinBox, QTreeWidget, QTreeWidgetItem, QTreeView,
+    QMessageBox, QFileDialog, QGroupBox
 )
 from PyQt5.QtCore import Qt
 from widgets.shot_sequence_widgets import SequenceListContainer
+from common.project_scanner import ProjectScanThread
+from widgets.plan_tree_model import PlanTreeModel
+from core import trace
+from core.config import NukeSettings, RES_PRESETS, KNOWN_FPS
+from core.scanner import PROJECT_PRUNE_RULES, DEFAULT_COMP_RULE
+from core.planner import plan_add_to_existing, SKIP_CONFLICTS, CREATE_MISSING
+from core.executor import execute_plan, DEFAULT_MAX_WORKERS
+from core.writer import DEFAULT_WRITER_WORKERS
+from core.validation import validate_sequences, format_issues, drop_invalid_names
 
 class AddToExistingProjectTab(QWidget):
     """
     Revised layout:
       [Left]   => QTreeWidget of the existing project (check a folder to add)
       [Center] => Add Sequences / Shots
-      [Right]  => Preview QTreeWidget showing final structure of selected folders + new sequences/shots
+      [Right]  => Preview QTreeView (PlanTreeModel) of the selected folders + new sequences/shots
     """
+    # Levels of the project scanned up front; deeper folders load on expand
+    INITIAL_SCAN_DEPTH = 2
+    
+    # Folders left out of the tree (renders, caches, frame folders)
+    PRUNE_RULES = PROJECT_PRUNE_RULES
+    
+    # Which folders get comp scripts; classified once per item as it is scanned
+    COMP_RULE = DEFAULT_COMP_RULE
+    COMP_ROLE = Qt.UserRole + 1
+    
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
         
-        self.res_presets = {
-            "HD 1920x1080": (1920,1080,"HD_1080"),
-            "UHD_4K 3840x2160": (3840,2160,"UHD_4K"),
-            "4K_Super_35 4096x3112": (4096,3112,"4K_Super_35"),
-            "4K_DCP 4096x2160": (4096,2160,"4K_DCP"),
-            "4K_square 4096x4096": (4096,4096,"4K_square"),
-            "4K_Sphere 4000x4000": (4000,4000,"4K_Sphere"),
-            "8K_Sphere 8000x8000": (8000,8000,"8K_Sphere"),
-            "10K_Sphere 10000x10000": (10000,10000,"10K_Sphere"),
-            "12K_Sphere 12000x12000": (12000,12000,"12K_Sphere")
-        }
+        self.res_presets = RES_PRESETS
+        
+        # Background scans of the existing project (see populate_existing_tree)
+        self._scan_root = ""
+        self._root_is_comp = False
+        self._scan_generation = 0
+        self._scan_threads = []
+        self._requested_dirs = set()
+        # rel path => QTreeWidgetItem of every folder loaded in tree_existing
+        self._items_by_rel = {}
+        # rel path => subfolder names of every folder the scan listed
+        self._listings = {}
+        # rel paths of the checked folders, kept up to date from itemChanged
+        self._checked = set()
         
         self.init_ui()
     
@@ -59,8 +81,7 @@ class AddToExistingProjectTab(QWidget):
         
         lbl_fps = QLabel("FPS:")
         self.combo_fps = QComboBox()
-        known_fps = ["23.976","24","25","29.97","30","50","59.94","60","120"]
-        for ff in known_fps:
+        for ff in KNOWN_FPS:
             self.combo_fps.addItem(ff)
         
         self.chk_proxy = QCheckBox("Enable Proxy Workflow")
@@ -124,10 +145,12 @@ class AddToExistingProjectTab(QWidget):
         # Start with one sequence by default
         self.seq_container.add_sequence()
         
-        scroll_seq = QScrollArea()
-        scroll_seq.setWidgetResizable(True)
-        scroll_seq.setWidget(self.seq_container)
-        seq_box_layout.addWidget(scroll_seq)
+        self.btn_import_shots = QPushButton("Import Shot List...")
+        self.btn_import_shots.setToolTip("Load sequences/shots from a CSV, EDL or FCP XML file")
+        self.btn_import_shots.clicked.connect(self.seq_container.import_shot_list)
+        seq_box_layout.addWidget(self.btn_import_shots)
+        
+        seq_box_layout.addWidget(self.seq_container)
         
         middle_layout.addWidget(seq_box, stretch=1)
         
@@ -135,8 +158,13 @@ class AddToExistingProjectTab(QWidget):
         right_box = QGroupBox("Preview of New Structure")
         right_layout = QVBoxLayout(right_box)
         
-        self.tree_preview = QTreeWidget()
-        self.tree_preview.setHeaderLabel("Final Structure")
+        self.preview_summary = QLabel("No valid project folder selected.")
+        self.preview_model = PlanTreeModel(self)
+        self.tree_preview = QTreeView()
+        self.tree_preview.setModel(self.preview_model)
+        self.tree_preview.setUniformRowHeights(True)
+        self.tree_preview.setHeaderHidden(True)
+        right_layout.addWidget(self.preview_summary)
         right_layout.addWidget(self.tree_preview)
         
         middle_layout.addWidget(right_box, stretch=1)
@@ -153,21 +181,25 @@ class AddToExistingProjectTab(QWidget):
         self.btn_browse_proj.clicked.connect(self.on_browse_project)
         self.btn_execute.clicked.connect(self.on_execute)
         
-        self.chk_create_nk_under_comp.stateChanged.connect(self.update_preview_tab3)
-        self.combo_fps.currentIndexChanged.connect(self.update_preview_tab3)
-        self.chk_proxy.stateChanged.connect(self.update_preview_tab3)
-        self.chk_aces.stateChanged.connect(self.update_preview_tab3)
+        self.chk_create_nk_under_comp.stateChanged.connect(self.schedule_preview)
+        self.combo_fps.currentIndexChanged.connect(self.schedule_preview)
+        self.chk_proxy.stateChanged.connect(self.schedule_preview)
+        self.chk_aces.stateChanged.connect(self.schedule_preview)
         
         self.combo_res_presets.currentIndexChanged.connect(self.on_res_preset_changed)
-        self.spin_width.valueChanged.connect(self.update_preview_tab3)
-        self.spin_height.valueChanged.connect(self.update_preview_tab3)
+        self.spin_width.valueChanged.connect(self.schedule_preview)
+        self.spin_height.valueChanged.connect(self.schedule_preview)
         
-        self.tree_existing.itemChanged.connect(self.update_preview_tab3)
+        self.tree_existing.itemChanged.connect(self.on_existing_item_changed)
+        self.tree_existing.itemExpanded.connect(self.on_existing_item_expanded)
     
     # --------------------------------------------------------------------------
     # Reorganized logic
     # --------------------------------------------------------------------------
     
+    def schedule_preview(self, *args):
+        self.main_window.schedule_preview("add_to_existing_project_tab")
+    
     def on_browse_project(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Existing Project Folder")
         if folder:
@@ -176,34 +208,170 @@ class AddToExistingProjectTab(QWidget):
         self.update_preview_tab3()
     
     def populate_existing_tree(self, project_folder):
+        """
+        Start a background scan of `project_folder`. The first
+        INITIAL_SCAN_DEPTH levels stream into the tree as they are found;
+        deeper folders are scanned when their parent is expanded.
+        """
+        self._stop_scans()
+        self._scan_generation += 1
+        self._requested_dirs = set()
+        self._items_by_rel = {}
+        self._listings = {}
+        if self._checked:
+            self._checked = set()
+            self.schedule_preview()
         self.tree_existing.clear()
         if not os.path.isdir(project_folder):
+            self._scan_root = ""
+            return
+        self._scan_root = project_folder
+        self._root_is_comp = self.COMP_RULE.matches(os.path.basename(os.path.abspath(project_folder)))
+        self._start_scan([""], self.INITIAL_SCAN_DEPTH)
+    
+    def is_scanning(self):
+        return bool(self._scan_threads)
+    
+    def _start_scan(self, start_rels, depth):
+        thread = ProjectScanThread(self._scan_generation, self._scan_root, start_rels, depth,
+                                   self.PRUNE_RULES)
+        thread.batch_ready.connect(self.on_scan_batch)
+        thread.finished.connect(lambda t=thread: self._on_scan_finished(t))
+        self._scan_threads.append(thread)
+        thread.start()
+    
+    def _stop_scans(self):
+        # Stale batches are dropped by generation; the threads end on their own
+        for thread in self._scan_threads:
+            thread.requestInterruption()
+    
+    def _on_scan_finished(self, thread):
+        if thread in self._scan_threads:
+            self._scan_threads.remove(thread)
+        thread.deleteLater()
+    
+    @trace.traced("scan.existing_project.batch", "scan")
+    def on_scan_batch(self, generation, batch):
+        """
+        Attach the (rel, subdir names) of a scan batch to the tree. Folders
+        whose own subfolders are not known yet show an expand arrow. A
+        folder listed again (cached listing, then the disk) is updated in
+        place, keeping the items and check states of unchanged children.
+        """
+        if generation != self._scan_generation:
             return
-        for root, dirs, files in os.walk(project_folder):
-            rel = os.path.relpath(root, project_folder)
-            if rel == ".":
+        root_item = self.tree_existing.invisibleRootItem()
+        items_by_rel = self._items_by_rel
+        checked = self._checked
+        removed_checked = False
+        # The preview reads these listings, so a changed one below a checked folder refreshes it
+        listing_changed = False
+        # No itemChanged per new item; the checked set is updated directly
+        self.tree_existing.setUpdatesEnabled(False)
+        self.tree_existing.blockSignals(True)
+        try:
+            for rel, names in batch:
+                # Parents arrive before children, so one lookup finds the parent
+                parent_item = items_by_rel.get(rel) if rel else root_item
+                if parent_item is None:
+                    continue
+                if rel in checked or os.path.dirname(rel) in checked:
+                    listing_changed = listing_changed or self._listings.get(rel) != names
+                self._listings[rel] = names
+                parent_item.setChildIndicatorPolicy(QTreeWidgetItem.DontShowIndicatorWhenChildless)
+                parent_comp = parent_item.data(0, self.COMP_ROLE) if rel else self._root_is_comp
+                if parent_item.childCount():
+                    removed_checked |= self._sync_children(parent_item, rel, names, parent_comp)
+                else:
+                    parent_item.addChildren([self._new_folder_item(rel, name, parent_comp)
+                                             for name in names])
+        finally:
+            self.tree_existing.blockSignals(False)
+            self.tree_existing.setUpdatesEnabled(True)
+        if removed_checked or listing_changed:
+            self.schedule_preview()
+    
+    def _new_folder_item(self, parent_rel, name, parent_comp):
+        child_rel = os.path.join(parent_rel, name) if parent_rel else name
+        new_item = QTreeWidgetItem([name])
+        new_item.setData(0, Qt.UserRole, child_rel)
+        new_item.setData(0, self.COMP_ROLE, self.COMP_RULE.below(parent_comp, name))
+        new_item.setFlags(new_item.flags() | Qt.ItemIsUserCheckable)
+        new_item.setCheckState(0, Qt.Unchecked)
+        new_item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+        self._items_by_rel[child_rel] = new_item
+        return new_item
+    
+    def _sync_children(self, parent_item, parent_rel, names, parent_comp):
+        """
+        Make parent_item's children match `names`. Returns True if a
+        checked folder was removed.
+        """
+        current = {}
+        for i in range(parent_item.childCount()):
+            c = parent_item.child(i)
+            current[c.text(0)] = c
+        wanted = set(names)
+        if wanted == set(current):
+            return False
+        
+        removed_checked = False
+        for name, item in current.items():
+            if name in wanted:
                 continue
-            segments = rel.split(os.path.sep)
-            parent_item = self.tree_existing.invisibleRootItem()
-            current_path = []
-            for seg in segments:
-                current_path.append(seg)
-                partial_rel = os.path.join(*current_path)
-                found = None
-                for i in range(parent_item.childCount()):
-                    c = parent_item.child(i)
-                    if c.data(0, Qt.UserRole) == partial_rel:
-                        found = c
-                        parent_item = c
-                        break
-                if not found:
-                    new_item = QTreeWidgetItem([seg])
-                    new_item.setData(0, Qt.UserRole, partial_rel)
-                    new_item.setFlags(new_item.flags() | Qt.ItemIsUserCheckable)
-                    new_item.setCheckState(0, Qt.Unchecked)
-                    parent_item.addChild(new_item)
-                    parent_item = new_item
-        self.tree_existing.expandAll()
+            parent_item.removeChild(item)
+            stack = [item]
+            while stack:
+                it = stack.pop()
+                rel = it.data(0, Qt.UserRole)
+                self._items_by_rel.pop(rel, None)
+                self._listings.pop(rel, None)
+                if rel in self._checked:
+                    self._checked.discard(rel)
+                    removed_checked = True
+                stack.extend(it.child(i) for i in range(it.childCount()))
+        new_items = [self._new_folder_item(parent_rel, name, parent_comp)
+                     for name in names if name not in current]
+        if new_items:
+            parent_item.addChildren(new_items)
+            parent_item.sortChildren(0, Qt.AscendingOrder)
+        return removed_checked
+    
+    def on_existing_item_changed(self, item, column=0):
+        """
+        Keep the checked set in step with a check box; other item changes
+        (and re-setting the same state) do not touch the preview.
+        """
+        rel = item.data(0, Qt.UserRole)
+        if item.checkState(0) == Qt.Checked:
+            if rel in self._checked:
+                return
+            self._checked.add(rel)
+        else:
+            if rel not in self._checked:
+                return
+            self._checked.discard(rel)
+        self.schedule_preview()
+    
+    def on_existing_item_expanded(self, item):
+        """
+        Scan one more level below an expanded folder, so its children load
+        (if needed) and know whether they have subfolders themselves.
+        """
+        if not self._scan_root:
+            return
+        if item.childIndicatorPolicy() == QTreeWidgetItem.ShowIndicator:
+            todo, depth = [item.data(0, Qt.UserRole)], 2
+        else:
+            todo, depth = [], 1
+            for i in range(item.childCount()):
+                c = item.child(i)
+                if c.childIndicatorPolicy() == QTreeWidgetItem.ShowIndicator:
+                    todo.append(c.data(0, Qt.UserRole))
+        todo = [rel for rel in todo if rel not in self._requested_dirs]
+        if todo:
+            self._requested_dirs.update(todo)
+            self._start_scan(todo, depth)
     
     def on_res_preset_changed(self):
         sel = self.combo_res_presets.currentText()
@@ -211,92 +379,113 @@ class AddToExistingProjectTab(QWidget):
             w, h, _ = self.res_presets[sel]
             self.spin_width.setValue(w)
             self.spin_height.setValue(h)
-        self.update_preview_tab3()
+        self.schedule_preview()
+    
+    def _nuke_settings(self):
+        sel_rp = self.combo_res_presets.currentText()
+        w_val = self.spin_width.value()
+        h_val = self.spin_height.value()
+        res_label = f"Custom_{w_val}x{h_val}"
+        if sel_rp in self.res_presets:
+            pw, ph, lbl = self.res_presets[sel_rp]
+            if w_val == pw and h_val == ph:
+                res_label = lbl
+        try:
+            fps_val = float(self.combo_fps.currentText())
+        except ValueError:
+            fps_val = 24.0
+        return NukeSettings(
+            fps_val, w_val, h_val, res_label, self.chk_proxy.isChecked(), self.chk_aces.isChecked()
+        )
     
+    def checked_folders(self):
+        """
+        Relative paths of the checked folders in the existing project tree,
+        parents before children. Comes from the checked set, so the cost
+        follows the number of checked folders, not the size of the tree.
+        """
+        return sorted(self._checked, key=lambda rel: rel.split(os.sep))
+    
+    def comp_flags(self, folders):
+        """
+        Comp flag of each of `folders` (rel paths), as stored on its item.
+        """
+        flags = {}
+        for rel in folders:
+            item = self._items_by_rel.get(rel)
+            if item is not None:
+                flags[rel] = bool(item.data(0, self.COMP_ROLE))
+        return flags
+    
+    def _forget_listings(self, rels):
+        """
+        Drop the scanned listings of `rels` and everything below them, e.g.
+        after writing there, so the preview lists those folders again.
+        """
+        for key in list(self._listings):
+            for rel in rels:
+                if not rel or key == rel or key.startswith(rel + os.sep):
+                    del self._listings[key]
+                    break
+    
+    def scanned_listing(self, path):
+        """
+        Subfolder names of `path` as last listed by the scan, or None if it
+        was not scanned. Pruned folders (renders, caches) are not in it, so
+        only the preview relies on it; creating lists the disk again.
+        """
+        rel = os.path.relpath(path, self._scan_root)
+        return self._listings.get("" if rel == os.curdir else rel)
+    
+    @trace.traced("preview.add_to_existing", "preview")
     def update_preview_tab3(self, *args):
         """
-        Builds a live preview (in self.tree_preview) of the final structure
-        based on which folders are checked plus new sequences/shots.
+        Preview (in self.tree_preview) of what would be added: one top-level
+        row per checked folder, with the new sequences/shots below it.
         """
-        self.tree_preview.clear()
-        
         proj_folder = self.edit_project_folder.text().strip()
         if not proj_folder or not os.path.isdir(proj_folder):
-            # No valid project => just show a placeholder
-            QTreeWidgetItem(self.tree_preview, ["No valid project folder selected."])
+            self.preview_summary.setText("No valid project folder selected.")
+            self.preview_model.set_plan(None)
             return
         
-        # Gather checked folders in the existing project
-        checked_folders = []
-        def gather_checked(item):
-            for i in range(item.childCount()):
-                c = item.child(i)
-                if c.checkState(0) == Qt.Checked:
-                    checked_folders.append(c.data(0, Qt.UserRole))
-                gather_checked(c)
-        gather_checked(self.tree_existing.invisibleRootItem())
-        
+        checked_folders = self.checked_folders()
         seq_data = self.seq_container.get_all_sequences_and_shots()
-        
-        # For each checked folder => folder node in the preview
-        # Then show sequences/shots as sub-nodes
+        # Dry-run: no comp script content, scanned folders are not listed again
+        scanned = self._scan_root and os.path.abspath(self._scan_root) == os.path.abspath(proj_folder)
+        listing = self.scanned_listing if scanned else None
+        try:
+            # Names still being typed may be invalid ("/", ".."); preview the rest
+            plan = plan_add_to_existing(
+                proj_folder, checked_folders, drop_invalid_names(seq_data),
+                self.chk_create_nk_under_comp.isChecked(), self._nuke_settings(),
+                comp_flags=self.comp_flags(checked_folders), comp_rule=self.COMP_RULE,
+                preview=True, listing=listing
+            )
+        except ValueError as e:
+            self.preview_summary.setText(f"No preview: {e}")
+            self.preview_model.set_plan(None)
+            return
+        tops = []
         for cf in checked_folders:
-            item_folder = QTreeWidgetItem([cf])  # path relative to project root
-            self.tree_preview.addTopLevelItem(item_folder)
-            
-            # for each sequence => subfolder => shots
-            for sd in seq_data:
-                seqnm = sd['sequence'].strip()
-                shots = [s for s in sd['shots'] if s.strip()]
-                
-                if seqnm:
-                    seq_item = QTreeWidgetItem([seqnm])
-                    item_folder.addChild(seq_item)
-                    
-                    for sh in shots:
-                        shot_item = QTreeWidgetItem([sh])
-                        seq_item.addChild(shot_item)
-                        
-                        # Check if we are making subfolders only if "comp" is in path:
-                        is_comp_folder = self.chk_create_nk_under_comp.isChecked() and \
-                                         self.folder_or_parents_has_comp(
-                                             os.path.join(proj_folder, cf),
-                                             proj_folder
-                                         )
-                        if is_comp_folder:
-                            QTreeWidgetItem(shot_item, ["project/"])
-                            QTreeWidgetItem(shot_item, ["render/"])
-                else:
-                    # No sequence => just shots
-                    for sh in shots:
-                        shot_item = QTreeWidgetItem([sh])
-                        item_folder.addChild(shot_item)
-                        
-                        is_comp_folder = self.chk_create_nk_under_comp.isChecked() and \
-                                         self.folder_or_parents_has_comp(
-                                             os.path.join(proj_folder, cf),
-                                             proj_folder
-                                         )
-                        if is_comp_folder:
-                            QTreeWidgetItem(shot_item, ["project/"])
-                            QTreeWidgetItem(shot_item, ["render/"])
-        
-        self.tree_preview.expandAll()
-    
-    def folder_or_parents_has_comp(self, folder_path, project_root):
-        folder_path = os.path.abspath(folder_path)
-        project_root = os.path.abspath(project_root)
-        while True:
-            base = os.path.basename(folder_path).lower()
-            if "comp" in base:
-                return True
-            if folder_path == project_root:
-                break
-            new_folder = os.path.dirname(folder_path)
-            if new_folder == folder_path:
-                break
-            folder_path = new_folder
-        return "comp" in os.path.basename(project_root).lower()
+            node = plan.find(os.path.join(proj_folder, cf))
+            if node is not None:
+                tops.append((cf, node))
+        
+        summary = f"{len(plan.directories)} folders, {len(plan.files)} comp scripts to add"
+        if plan.collisions:
+            summary += f"; {len(plan.collisions)} already exist"
+        issues = validate_sequences(seq_data)
+        if issues:
+            summary += f"; {len(issues)} invalid names (shown in red)"
+        self.preview_summary.setText(summary)
+        # Patch the rows on screen; only newly checked folders get expanded
+        shown = set(self.preview_model.top_labels())
+        if self.preview_model.update_plan(plan, tops):
+            shown = set()
+        for row, label in enumerate(self.preview_model.top_labels()):
+            if label not in shown:
+                self.tree_preview.expand(self.preview_model.index(row, 0))
     
     def on_execute(self):
         proj_folder = self.edit_project_folder.text().strip()
@@ -305,99 +494,75 @@ class AddToExistingProjectTab(QWidget):
             return
         
         create_nk_under_comp = self.chk_create_nk_under_comp.isChecked()
+        settings = self._nuke_settings()
         
-        sel_rp = self.combo_res_presets.currentText()
-        w_val = self.spin_width.value()
-        h_val = self.spin_height.value()
-        res_label = f"Custom_{w_val}x{h_val}"
-        if sel_rp in self.res_presets:
-            pw, ph, lbl = self.res_presets[sel_rp]
-            if w_val == pw and h_val == ph:
-                res_label = lbl
-        
-        try:
-            fps_val = float(self.combo_fps.currentText())
-        except:
-            fps_val = 24.0
-        use_proxy = self.chk_proxy.isChecked()
-        use_aces = self.chk_aces.isChecked()
-        
-        # gather checked subfolders
-        checked_items = []
-        def gather_checked(item):
-            for i in range(item.childCount()):
-                c = item.child(i)
-                if c.checkState(0) == Qt.Checked:
-                    checked_items.append(c)
-                gather_checked(c)
-        gather_checked(self.tree_existing.invisibleRootItem())
-        
-        # gather new sequences/shots
+        # gather checked subfolders and new sequences/shots
+        checked_folders = self.checked_folders()
         seq_data = self.seq_container.get_all_sequences_and_shots()
+        issues = validate_sequences(seq_data)
+        if issues:
+            QMessageBox.warning(self, "Invalid Names",
+                f"Fix these names before adding anything:\n\n{format_issues(issues)}")
+            return
         
-        for citem in checked_items:
-            relp = citem.data(0, Qt.UserRole)
-            abspath = os.path.join(proj_folder, relp)
-            
-            is_comp_folder = create_nk_under_comp and self.folder_or_parents_has_comp(abspath, proj_folder)
-            
-            for sd in seq_data:
-                seqnm = sd['sequence'].strip()
-                shots = [s.strip() for s in sd['shots'] if s.strip()]
-                
-                if seqnm:
-                    seq_folder = os.path.join(abspath, seqnm)
-                    if os.path.exists(seq_folder):
-                        QMessageBox.warning(self, "Collision",
-                            f"Folder '{seqnm}' already exists under {abspath}, skipping.")
-                        continue
-                    os.makedirs(seq_folder, exist_ok=True)
-                    
-                    for sh in shots:
-                        shot_folder = os.path.join(seq_folder, sh)
-                        if os.path.exists(shot_folder):
-                            QMessageBox.warning(self, "Collision",
-                                f"Shot '{sh}' already exists under {seq_folder}, skipping.")
-                            continue
-                        os.makedirs(shot_folder, exist_ok=True)
-                        
-                        if is_comp_folder:
-                            prj = os.path.join(shot_folder, "project")
-                            rnd = os.path.join(shot_folder, "render")
-                            os.makedirs(prj, exist_ok=True)
-                            os.makedirs(rnd, exist_ok=True)
-                            
-                            nk_name = f"{seqnm}_{sh}_comp_v001.nk"
-                            nk_path = os.path.join(prj, nk_name)
-                            script_txt = self.main_window.build_nuke_script_template(
-                                seqnm, sh, fps_val, w_val, h_val, res_label, use_proxy, use_aces
-                            )
-                            with open(nk_path, "w", encoding='utf-8') as ff:
-                                ff.write(script_txt)
-                else:
-                    # No sequence => only shots
-                    for sh in shots:
-                        shot_folder = os.path.join(abspath, sh)
-                        if os.path.exists(shot_folder):
-                            QMessageBox.warning(self, "Collision",
-                                f"Shot '{sh}' already exists under {abspath}, skipping.")
-                            continue
-                        os.makedirs(shot_folder, exist_ok=True)
-                        
-                        if is_comp_folder:
-                            prj = os.path.join(shot_folder, "project")
-                            rnd = os.path.join(shot_folder, "render")
-                            os.makedirs(prj, exist_ok=True)
-                            os.makedirs(rnd, exist_ok=True)
-                            
-                            nk_name = f"{sh}_comp_v001.nk"
-                            nk_path = os.path.join(prj, nk_name)
-                            script_txt = self.main_window.build_nuke_script_template(
-                                "", sh, fps_val, w_val, h_val, res_label, use_proxy, use_aces
-                            )
-                            with open(nk_path, "w", encoding='utf-8') as ff:
-                                ff.write(script_txt)
-        
-        QMessageBox.information(self, "Done", "Sequences/Shots added successfully.")
+        comp_flags = self.comp_flags(checked_folders)
+        plan = plan_add_to_existing(
+            proj_folder, checked_folders, seq_data, create_nk_under_comp, settings,
+            comp_flags=comp_flags, comp_rule=self.COMP_RULE
+        )
+        if plan.collisions:
+            # One report for all conflicts, before anything is written
+            mode = self.ask_conflict_mode(proj_folder, plan.collisions)
+            if mode is None:
+                return
+            if mode == CREATE_MISSING:
+                plan = plan_add_to_existing(
+                    proj_folder, checked_folders, seq_data, create_nk_under_comp, settings,
+                    conflict_mode=CREATE_MISSING, comp_flags=comp_flags, comp_rule=self.COMP_RULE
+                )
+        if not plan.directories and not plan.files:
+            QMessageBox.information(self, "Done", "Nothing to add, everything already exists.")
+            return
+        report = execute_plan(
+            plan, max_workers=DEFAULT_MAX_WORKERS, writer_workers=DEFAULT_WRITER_WORKERS
+        )
+        # The scan's listings of the folders written to are out of date now
+        self._forget_listings(checked_folders)
+        if not report.ok:
+            QMessageBox.critical(self, "Error",
+                f"Some folders or files could not be created:\n{report.error_text()}")
+        else:
+            QMessageBox.information(self, "Done", "Sequences/Shots added successfully.")
         # Optionally re-check the preview after creation
         self.update_preview_tab3()
+    
+    def ask_conflict_mode(self, proj_folder, collisions):
+        """
+        Aggregated conflict report: every existing sequence and every
+        existing shot (also inside existing sequences), from one planning
+        pass. Returns SKIP_CONFLICTS, CREATE_MISSING or None (cancel).
+        """
+        box = QMessageBox(self)
+        box.setIcon(QMessageBox.Warning)
+        box.setWindowTitle("Conflicts")
+        box.setText(f"{len(collisions)} of the sequences/shots to add already exist.")
+        box.setInformativeText(
+            "Nothing has been written yet.\n\n"
+            "Create Missing Only: add the missing shots, also inside existing sequences.\n"
+            "Skip Conflicting: leave existing sequences and shots untouched."
+        )
+        # Paths only: the planner's messages describe the mode not chosen yet
+        box.setDetailedText("Already existing:\n" + "\n".join(
+            os.path.relpath(c.path, proj_folder) for c in collisions
+        ))
+        btn_missing = box.addButton("Create Missing Only", QMessageBox.AcceptRole)
+        btn_skip = box.addButton("Skip Conflicting", QMessageBox.AcceptRole)
+        box.addButton(QMessageBox.Cancel)
+        box.setDefaultButton(btn_skip)
+        box.exec_()
+        clicked = box.clickedButton()
+        if clicked is btn_missing:
+            return CREATE_MISSING
+        if clicked is btn_skip:
+            return SKIP_CONFLICTS
+        return None
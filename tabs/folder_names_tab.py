@@ -1,6 +1,7 @@
 # folder_names_tab.py
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTreeWidget, QTreeWidgetItem
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTreeWidget, QTreeWidgetItem, QMessageBox
 from PyQt5.QtCore import Qt
+from core.config import folder_name_error
 
 class FolderNamesTab(QWidget):
     """
@@ -117,7 +118,7 @@ class FolderNamesTab(QWidget):
             default_label = node.get("label", "")
             actual_text = self.main_window.folder_config.get(key)
             if actual_text:
-                current_name = actual_text.text()
+                current_name = actual_text
             else:
                 current_name = default_label
             
@@ -138,7 +139,15 @@ class FolderNamesTab(QWidget):
         new_name = item.text(column)
         key = item.data(column, Qt.UserRole)
         if key:
-            # Update the corresponding QLineEdit in folder_config
+            # Update the corresponding entry in folder_config
             if key in self.main_window.folder_config:
-                self.main_window.folder_config[key].setText(new_name)
+                error = folder_name_error(key, new_name)
+                if error:
+                    # Same check as the command line; put the previous name back
+                    QMessageBox.warning(self, "Invalid Folder Name", error)
+                    self.tree.blockSignals(True)
+                    item.setText(column, self.main_window.folder_config[key])
+                    self.tree.blockSignals(False)
+                    return
+                self.main_window.folder_config[key] = new_name.strip()
                 self.main_window.update_preview()
@@ -0,0 +1,161 @@
+# test_plan_executor.py
+"""
+The hardcoded plan, executed in every mode, must leave exactly the tree
+the original tab code created with os.makedirs().
+"""
+import os
+
+import pytest
+
+from common.nuke_template import build_nuke_script_template
+from core.config import FolderConfig, NukeSettings
+from core.executor import execute_plan, DIR_FD_SUPPORTED
+from core.plan import FolderPlan
+from core.planner import plan_hardcoded_structure
+from core.report import CREATED, EXISTS, WRITTEN
+
+SETTINGS = NukeSettings(24.0, 1920, 1080, "HD_1080", False, True)
+
+SEQ_SHOTS = [
+    {'sequence': "SQ010", 'shots': ["sh0010", "sh0020", "sh0030"]},
+    {'sequence': "SQ020", 'shots': ["sh0010"]},
+    {'sequence': "SQ030", 'shots': []},
+]
+
+MODES = [
+    pytest.param(dict(max_workers=1), id="serial"),
+    pytest.param(dict(max_workers=8, writer_workers=4), id="pool"),
+    pytest.param(dict(use_dir_fd=True), id="dir_fd",
+                 marks=pytest.mark.skipif(not DIR_FD_SUPPORTED, reason="no dir_fd support")),
+]
+
+
+def legacy_create(show_name, dest, seq_shots, config, settings):
+    # The Structure tab's hardcoded creation before the planner existed
+    show_root = os.path.join(dest, show_name)
+    os.makedirs(show_root, exist_ok=True)
+    f_plates = os.path.join(show_root, config["folder_01_plates"])
+    f_support = os.path.join(show_root, config["folder_02_support"])
+    f_refs = os.path.join(show_root, config["folder_03_references"])
+    f_vfx = os.path.join(show_root, config["folder_04_vfx"])
+    f_comp = os.path.join(show_root, config["folder_05_comp"])
+    f_mg = os.path.join(show_root, config["folder_06_mograph"])
+    f_sh = os.path.join(show_root, config["folder_07_shared"])
+    f_out = os.path.join(show_root, config["folder_08_output"])
+    for top in (f_plates, f_support, f_refs, f_vfx, f_comp, f_mg, f_sh, f_out):
+        os.makedirs(top, exist_ok=True)
+
+    os.makedirs(os.path.join(f_plates, config["folder_01_plates_aspera"]), exist_ok=True)
+    man = os.path.join(f_plates, config["folder_01_plates_manifest"])
+    if not os.path.isfile(man):
+        with open(man, "w") as f:
+            f.write("Plate manifest placeholder\n")
+    for seq_info in seq_shots:
+        seq_dir = os.path.join(f_plates, seq_info['sequence'])
+        os.makedirs(seq_dir, exist_ok=True)
+        for sh in seq_info['shots']:
+            os.makedirs(os.path.join(seq_dir, sh), exist_ok=True)
+
+    f_luts = os.path.join(f_support, config["folder_02_support_luts"])
+    for path in (f_luts,
+                 os.path.join(f_luts, config["folder_02_support_luts_camera"]),
+                 os.path.join(f_luts, config["folder_02_support_luts_show"]),
+                 os.path.join(f_support, config["folder_02_support_edl_xml"]),
+                 os.path.join(f_support, config["folder_02_support_guides"]),
+                 os.path.join(f_support, config["folder_02_support_camera_data"]),
+                 os.path.join(f_refs, config["folder_03_references_client_brief"]),
+                 os.path.join(f_refs, config["folder_03_references_artwork"]),
+                 os.path.join(f_refs, config["folder_03_references_style_guides"])):
+        os.makedirs(path, exist_ok=True)
+
+    for base in (f_vfx, f_comp):
+        for seq_info in seq_shots:
+            seq_dir = os.path.join(base, seq_info['sequence'])
+            os.makedirs(seq_dir, exist_ok=True)
+            for shot in seq_info['shots']:
+                os.makedirs(os.path.join(seq_dir, shot, "project"), exist_ok=True)
+                os.makedirs(os.path.join(seq_dir, shot, "render"), exist_ok=True)
+
+    f_out_date = os.path.join(f_out, config["folder_08_output_date"])
+    for path in (os.path.join(f_mg, config["folder_06_mograph_projects"]),
+                 os.path.join(f_mg, config["folder_06_mograph_render"]),
+                 os.path.join(f_sh, config["folder_07_shared_stock_footage"]),
+                 os.path.join(f_sh, config["folder_07_shared_graphics"]),
+                 os.path.join(f_sh, config["folder_07_shared_fonts"]),
+                 os.path.join(f_sh, config["folder_07_shared_templates"]),
+                 os.path.join(f_out_date, config["folder_08_output_full_res"]),
+                 os.path.join(f_out_date, config["folder_08_output_proxy"])):
+        os.makedirs(path, exist_ok=True)
+
+    for seq_info in seq_shots:
+        seq = seq_info['sequence']
+        for shot in seq_info['shots']:
+            prj = os.path.join(f_comp, seq, shot, "project")
+            os.makedirs(prj, exist_ok=True)
+            with open(os.path.join(prj, f"{seq}_{shot}_comp_v001.nk"), "w", encoding="utf-8") as ff:
+                ff.write(build_nuke_script_template(seq, shot, *settings))
+
+
+def snapshot(root):
+    """
+    {relative path: None for a folder, bytes for a file} below `root`.
+    """
+    tree = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel = os.path.relpath(dirpath, root)
+        for name in dirnames:
+            tree[os.path.normpath(os.path.join(rel, name))] = None
+        for name in filenames:
+            with open(os.path.join(dirpath, name), "rb") as ff:
+                tree[os.path.normpath(os.path.join(rel, name))] = ff.read()
+    return tree
+
+
+@pytest.fixture
+def legacy_tree(tmp_path):
+    dest = tmp_path / "legacy"
+    dest.mkdir()
+    legacy_create("show", str(dest), SEQ_SHOTS, FolderConfig(), SETTINGS)
+    return snapshot(str(dest))
+
+
+@pytest.mark.parametrize("options", MODES)
+def test_hardcoded_plan_matches_legacy_tree(tmp_path, legacy_tree, options):
+    dest = tmp_path / "planned"
+    dest.mkdir()
+    plan = plan_hardcoded_structure("show", str(dest), SEQ_SHOTS, FolderConfig(), SETTINGS)
+    report = execute_plan(plan, **options)
+    assert report.ok, report.error_text()
+    assert snapshot(str(dest)) == legacy_tree
+    assert report.count(CREATED) == len(plan.directories)
+    assert report.count(WRITTEN) == len(plan.files)
+    # One mkdir per directory, however often the planner asked for it
+    assert report.syscalls.counts["mkdir"] == len(plan.directories)
+
+
+@pytest.mark.parametrize("options", MODES)
+def test_executing_twice_reports_existing_items(tmp_path, options):
+    plan = plan_hardcoded_structure("show", str(tmp_path), SEQ_SHOTS, FolderConfig(), SETTINGS)
+    assert execute_plan(plan, **options).ok
+    manifest = next(f for f in plan.files if not f.overwrite)
+    with open(manifest.path, "w") as ff:
+        ff.write("edited\n")
+
+    report = execute_plan(plan, **options)
+    assert report.ok, report.error_text()
+    assert report.count(CREATED) == 0
+    assert report.count(EXISTS) == len(plan.directories) + 1
+    with open(manifest.path) as ff:
+        assert ff.read() == "edited\n"
+
+
+def test_plan_keeps_one_node_per_directory(tmp_path):
+    plan = FolderPlan(str(tmp_path))
+    plan.add_dir(os.path.join(str(tmp_path), "a", "b", "c"))
+    plan.add_dir(os.path.join(str(tmp_path), "a", "b"))
+    plan.add_dir(os.path.join(str(tmp_path), "a", "b", "c") + os.sep)
+    assert plan.directories == [os.path.join(str(tmp_path), *parts)
+                                for parts in (("a",), ("a", "b"), ("a", "b", "c"))]
+    assert plan.dir_requests == 3
+    with pytest.raises(ValueError):
+        plan.add_dir(os.path.join(str(tmp_path), os.pardir, "elsewhere"))
@@ -0,0 +1,106 @@
+# test_planner.py
+import os
+
+import pytest
+
+from core.config import NukeSettings
+from core.planner import (
+    plan_add_to_existing, plan_template_structure, nuke_script_name, SKIP_CONFLICTS, CREATE_MISSING
+)
+
+SETTINGS = NukeSettings(24.0, 1920, 1080, "HD_1080", False, False)
+
+SEQ_DATA = [
+    {'sequence': "SQ010", 'shots': ["sh0010", "sh0020"]},
+    {'sequence': "SQ020", 'shots': ["sh0010"]},
+    {'sequence': "", 'shots': ["sh0900"]},
+]
+
+
+@pytest.fixture
+def project(tmp_path):
+    # comp/SQ010/sh0010 and comp/sh0900 exist already
+    os.makedirs(tmp_path / "comp" / "SQ010" / "sh0010")
+    os.makedirs(tmp_path / "comp" / "sh0900")
+    os.makedirs(tmp_path / "plates")
+    return str(tmp_path)
+
+
+def rel_paths(root, paths):
+    return sorted(os.path.relpath(p, root) for p in paths)
+
+
+def plan_for(project, mode, **options):
+    return plan_add_to_existing(project, ["comp"], SEQ_DATA, True, SETTINGS,
+                                conflict_mode=mode, **options)
+
+
+@pytest.mark.parametrize("mode", [SKIP_CONFLICTS, CREATE_MISSING])
+def test_both_modes_report_the_same_conflicts(project, mode):
+    plan = plan_for(project, mode)
+    assert rel_paths(project, (c.path for c in plan.collisions)) == [
+        os.path.join("comp", "SQ010"),
+        os.path.join("comp", "SQ010", "sh0010"),
+        os.path.join("comp", "sh0900"),
+    ]
+
+
+def test_skip_mode_leaves_existing_sequences_alone(project):
+    plan = plan_for(project, SKIP_CONFLICTS)
+    assert rel_paths(project, plan.directories) == [
+        os.path.join("comp", "SQ020"),
+        os.path.join("comp", "SQ020", "sh0010"),
+        os.path.join("comp", "SQ020", "sh0010", "project"),
+        os.path.join("comp", "SQ020", "sh0010", "render"),
+    ]
+    messages = [c.message for c in plan.collisions]
+    assert "skipping it and its shots" in messages[0]
+    assert all("adding" not in m for m in messages)
+
+
+def test_create_missing_adds_shots_to_existing_sequences(project):
+    plan = plan_for(project, CREATE_MISSING)
+    dirs = rel_paths(project, plan.directories)
+    assert os.path.join("comp", "SQ010", "sh0020", "project") in dirs
+    assert os.path.join("comp", "SQ010", "sh0010") not in dirs
+    assert os.path.join("comp", "SQ010") not in dirs
+    assert rel_paths(project, (f.path for f in plan.files)) == [
+        os.path.join("comp", "SQ010", "sh0020", "project", nuke_script_name("SQ010", "sh0020")),
+        os.path.join("comp", "SQ020", "sh0010", "project", nuke_script_name("SQ020", "sh0010")),
+    ]
+    messages = [c.message for c in plan.collisions]
+    assert "adding missing shots" in messages[0]
+    assert all("skipping" not in m for m in messages)
+
+
+def test_repeated_sequences_are_merged_not_conflicts(project):
+    seq_data = [{'sequence': "SQ030", 'shots': ["sh0010"]},
+                {'sequence': "SQ030", 'shots': ["sh0020", "sh0010"]}]
+    plan = plan_add_to_existing(project, ["plates"], seq_data, False, SETTINGS)
+    assert plan.collisions == []
+    assert rel_paths(project, plan.directories) == [
+        os.path.join("plates", "SQ030"),
+        os.path.join("plates", "SQ030", "sh0010"),
+        os.path.join("plates", "SQ030", "sh0020"),
+    ]
+
+
+def test_listing_replaces_the_disk_and_preview_skips_content(project):
+    # A listing that knows nothing exists => no collisions, nothing rendered
+    plan = plan_for(project, SKIP_CONFLICTS, preview=True, listing=lambda path: [])
+    assert plan.collisions == []
+    assert plan.files and all(f.content is None for f in plan.files)
+
+
+def test_template_placeholders_at_any_depth(tmp_path):
+    template = ["vfx/[sequence]/[sequence]_[shot]/plates", "comp", "docs/[show]"]
+    seq_shots = [{'sequence': "SQ010", 'shots': ["sh0010", "sh0020"]}]
+    plan = plan_template_structure("show", str(tmp_path), template, seq_shots, SETTINGS)
+    dirs = rel_paths(str(tmp_path), plan.directories)
+    assert os.path.join("show", "vfx", "SQ010", "SQ010_sh0020", "plates") in dirs
+    assert os.path.join("show", "docs", "show") in dirs
+    assert os.path.join("show", "comp", "SQ010", "sh0010", "render") in dirs
+    assert rel_paths(str(tmp_path), (f.path for f in plan.files)) == [
+        os.path.join("show", "comp", "SQ010", shot, "project", nuke_script_name("SQ010", shot))
+        for shot in ("sh0010", "sh0020")
+    ]
@@ -0,0 +1,120 @@
+# test_shotlist.py
+import time
+
+import pytest
+
+from core.shotlist import (
+    MAX_PATTERN_NAMES, expand_name_pattern, iter_pattern_shots, iter_pasted_shots,
+    pattern_size, read_shot_list
+)
+
+EDL = """TITLE: REEL_01
+FCM: NON-DROP FRAME
+
+001  AX       V     C        00:00:00:00 00:00:02:00 01:00:00:00 01:00:02:00
+* FROM CLIP NAME: SQ010_sh0010_plate_v001.mov
+* LOC: 01:00:00:12 RED     SQ010_sh0010
+002  AX       A     C        00:00:00:00 00:00:02:00 01:00:00:00 01:00:02:00
+* FROM CLIP NAME: SQ010_sh0099.wav
+003  AX       V     C        00:00:00:00 00:00:02:00 01:00:02:00 01:00:04:00
+* FROM CLIP NAME: SQ010_sh0020
+004  A012C003 V     C        00:00:00:00 00:00:02:00 01:00:04:00 01:00:06:00
+005  AX       V     C        00:00:00:00 00:00:02:00 01:00:06:00 01:00:08:00
+* LOC: 01:00:06:00 RED     SQ010_sh0010
+"""
+
+XMEML = """<?xml version="1.0" encoding="UTF-8"?>
+<xmeml version="5">
+  <sequence>
+    <name>Cut_v3</name>
+    <media>
+      <video>
+        <track>
+          <clipitem id="c1"><name>SQ020_sh0010</name></clipitem>
+          <clipitem id="c2"><name>SQ020_sh0020</name></clipitem>
+        </track>
+      </video>
+      <audio>
+        <track><clipitem id="a1"><name>SQ020_sh0099</name></clipitem></track>
+      </audio>
+    </media>
+  </sequence>
+</xmeml>
+"""
+
+FCPXML = """<?xml version="1.0" encoding="UTF-8"?>
+<fcpxml version="1.9">
+  <resources>
+    <asset id="r1" name="SQ030_sh0999"/>
+    <media id="r2"><sequence><spine><clip name="SQ030_sh0888"/></spine></sequence></media>
+  </resources>
+  <library><event><project name="Cut"><sequence><spine>
+    <asset-clip ref="r1" name="SQ030_sh0010"/>
+    <ref-clip ref="r2" name="SQ030_sh0020"/>
+    <asset-clip ref="r1" name="SQ030_sh0010"/>
+  </spine></sequence></project></event></library>
+</fcpxml>
+"""
+
+
+def test_range_is_zero_padded_by_start_width():
+    assert list(expand_name_pattern("sh[0010-0040:10]")) == ["sh0010", "sh0020", "sh0030", "sh0040"]
+    assert list(expand_name_pattern("sh[8-10]")) == ["sh8", "sh9", "sh10"]
+
+
+def test_several_ranges_multiply_in_order():
+    assert list(expand_name_pattern("a[1-2]_b[01-02]")) == ["a1_b01", "a1_b02", "a2_b01", "a2_b02"]
+    assert pattern_size("a[1-2]_b[01-02]") == 4
+    assert list(expand_name_pattern("plain")) == ["plain"]
+
+
+@pytest.mark.parametrize("pattern", ["sh[10-1]", "sh[1-10:0]", "sh[1-]", "sh[a-b]", "sh[1-2"])
+def test_malformed_ranges_are_rejected(pattern):
+    with pytest.raises(ValueError):
+        list(expand_name_pattern(pattern))
+
+
+def test_oversized_patterns_fail_before_expanding():
+    started = time.perf_counter()
+    with pytest.raises(ValueError):
+        expand_name_pattern("sh[1-999999999]")
+    with pytest.raises(ValueError):
+        list(iter_pattern_shots("SQ[1-1000]/sh[1-1000]"))
+    assert time.perf_counter() - started < 1.0
+    assert len(list(expand_name_pattern(f"sh[1-{MAX_PATTERN_NAMES}]"))) == MAX_PATTERN_NAMES
+
+
+def test_pattern_shots_and_pastes():
+    assert list(iter_pattern_shots("SQ[10-20:10]/sh[1-2]")) == [
+        ("SQ10", "sh1"), ("SQ10", "sh2"), ("SQ20", "sh1"), ("SQ20", "sh2")]
+    assert list(iter_pattern_shots("sh[1-2]")) == [("", "sh1"), ("", "sh2")]
+    assert list(iter_pasted_shots("SQ1,sh1\nSQ1\tsh[2-3]\n\nsh9\n")) == [
+        ("SQ1", "sh1"), ("SQ1", "sh2"), ("SQ1", "sh3"), ("", "sh9")]
+
+
+def test_edl_reads_video_events_once(tmp_path):
+    path = tmp_path / "cut.edl"
+    path.write_text(EDL)
+    assert read_shot_list(str(path)) == [
+        {'sequence': "SQ010", 'shots': ["sh0010", "sh0020"]},
+        {'sequence': "", 'shots': ["A012C003"]},
+    ]
+
+
+def test_xmeml_reads_video_clip_items(tmp_path):
+    path = tmp_path / "cut.xml"
+    path.write_text(XMEML)
+    assert read_shot_list(str(path)) == [{'sequence': "SQ020", 'shots': ["sh0010", "sh0020"]}]
+
+
+def test_fcpxml_skips_resources(tmp_path):
+    path = tmp_path / "cut.fcpxml"
+    path.write_text(FCPXML)
+    assert read_shot_list(str(path)) == [{'sequence': "SQ030", 'shots': ["sh0010", "sh0020"]}]
+
+
+def test_broken_xml_is_a_value_error(tmp_path):
+    path = tmp_path / "cut.xml"
+    path.write_text("<xmeml><sequence>")
+    with pytest.raises(ValueError):
+        read_shot_list(str(path))
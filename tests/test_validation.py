@@ -0,0 +1,63 @@
+# test_validation.py
+import pytest
+
+from core.validation import (
+    MAX_NAME_LENGTH, NameIssue, check_name, drop_invalid_names, format_issues, validate_sequences
+)
+
+
+@pytest.mark.parametrize("name", ["sh0010", "SQ_010", "a.b", "x" * MAX_NAME_LENGTH])
+def test_valid_names(name):
+    assert check_name(name) is None
+
+
+@pytest.mark.parametrize("name", [
+    "a/b", "a\\b", "sh:10", "sh?", "sh\x01", ".", "..", "sh.", " sh", "sh ", "CON", "nul.txt",
+    "LPT1", "x" * (MAX_NAME_LENGTH + 1),
+])
+def test_invalid_names(name):
+    assert check_name(name)
+
+
+def test_validate_sequences_reports_each_problem_once():
+    issues = validate_sequences([
+        {'sequence': "SQ010", 'shots': ["sh0010", "SH0010", "sh0020", "sh0020"]},
+        {'sequence': "sq010", 'shots': []},
+        {'sequence': "SQ010", 'shots': ["sh0030", "sh0010"]},
+        {'sequence': "bad/seq", 'shots': ["ok"]},
+        {'sequence': "", 'shots': ["x?", "x?"]},
+    ])
+    assert [(i.sequence, i.shot) for i in issues] == [
+        ("sq010", None),
+        ("bad/seq", None),
+        # SQ010's two entries are one sequence
+        ("SQ010", "SH0010"),
+        ("SQ010", "sh0020"),
+        ("SQ010", "sh0010"),
+        ("", "x?"),
+        ("", "x?"),
+    ]
+    assert "differs only in case" in issues[0].message
+    assert "listed more than once" in issues[3].message
+
+
+def test_valid_list_has_no_issues():
+    assert validate_sequences([{'sequence': "SQ010", 'shots': ["sh0010", "sh0020"]},
+                               {'sequence': "", 'shots': ["sh0010"]}]) == []
+
+
+def test_format_issues_limits_the_lines():
+    issues = [NameIssue("SQ010", f"sh{i}?", "bad") for i in range(5)]
+    assert format_issues(issues, limit=2).splitlines()[-1] == "... and 3 more"
+    assert format_issues([NameIssue("SQ", None, "'a/b' is bad")]) == "Sequence 'a/b' is bad"
+
+
+def test_drop_invalid_names_keeps_the_rest():
+    assert drop_invalid_names([
+        {'sequence': "SQ010", 'shots': ["/", "sh0010", "../.."]},
+        {'sequence': "..", 'shots': ["sh0010"]},
+        {'sequence': "", 'shots': ["sh?", "sh0020"]},
+    ]) == [
+        {'sequence': "SQ010", 'shots': ["sh0010"]},
+        {'sequence': "", 'shots': ["sh0020"]},
+    ]
@@ -0,0 +1,61 @@
+# test_writer.py
+import os
+
+from core.plan import PlannedFile
+from core.report import EXISTS, WRITTEN, FAILED
+from core.syscalls import SyscallCounter
+from core.writer import ScriptWriter
+
+
+def write(planned_files, **options):
+    writer = ScriptWriter(SyscallCounter(), **options)
+    for planned_file in planned_files:
+        writer.submit(planned_file)
+    return {result.path: result for result in writer.close()}
+
+
+def leftovers(folder):
+    return [name for name in os.listdir(folder) if name.endswith(".tmp")]
+
+
+def test_writes_every_file_atomically(tmp_path):
+    files = [PlannedFile(str(tmp_path / f"sh{i:04d}.nk"), f"script {i}\n", True) for i in range(50)]
+    results = write(files, max_workers=4)
+    assert {r.status for r in results.values()} == {WRITTEN}
+    for planned_file in files:
+        with open(planned_file.path, encoding="utf-8") as ff:
+            assert ff.read() == planned_file.content
+    assert leftovers(str(tmp_path)) == []
+
+
+def test_fsync_batches_write_the_same_files(tmp_path):
+    files = [PlannedFile(str(tmp_path / f"{i}.nk"), b"x" * i, True) for i in range(10)]
+    results = write(files, max_workers=2, fsync=True, fsync_batch=3)
+    assert {r.status for r in results.values()} == {WRITTEN}
+    assert sorted(os.path.getsize(f.path) for f in files) == list(range(10))
+    assert leftovers(str(tmp_path)) == []
+
+
+def test_existing_file_is_kept_without_overwrite(tmp_path):
+    path = tmp_path / "plate_manifest.txt"
+    path.write_text("edited\n")
+    results = write([PlannedFile(str(path), "placeholder\n", False)], max_workers=1)
+    assert results[str(path)].status == EXISTS
+    assert path.read_text() == "edited\n"
+    assert leftovers(str(tmp_path)) == []
+
+
+def test_existing_file_is_replaced_with_overwrite(tmp_path):
+    path = tmp_path / "sh0010.nk"
+    path.write_text("old\n")
+    results = write([PlannedFile(str(path), "new\n", True)], max_workers=1)
+    assert results[str(path)].status == WRITTEN
+    assert path.read_text() == "new\n"
+
+
+def test_missing_folder_fails_without_partial_files(tmp_path):
+    path = tmp_path / "missing" / "sh0010.nk"
+    results = write([PlannedFile(str(path), "data\n", True)], max_workers=1)
+    assert results[str(path)].status == FAILED
+    assert results[str(path)].error is not None
+    assert os.listdir(str(tmp_path)) == []
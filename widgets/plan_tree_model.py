@@ -0,0 +1,343 @@
+# plan_tree_model.py
+"""
+Read-only, lazily populated tree model over a FolderPlan.
+
+The previews used to build one line or one QTreeWidgetItem per planned
+folder on every refresh. PlanTreeModel only wraps the rows a QTreeView
+actually asks for: a folder's children are materialized when it is
+expanded, FETCH_CHUNK rows at a time as the view scrolls
+(canFetchMore/fetchMore). Memory stays bounded by what has been looked
+at, not by the size of the show.
+
+update_plan() swaps in a new plan without a reset: the rows that are
+already materialized are compared with the new plan and only the
+differences are inserted or removed. Expansion state and scroll
+position survive a refresh, and patching the rows costs what is on
+screen, not the size of the plan. The plan itself is still built in
+full by the caller on every refresh (as a preview plan, without script
+content, see core.planner), so a refresh as a whole still grows with
+the number of shots.
+"""
+import itertools
+import os
+
+from PyQt5.QtCore import QAbstractItemModel, QModelIndex, Qt
+from PyQt5.QtGui import QBrush, QColor
+from PyQt5.QtWidgets import QApplication, QStyle
+
+# Rows materialized per fetchMore() call
+FETCH_CHUNK = 256
+
+
+class _Row(object):
+    """
+    One materialized row: a planned folder (node is its PlanNode) or a
+    planned file (node is None). `pos` is its row number under `parent`.
+    While `pinned` (being patched by update_plan()) no more children
+    are fetched.
+    """
+    __slots__ = ("label", "node", "parent", "pos", "rows", "pinned")
+
+    def __init__(self, label, node, parent, pos):
+        self.label = label
+        self.node = node
+        self.parent = parent
+        self.pos = pos
+        self.rows = []
+        self.pinned = False
+
+    def take(self, other):
+        # Switch to the entries of `other` (same kind of row, new plan)
+        self.node = other.node
+
+    def total(self):
+        # Children available in the plan, materialized or not
+        node = self.node
+        return len(node.children) + len(node.files) if node is not None else 0
+
+    def has_entry(self, label, is_dir):
+        node = self.node
+        if node is None:
+            return False
+        if is_dir:
+            return label in node.children
+        return any(os.path.basename(f.path) == label for f in node.files)
+
+    def entries(self, start, stop):
+        """
+        (label, PlanNode or None) for children start..stop: folders first,
+        then files.
+        """
+        node = self.node
+        n_dirs = len(node.children)
+        out = []
+        if start < n_dirs:
+            for child in itertools.islice(node.children.values(), start, min(stop, n_dirs)):
+                out.append((child.name, child))
+        if stop > n_dirs:
+            for planned_file in node.files[max(start - n_dirs, 0):stop - n_dirs]:
+                out.append((os.path.basename(planned_file.path), None))
+        return out
+
+
+class _RootRow(_Row):
+    """
+    Invisible root; its children are the top-level nodes given to set_plan().
+    """
+    __slots__ = ("tops",)
+
+    def __init__(self, tops):
+        super().__init__("", None, None, 0)
+        self.tops = tops
+
+    def total(self):
+        return len(self.tops)
+
+    def take(self, other):
+        self.tops = other.tops
+
+    def has_entry(self, label, is_dir):
+        return is_dir and any(label == top_label for top_label, _ in self.tops)
+
+    def entries(self, start, stop):
+        return self.tops[start:stop]
+
+
+class PlanTreeModel(QAbstractItemModel):
+    """
+    set_plan(plan, tops) shows `plan`; `tops` is a list of
+    (label, PlanNode) top-level rows, by default the root's children.
+    update_plan(plan, tops) does the same by patching the current rows.
+    Folders already on disk (checked folders in "Add to Existing
+    Project") are greyed out.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._plan = None
+        self._root = _RootRow([])
+        style = QApplication.style()
+        self._dir_icon = style.standardIcon(QStyle.SP_DirIcon)
+        self._file_icon = style.standardIcon(QStyle.SP_FileIcon)
+        self._existing_brush = QBrush(QColor(140, 140, 140))
+
+    def set_plan(self, plan, tops=None):
+        self.beginResetModel()
+        self._plan = plan
+        if plan is None:
+            tops = []
+        elif tops is None:
+            tops = [(child.name, child) for child in plan.tree.children.values()]
+        self._root = _RootRow(list(tops))
+        self._fetch(self._root)
+        self.endResetModel()
+
+    def update_plan(self, plan, tops=None):
+        """
+        Show `plan`, patching the materialized rows in place. Returns True
+        if the model had to be reset instead (no plan shown before).
+        """
+        if self._plan is None or plan is None:
+            self.set_plan(plan, tops)
+            return True
+        if tops is None:
+            tops = [(child.name, child) for child in plan.tree.children.values()]
+        root = self._root
+        was_complete = len(root.rows) >= root.total()
+        self._sync(root, QModelIndex(), _RootRow(list(tops)), was_complete)
+        self._plan = plan
+        return False
+
+    def plan(self):
+        return self._plan
+
+    def top_labels(self):
+        return [row.label for row in self._root.rows]
+
+    def materialized_rows(self):
+        """
+        Number of rows wrapped so far (for tests and benchmarks).
+        """
+        count = 0
+        stack = [self._root]
+        while stack:
+            row = stack.pop()
+            count += len(row.rows)
+            stack.extend(row.rows)
+        return count
+
+    def _fetch(self, row):
+        start = len(row.rows)
+        row.rows.extend(_Row(label, node, row, pos)
+                        for pos, (label, node)
+                        in enumerate(row.entries(start, start + FETCH_CHUNK), start))
+
+    def _sync(self, row, parent_index, new, was_complete):
+        """
+        Make row.rows a prefix of the entries of `new` (a row standing for
+        the same folder in the new plan): drop rows that are gone, switch
+        `row` over to the new plan, insert new entries between the kept
+        rows and sync the kept rows below it. A level that was fully
+        materialized stays so (up to FETCH_CHUNK), one that was partly
+        fetched keeps fetching lazily past its last kept row.
+
+        The removals are done while `row` still answers from the old
+        plan, and `row` is pinned throughout, so a view reacting to any
+        of the signals sees a consistent model and cannot fetch rows that
+        are about to be inserted.
+        """
+        rows = row.rows
+        materialized = len(rows)
+        row.pinned = True
+        try:
+            # Remove rows that are no longer planned, in runs from the end
+            end = len(rows)
+            while end > 0:
+                if new.has_entry(rows[end - 1].label, rows[end - 1].node is not None):
+                    end -= 1
+                    continue
+                start = end - 1
+                while start > 0 and not new.has_entry(rows[start - 1].label,
+                                                       rows[start - 1].node is not None):
+                    start -= 1
+                self.beginRemoveRows(parent_index, start, end - 1)
+                del rows[start:end]
+                self._renumber(row, start)
+                self.endRemoveRows()
+                end = start
+
+            row.take(new)
+
+            # Walk the new entries alongside the kept rows, inserting what is new
+            pending = {(r.label, r.node is not None) for r in rows}
+            target = len(rows)
+            if was_complete:
+                target = max(materialized, min(row.total(), FETCH_CHUNK))
+            pos = 0
+            for label, node in self._iter_entries(row):
+                if pos >= len(rows) and len(rows) >= target:
+                    break
+                key = (label, node is not None)
+                if pos < len(rows) and (rows[pos].label, rows[pos].node is not None) == key:
+                    pending.discard(key)
+                    self._retarget(rows[pos], node)
+                elif key in pending:
+                    # Kept entries came back in another order => redo this level
+                    self._rebuild(row, parent_index, max(target, 1))
+                    return
+                else:
+                    self.beginInsertRows(parent_index, pos, pos)
+                    rows.insert(pos, _Row(label, node, row, pos))
+                    self._renumber(row, pos + 1)
+                    self.endInsertRows()
+                pos += 1
+        finally:
+            row.pinned = False
+
+    def _retarget(self, row, node):
+        old = row.node
+        if node is None:
+            row.node = node
+            return
+        old_total = len(old.children) + len(old.files)
+        if row.rows:
+            self._sync(row, self.createIndex(row.pos, 0, row), _Row(row.label, node, None, 0),
+                       len(row.rows) >= old_total)
+        else:
+            row.node = node
+        if old.exists != node.exists or (old_total > 0) != (row.total() > 0):
+            index = self.createIndex(row.pos, 0, row)
+            self.dataChanged.emit(index, index)
+
+    def _rebuild(self, row, parent_index, count):
+        if row.rows:
+            self.beginRemoveRows(parent_index, 0, len(row.rows) - 1)
+            row.rows = []
+            self.endRemoveRows()
+        count = min(count, row.total())
+        if count:
+            self.beginInsertRows(parent_index, 0, count - 1)
+            row.rows = [_Row(label, node, row, pos)
+                        for pos, (label, node) in enumerate(row.entries(0, count))]
+            self.endInsertRows()
+
+    @staticmethod
+    def _iter_entries(row):
+        start, total = 0, row.total()
+        while start < total:
+            chunk = row.entries(start, start + FETCH_CHUNK)
+            yield from chunk
+            start += len(chunk)
+
+    @staticmethod
+    def _renumber(row, start):
+        rows = row.rows
+        for pos in range(start, len(rows)):
+            rows[pos].pos = pos
+
+    def _row_of(self, index):
+        if not index.isValid():
+            return self._root
+        return index.internalPointer()
+
+    #
+    # QAbstractItemModel
+    #
+    def index(self, row, column, parent=QModelIndex()):
+        parent_row = self._row_of(parent)
+        if column != 0 or row < 0 or row >= len(parent_row.rows):
+            return QModelIndex()
+        return self.createIndex(row, 0, parent_row.rows[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent_row = index.internalPointer().parent
+        if parent_row is None or parent_row is self._root:
+            return QModelIndex()
+        return self.createIndex(parent_row.pos, 0, parent_row)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self._row_of(parent).rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        return self._row_of(parent).total() > 0
+
+    def canFetchMore(self, parent):
+        row = self._row_of(parent)
+        return not row.pinned and len(row.rows) < row.total()
+
+    def fetchMore(self, parent):
+        row = self._row_of(parent)
+        if row.pinned:
+            return
+        start = len(row.rows)
+        stop = min(start + FETCH_CHUNK, row.total())
+        if stop <= start:
+            return
+        self.beginInsertRows(parent, start, stop - 1)
+        self._fetch(row)
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.internalPointer()
+        if role == Qt.DisplayRole:
+            return row.label
+        if role == Qt.DecorationRole:
+            return self._dir_icon if row.node is not None else self._file_icon
+        if role == Qt.ForegroundRole and row.node is not None and row.node.exists:
+            return self._existing_brush
+        if role == Qt.ToolTipRole:
+            return row.node.path if row.node is not None else None
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and section == 0:
+            return "Folders"
+        return None
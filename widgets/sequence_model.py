@@ -0,0 +1,281 @@
+# sequence_model.py
+"""
+Editable two-level model of the sequences and shots typed into the tabs.
+
+One Python string per name instead of a QWidget, a layout, a QLineEdit
+and two buttons per shot: the model is the single source of truth that
+previews and creation read from, and a QTreeView only draws the rows on
+screen. sequences_and_shots() is cached between edits, so a preview
+refresh does not walk the list again.
+
+Invalid names (core.validation) are drawn in red with the reason as
+tooltip. Validation is incremental: an edit only marks its own list
+stale (the sequence names, or the shots of one sequence), which is
+checked again the next time one of its rows is drawn.
+"""
+from PyQt5.QtCore import QAbstractItemModel, QModelIndex, Qt
+from PyQt5.QtGui import QBrush, QColor
+
+from core.validation import MAX_NAME_LENGTH, check_names, validate_sequences
+
+
+class _Sequence(object):
+    # problems: {shot row: message}, None while stale
+    __slots__ = ("name", "shots", "row", "problems")
+
+    def __init__(self, name="", shots=None, row=0):
+        self.name = name
+        self.shots = list(shots) if shots is not None else []
+        self.row = row
+        self.problems = None
+
+
+class SequenceModel(QAbstractItemModel):
+    """
+    Top-level rows are sequences, their children the shot names. Shot
+    indexes carry their _Sequence as internal pointer; sequence indexes
+    carry none.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._sequences = []
+        self._snapshot = None
+        # {sequence row: message}, None while stale
+        self._seq_problems = None
+        self._placeholder_brush = QBrush(QColor(140, 140, 140))
+        self._invalid_brush = QBrush(QColor(220, 60, 60))
+        for signal in (self.dataChanged, self.rowsInserted, self.rowsRemoved, self.modelReset):
+            signal.connect(self._invalidate)
+
+    def _invalidate(self, *args):
+        self._snapshot = None
+
+    #
+    # Data access
+    #
+    def sequences_and_shots(self):
+        """
+        [{'sequence': str, 'shots': [str, ...]}, ...] with names stripped,
+        empty shots dropped and empty sequences left out. Cached until the
+        next edit; treat it as read-only.
+        """
+        if self._snapshot is None:
+            data = []
+            for seq in self._sequences:
+                name = seq.name.strip()
+                shots = [s for s in (sh.strip() for sh in seq.shots) if s]
+                if name or shots:
+                    data.append({'sequence': name, 'shots': shots})
+            self._snapshot = data
+        return self._snapshot
+
+    def issues(self):
+        """
+        Every core.validation.NameIssue of the current list, in one pass.
+        """
+        return validate_sequences(self.sequences_and_shots())
+
+    def problem(self, index):
+        """
+        Why the name at `index` is invalid, or None.
+        """
+        seq = index.internalPointer()
+        if seq is None:
+            if self._seq_problems is None:
+                self._seq_problems = check_names([s.name.strip() for s in self._sequences],
+                                                 allow_repeats=True)
+            return self._seq_problems.get(index.row())
+        if seq.problems is None:
+            seq.problems = check_names([sh.strip() for sh in seq.shots])
+        return seq.problems.get(index.row())
+
+    def _revalidate(self, seq=None):
+        # Mark one list stale and repaint its rows (only visible ones are drawn)
+        if seq is None:
+            self._seq_problems = None
+            parent, count = QModelIndex(), len(self._sequences)
+        else:
+            seq.problems = None
+            parent, count = self.index(seq.row, 0), len(seq.shots)
+        if count:
+            self.dataChanged.emit(self.index(0, 0, parent), self.index(count - 1, 0, parent),
+                                  [Qt.ForegroundRole, Qt.ToolTipRole])
+
+    def set_sequences(self, seq_shots):
+        """
+        Replace everything with the {'sequence', 'shots'} dicts in one reset.
+        """
+        self.beginResetModel()
+        self._sequences = [_Sequence(sd['sequence'], sd['shots'], row)
+                           for row, sd in enumerate(seq_shots)]
+        self._seq_problems = None
+        self.endResetModel()
+
+    def extend_sequences(self, seq_shots):
+        """
+        Append the {'sequence', 'shots'} dicts with a single insert.
+        """
+        if not seq_shots:
+            return
+        first = len(self._sequences)
+        self.beginInsertRows(QModelIndex(), first, first + len(seq_shots) - 1)
+        self._sequences.extend(_Sequence(sd['sequence'], sd['shots'], row)
+                               for row, sd in enumerate(seq_shots, first))
+        self.endInsertRows()
+        self._revalidate()
+
+    def is_sequence(self, index):
+        return index.isValid() and index.internalPointer() is None
+
+    def sequence_index(self, index):
+        """
+        The sequence row of `index` (itself if it is a sequence).
+        """
+        if not index.isValid() or self.is_sequence(index):
+            return index
+        return self.parent(index)
+
+    #
+    # Editing
+    #
+    def insert_sequence(self, row=None, name="", shots=("",)):
+        row = len(self._sequences) if row is None else row
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._sequences.insert(row, _Sequence(name, shots, row))
+        self._renumber(row + 1)
+        self.endInsertRows()
+        if name:
+            self._revalidate()
+        else:
+            self._seq_problems = None
+        return self.index(row, 0)
+
+    def insert_shot(self, seq_index, row=None, name=""):
+        seq = self._sequences[seq_index.row()]
+        row = len(seq.shots) if row is None else row
+        self.beginInsertRows(seq_index, row, row)
+        seq.shots.insert(row, name)
+        self.endInsertRows()
+        if name:
+            self._revalidate(seq)
+        else:
+            seq.problems = None
+        return self.index(row, 0, seq_index)
+
+    def insert_shots(self, seq_index, row, names):
+        """
+        Insert `names` as shots at `row` (None = end) with a single insert.
+        """
+        if not names:
+            return
+        seq = self._sequences[seq_index.row()]
+        row = len(seq.shots) if row is None else row
+        self.beginInsertRows(seq_index, row, row + len(names) - 1)
+        seq.shots[row:row] = names
+        self.endInsertRows()
+        self._revalidate(seq)
+
+    def remove(self, index):
+        if not index.isValid():
+            return
+        row = index.row()
+        seq = index.internalPointer()
+        if seq is None:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._sequences[row]
+            self._renumber(row)
+        else:
+            self.beginRemoveRows(self.index(seq.row, 0), row, row)
+            del seq.shots[row]
+        self.endRemoveRows()
+        self._revalidate(seq)
+
+    def _renumber(self, start):
+        sequences = self._sequences
+        for row in range(start, len(sequences)):
+            sequences[row].row = row
+
+    #
+    # QAbstractItemModel
+    #
+    def index(self, row, column, parent=QModelIndex()):
+        if column != 0 or row < 0:
+            return QModelIndex()
+        if not parent.isValid():
+            if row < len(self._sequences):
+                return self.createIndex(row, 0, None)
+            return QModelIndex()
+        if parent.internalPointer() is not None:
+            return QModelIndex()
+        seq = self._sequences[parent.row()]
+        if row < len(seq.shots):
+            return self.createIndex(row, 0, seq)
+        return QModelIndex()
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        seq = index.internalPointer()
+        if seq is None:
+            return QModelIndex()
+        return self.createIndex(seq.row, 0, None)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._sequences)
+        if parent.column() > 0 or parent.internalPointer() is not None:
+            return 0
+        return len(self._sequences[parent.row()].shots)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def _name(self, index):
+        seq = index.internalPointer()
+        if seq is None:
+            return self._sequences[index.row()].name
+        return seq.shots[index.row()]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.EditRole:
+            return self._name(index)
+        if role == Qt.DisplayRole:
+            name = self._name(index)
+            if name:
+                return name
+            return "Sequence Name" if self.is_sequence(index) else "Shot Name"
+        if role == Qt.ForegroundRole:
+            if not self._name(index):
+                return self._placeholder_brush
+            if self.problem(index):
+                return self._invalid_brush
+        if role == Qt.ToolTipRole:
+            return self.problem(index)
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        value = str(value)[:MAX_NAME_LENGTH]
+        if value == self._name(index):
+            return False
+        seq = index.internalPointer()
+        if seq is None:
+            self._sequences[index.row()].name = value
+        else:
+            seq.shots[index.row()] = value
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        self._revalidate(seq)
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and section == 0:
+            return "Sequences / Shots"
+        return None
@@ -1,162 +1,232 @@
-from PyQt5.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLineEdit, QPushButton, QFrame
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import (
+    QWidget, QHBoxLayout, QVBoxLayout, QLineEdit, QPushButton, QTreeView, QStyledItemDelegate,
+    QAbstractItemView, QShortcut, QFileDialog, QMessageBox, QInputDialog, QApplication
+)
+from PyQt5.QtGui import QKeySequence
+from PyQt5.QtCore import Qt, pyqtSignal
+from core.shotlist import (
+    read_shot_list, group_shots, iter_pattern_shots, iter_pasted_shots, is_shot_pattern
+)
+from widgets.sequence_model import SequenceModel
+from core.validation import MAX_NAME_LENGTH
 
-class ShotWidget(QWidget):
-    def __init__(self, parent_sequence_widget):
-        super().__init__()
-        self.parent_sequence_widget = parent_sequence_widget
-        
-        lay = QHBoxLayout()
-        lay.setSpacing(0)
-        lay.setContentsMargins(0,0,0,0)
-        
-        self.shot_name_edit = QLineEdit()
-        self.shot_name_edit.setPlaceholderText("Shot Name (max 25 chars)")
-        self.shot_name_edit.setMaxLength(25)
-        
-        self.btn_remove_shot = QPushButton("-")
-        self.btn_add_shot = QPushButton("+")
-        self.btn_remove_shot.setFixedWidth(25)
-        self.btn_add_shot.setFixedWidth(25)
-        
-        lay.addWidget(self.shot_name_edit)
-        lay.addWidget(self.btn_remove_shot)
-        lay.addWidget(self.btn_add_shot)
-        
-        self.setLayout(lay)
-        
-        # Connect signals
-        self.btn_remove_shot.clicked.connect(self.remove_self)
-        self.btn_add_shot.clicked.connect(self.add_shot_below)
-        self.shot_name_edit.textChanged.connect(
-            self.parent_sequence_widget.parent_main_window.update_preview
-        )
-    
-    def remove_self(self):
-        self.parent_sequence_widget.remove_shot(self)
-        self.parent_sequence_widget.parent_main_window.update_preview()
-    
-    def add_shot_below(self):
-        self.parent_sequence_widget.add_shot(after_shot_widget=self)
-        self.parent_sequence_widget.parent_main_window.update_preview()
-    
-    def get_shot_name(self):
-        return self.shot_name_edit.text().strip()
-
-class SequenceWidget(QWidget):
-    def __init__(self, parent_main_window, sequence_list_container):
-        super().__init__()
-        self.parent_main_window = parent_main_window
-        self.sequence_list_container = sequence_list_container
-        
-        self.main_layout = QVBoxLayout()
-        self.main_layout.setSpacing(0)
-        self.main_layout.setContentsMargins(0,0,0,0)
-        
-        self.header_layout = QHBoxLayout()
-        self.header_layout.setSpacing(0)
-        self.header_layout.setContentsMargins(0,0,0,0)
-        
-        self.sequence_name_edit = QLineEdit()
-        self.sequence_name_edit.setPlaceholderText("Sequence Name (max 25 chars)")
-        self.sequence_name_edit.setMaxLength(25)
-        
-        self.btn_remove_sequence = QPushButton("-")
-        self.btn_add_sequence = QPushButton("+")
-        self.btn_remove_sequence.setFixedWidth(25)
-        self.btn_add_sequence.setFixedWidth(25)
-        
-        self.header_layout.addWidget(self.sequence_name_edit)
-        self.header_layout.addWidget(self.btn_remove_sequence)
-        self.header_layout.addWidget(self.btn_add_sequence)
-        
-        self.shots_layout = QVBoxLayout()
-        self.shots_layout.setSpacing(0)
-        self.shots_layout.setContentsMargins(16,0,0,0)
-        
-        self.main_layout.addLayout(self.header_layout)
-        self.main_layout.addLayout(self.shots_layout)
-        
-        sep = QFrame()
-        sep.setFrameShape(QFrame.HLine)
-        sep.setFrameShadow(QFrame.Sunken)
-        self.main_layout.addWidget(sep)
-        
-        self.setLayout(self.main_layout)
-        
-        # Connect signals
-        self.btn_remove_sequence.clicked.connect(self.remove_self)
-        self.btn_add_sequence.clicked.connect(self.add_new_sequence_below)
-        self.sequence_name_edit.textChanged.connect(self.parent_main_window.update_preview)
-        
-        # Start with one shot
-        self.add_shot()
-    
-    def remove_self(self):
-        self.sequence_list_container.remove_sequence(self)
-        self.parent_main_window.update_preview()
-    
-    def add_new_sequence_below(self):
-        self.sequence_list_container.add_sequence(after_sequence_widget=self)
-        self.parent_main_window.update_preview()
-    
-    def add_shot(self, after_shot_widget=None):
-        s = ShotWidget(self)
-        if not after_shot_widget:
-            self.shots_layout.addWidget(s)
-        else:
-            idx = self.shots_layout.indexOf(after_shot_widget) + 1
-            self.shots_layout.insertWidget(idx, s)
-        return s
-    
-    def remove_shot(self, shot_widget):
-        shot_widget.setParent(None)
-    
-    def get_sequence_name(self):
-        return self.sequence_name_edit.text().strip()
-    
-    def get_shot_names(self):
-        results = []
-        for i in range(self.shots_layout.count()):
-            item = self.shots_layout.itemAt(i)
-            w = item.widget()
-            if isinstance(w, ShotWidget):
-                nm = w.get_shot_name()
-                if nm:
-                    results.append(nm)
-        return results
+SHOT_LIST_FILTER = "Shot lists (*.csv *.edl *.xml *.fcpxml);;All files (*)"
+
+class _NameEdit(QLineEdit):
+    """
+    Line edit that hands a multi-line or pattern paste to `bulk_paste`
+    instead of squeezing it into one name.
+    """
+    bulk_paste = pyqtSignal(str)
+
+    def keyPressEvent(self, event):
+        if event.matches(QKeySequence.Paste):
+            text = QApplication.clipboard().text()
+            if is_shot_pattern(text):
+                self.bulk_paste.emit(text)
+                return
+        super().keyPressEvent(event)
+
+class NameDelegate(QStyledItemDelegate):
+    """
+    QLineEdit editor limited to MAX_NAME_LENGTH characters. Every edit is
+    committed as it is typed, so the preview follows the keystrokes like
+    it did with one QLineEdit per shot. A multi-line/pattern paste closes
+    the editor and is re-emitted as bulk_paste(text).
+    """
+    bulk_paste = pyqtSignal(str)
+
+    def createEditor(self, parent, option, index):
+        editor = _NameEdit(parent)
+        editor.setMaxLength(MAX_NAME_LENGTH)
+        is_seq = index.model().is_sequence(index)
+        editor.setPlaceholderText(f"{'Sequence' if is_seq else 'Shot'} Name (max {MAX_NAME_LENGTH} chars)")
+        editor.textEdited.connect(lambda _text, ed=editor: self.commitData.emit(ed))
+        editor.bulk_paste.connect(lambda text, ed=editor: self._bulk_paste(ed, text))
+        return editor
+
+    def _bulk_paste(self, editor, text):
+        self.closeEditor.emit(editor, QStyledItemDelegate.NoHint)
+        self.bulk_paste.emit(text)
 
 class SequenceListContainer(QWidget):
+    """
+    Sequences and their shots in a SequenceModel, edited in a QTreeView
+    (double-click or F2 to rename, Delete to remove). Previews and
+    creation read get_all_sequences_and_shots(), straight from the model.
+
+    "Generate..." expands a range pattern (core.shotlist) and pasting
+    several lines or a pattern adds all the shots it stands for; either
+    way the rows go in as one batch.
+    """
     def __init__(self, parent_main_window):
         super().__init__()
         self.parent_main_window = parent_main_window
-        
+
         lay = QVBoxLayout()
-        lay.setSpacing(0)
+        lay.setSpacing(4)
         lay.setContentsMargins(0,0,0,0)
         self.setLayout(lay)
-    
-    def add_sequence(self, after_sequence_widget=None):
-        seq_widget = SequenceWidget(self.parent_main_window, self)
-        if after_sequence_widget:
-            idx = self.layout().indexOf(after_sequence_widget) + 1
-            self.layout().insertWidget(idx, seq_widget)
-        else:
-            self.layout().addWidget(seq_widget)
-        return seq_widget
-    
-    def remove_sequence(self, seq_widget):
-        seq_widget.setParent(None)
-    
+
+        self.model = SequenceModel(self)
+        self.view = QTreeView()
+        self.view.setModel(self.model)
+        self.delegate = NameDelegate(self.view)
+        self.view.setItemDelegate(self.delegate)
+        self.view.setHeaderHidden(True)
+        self.view.setUniformRowHeights(True)
+        self.view.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.view.setEditTriggers(
+            QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed
+            | QAbstractItemView.AnyKeyPressed
+        )
+        lay.addWidget(self.view)
+
+        btn_row = QHBoxLayout()
+        btn_row.setSpacing(4)
+        self.btn_add_sequence = QPushButton("+ Sequence")
+        self.btn_add_shot = QPushButton("+ Shot")
+        self.btn_generate = QPushButton("Generate...")
+        self.btn_generate.setToolTip('Add shots from a pattern, e.g. "SQ[010-200:10]/sh[0010-0500:10]"')
+        self.btn_remove = QPushButton("-")
+        self.btn_remove.setFixedWidth(25)
+        btn_row.addWidget(self.btn_add_sequence)
+        btn_row.addWidget(self.btn_add_shot)
+        btn_row.addWidget(self.btn_generate)
+        btn_row.addWidget(self.btn_remove)
+        lay.addLayout(btn_row)
+
+        # Connect signals
+        self.btn_add_sequence.clicked.connect(self.on_add_sequence)
+        self.btn_add_shot.clicked.connect(self.on_add_shot)
+        self.btn_generate.clicked.connect(self.on_generate)
+        self.btn_remove.clicked.connect(self.remove_selected)
+        self.delegate.bulk_paste.connect(self.paste_shots)
+        remove_shortcut = QShortcut(QKeySequence.Delete, self.view, self.remove_selected)
+        remove_shortcut.setContext(Qt.WidgetShortcut)
+        paste_shortcut = QShortcut(QKeySequence.Paste, self.view,
+                                   lambda: self.paste_shots(QApplication.clipboard().text()))
+        paste_shortcut.setContext(Qt.WidgetShortcut)
+
+        # Any change in the model => one (debounced) preview refresh
+        for signal in (self.model.dataChanged, self.model.rowsInserted,
+                       self.model.rowsRemoved, self.model.modelReset):
+            signal.connect(self.parent_main_window.update_preview)
+
+    def add_sequence(self, name="", shots=("",)):
+        index = self.model.insert_sequence(name=name, shots=shots)
+        self.view.expand(index)
+        return index
+
+    def on_add_sequence(self):
+        # New sequence below the current one, with its name open for editing
+        current = self.model.sequence_index(self.view.currentIndex())
+        row = current.row() + 1 if current.isValid() else None
+        index = self.model.insert_sequence(row)
+        self.view.expand(index)
+        self.view.setCurrentIndex(index)
+        self.view.edit(index)
+
+    def on_add_shot(self):
+        # New shot below the current shot (or at the end of the current sequence)
+        current = self.view.currentIndex()
+        seq_index = self.model.sequence_index(current)
+        if not seq_index.isValid():
+            if not self.model.rowCount():
+                self.on_add_sequence()
+                return
+            seq_index = self.model.index(self.model.rowCount() - 1, 0)
+        row = current.row() + 1 if current.isValid() and current != seq_index else None
+        index = self.model.insert_shot(seq_index, row)
+        self.view.expand(seq_index)
+        self.view.setCurrentIndex(index)
+        self.view.edit(index)
+
+    def remove_selected(self):
+        self.model.remove(self.view.currentIndex())
+
+    def clear(self):
+        self.model.set_sequences([])
+
     def get_all_sequences_and_shots(self):
-        data = []
-        for i in range(self.layout().count()):
-            item = self.layout().itemAt(i)
-            w = item.widget()
-            if isinstance(w, SequenceWidget):
-                s = w.get_sequence_name()
-                shots = w.get_shot_names()
-                # Append the entry if there is a sequence name or if there are shots.
-                if s or shots:
-                    data.append({'sequence': s, 'shots': shots})
-        return data
+        return self.model.sequences_and_shots()
+
+    def load_sequences(self, seq_shots, replace=False):
+        """
+        Add the {'sequence', 'shots'} dicts of `seq_shots` in one go (e.g. an
+        imported shot list). With replace=True, or when the list holds
+        nothing yet, the current rows are dropped first. The model is
+        reset (or extended) once, so the preview is refreshed once.
+        """
+        if replace or not self.get_all_sequences_and_shots():
+            first = 0
+            self.model.set_sequences(seq_shots or [{'sequence': "", 'shots': [""]}])
+        else:
+            first = self.model.rowCount()
+            self.model.extend_sequences(seq_shots)
+        for row in range(first, self.model.rowCount()):
+            self.view.expand(self.model.index(row, 0))
+
+    def add_pairs(self, pairs):
+        """
+        Add (sequence, shot) pairs as one batch: pairs without a sequence
+        become shots after the current row of the current sequence, the
+        rest are appended as sequences (see load_sequences()).
+        """
+        loose = [shot for seq, shot in pairs if not seq and shot]
+        grouped = group_shots((seq, shot) for seq, shot in pairs if seq)
+        if loose:
+            current = self.view.currentIndex()
+            seq_index = self.model.sequence_index(current)
+            if not seq_index.isValid():
+                if not self.model.rowCount():
+                    self.model.insert_sequence(shots=())
+                seq_index = self.model.index(self.model.rowCount() - 1, 0)
+            row = current.row() + 1 if current.isValid() and current != seq_index else None
+            # An empty shot row being pasted into is replaced
+            if row is not None and not self.model.data(current, Qt.EditRole):
+                row -= 1
+                self.model.remove(current)
+            self.model.insert_shots(seq_index, row, loose)
+            self.view.expand(seq_index)
+        if grouped:
+            self.load_sequences(grouped)
+
+    def paste_shots(self, text):
+        try:
+            pairs = list(iter_pasted_shots(text))
+        except ValueError as e:
+            QMessageBox.warning(self, "Paste Shots", str(e))
+            return
+        self.add_pairs(pairs)
+
+    def on_generate(self):
+        pattern, ok = QInputDialog.getText(
+            self, "Generate Shots",
+            "Pattern: SEQUENCE/SHOT, [start-end:step] ranges, e.g. SQ[010-200:10]/sh[0010-0500:10]"
+        )
+        if not ok or not pattern.strip():
+            return
+        try:
+            pairs = list(iter_pattern_shots(pattern))
+        except ValueError as e:
+            QMessageBox.warning(self, "Generate Shots", str(e))
+            return
+        self.add_pairs(pairs)
+
+    def import_shot_list(self):
+        """
+        Ask for a CSV/EDL/FCP XML file and load its sequences and shots.
+        """
+        path, _ = QFileDialog.getOpenFileName(self, "Import Shot List", "", SHOT_LIST_FILTER)
+        if not path:
+            return
+        try:
+            seq_shots = read_shot_list(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Import Shot List", str(e))
+            return
+        if not seq_shots:
+            QMessageBox.information(self, "Import Shot List", "No shots found in this file.")
+            return
+        self.load_sequences(seq_shots)